@@ -0,0 +1,77 @@
+"""
+Gunicorn configuration for production (Dockerfile, Procfile, k8s).
+
+Runs several uvicorn workers per container so a CPU-bound request (bcrypt,
+large responses) only stalls one worker:
+
+    gunicorn src.main:app          # picks up this file from the working directory
+
+- Workers: WEB_CONCURRENCY, or derived from the container CPU limit
+  (src/lifecycle.py)
+- preload_app: the app (and the agent stack) is imported once in the
+  master and shared copy-on-write; per-process state is reset after fork
+- max_requests + jitter: workers are recycled periodically, staggered, to
+  contain slow memory leaks
+- Graceful drain: on SIGTERM workers stop accepting connections and get
+  GRACEFUL_TIMEOUT seconds to finish in-flight requests. Keep the pod's
+  terminationGracePeriodSeconds above it.
+
+For local development keep using `uvicorn src.main:app --reload`.
+"""
+
+import os
+import shutil
+import tempfile
+
+# Metrics from all workers are aggregated on /metrics (todo_observability.metrics).
+# Must be set up before the app (preloaded below) imports prometheus_client;
+# stale files from a previous run would be summed into /metrics.
+os.environ.setdefault(
+    "PROMETHEUS_MULTIPROC_DIR", os.path.join(tempfile.gettempdir(), "prometheus-multiproc")
+)
+shutil.rmtree(os.environ["PROMETHEUS_MULTIPROC_DIR"], ignore_errors=True)
+os.makedirs(os.environ["PROMETHEUS_MULTIPROC_DIR"], exist_ok=True)
+
+from src import lifecycle  # noqa: E402
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+worker_class = "uvicorn_worker.UvicornWorker"
+workers = lifecycle.default_worker_count()
+preload_app = True
+
+# Recycle each worker after ~N requests (jitter avoids restarting all at once)
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "2000"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "200"))
+
+# Seconds a worker may stay silent before being killed and restarted
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
+graceful_timeout = int(os.getenv("GRACEFUL_TIMEOUT", "30"))
+# Above the load balancer's idle timeout, so it never reuses a closed connection
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "75"))
+
+# Heartbeat files in memory (the root filesystem may be read-only)
+worker_tmp_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+# No control socket under $HOME (gunicorn 26+), same reason
+control_socket_disable = True
+
+accesslog = "-"
+loglevel = os.getenv("LOG_LEVEL", "info")
+
+
+def when_ready(server):
+    # The app is loaded in the master (preload_app); import the agent stack
+    # too, so workers inherit it instead of each importing it
+    from src import main
+
+    if main.AGENT_PRELOAD:
+        main._preload_agent_stack()
+
+
+def post_fork(server, worker):
+    lifecycle.reset_after_fork()
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
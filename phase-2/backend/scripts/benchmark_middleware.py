@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Middleware Overhead Benchmark
+
+Measures the per-request cost of the HTTP middleware stack
+(HTTPSRedirect + SecurityHeaders + CORS, in src/main.py order) by
+replaying the request mix of load_test.py (the locust profile) directly
+against ASGI apps in-process, without a network or database:
+
+- bare:   the routes without middleware (reference)
+- before: BaseHTTPMiddleware implementations (previous src/main.py,
+          including its per-request INFO logging)
+- after:  pure ASGI implementations from src/middleware.py
+
+Overhead is the difference to the bare app. Log output of the "before"
+stack goes to os.devnull, so formatting and handler cost is included
+but the terminal is not flooded.
+
+Usage:
+    cd phase-2/backend
+    python scripts/benchmark_middleware.py --requests 20000
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from starlette.applications import Starlette  # noqa: E402
+from starlette.middleware import Middleware  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+from starlette.middleware.cors import CORSMiddleware  # noqa: E402
+from starlette.requests import Request  # noqa: E402
+from starlette.responses import JSONResponse, Response  # noqa: E402
+from starlette.routing import Route  # noqa: E402
+
+from src.middleware import HTTPSRedirectMiddleware, SecurityHeadersMiddleware  # noqa: E402
+
+logger = logging.getLogger("benchmark.before")
+
+TASK = {
+    "id": "650e8400-e29b-41d4-a716-446655440001",
+    "title": "Complete project documentation",
+    "description": "Write comprehensive README and API docs",
+    "is_complete": False,
+    "priority": 2,
+    "due_date": None,
+    "user_id": "550e8400-e29b-41d4-a716-446655440000",
+    "created_at": "2025-12-07T16:00:00",
+    "updated_at": "2025-12-07T16:00:00",
+    "tags": [],
+}
+
+# (weight, method, path) as in load_test.py's @task weights
+PROFILE = [
+    (5, "GET", "/api/tasks"),
+    (3, "POST", "/api/tasks"),
+    (2, "PATCH", f"/api/tasks/{TASK['id']}/complete"),
+    (1, "GET", f"/api/tasks/{TASK['id']}"),
+    (1, "PUT", f"/api/tasks/{TASK['id']}"),
+    (1, "DELETE", f"/api/tasks/{TASK['id']}"),
+]
+
+ORIGIN = "http://localhost:3000"
+
+
+# ================== BEFORE: BaseHTTPMiddleware ==================
+
+
+class BaseHTTPSRedirectMiddleware(BaseHTTPMiddleware):
+    """HTTPSRedirectMiddleware as previously defined in src/main.py."""
+
+    async def dispatch(self, request: Request, call_next):
+        response = await call_next(request)
+
+        logger.info(f"HTTPSRedirectMiddleware: {request.method} {request.url.path} → {response.status_code}")
+
+        if response.status_code in (301, 302, 303, 307, 308):
+            location = response.headers.get("location", "")
+            logger.info(f"Redirect detected! Location header: {location}")
+            if location.startswith("http://"):
+                fixed_location = location.replace("http://", "https://", 1)
+                response.headers["location"] = fixed_location
+                logger.info(f"✅ Fixed redirect: {location} → {fixed_location}")
+            else:
+                logger.info(f"⚠️ Location already HTTPS or empty: {location}")
+
+        return response
+
+
+class BaseSecurityHeadersMiddleware(BaseHTTPMiddleware):
+    """SecurityHeadersMiddleware as previously defined in src/main.py."""
+
+    async def dispatch(self, request: Request, call_next):
+        response = await call_next(request)
+        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
+        response.headers["X-Content-Type-Options"] = "nosniff"
+        response.headers["X-Frame-Options"] = "DENY"
+        response.headers["Content-Security-Policy"] = "default-src 'self'; frame-ancestors 'none'"
+        response.headers["X-XSS-Protection"] = "1; mode=block"
+        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+        return response
+
+
+# ================== APPS ==================
+
+
+async def list_tasks(request: Request):
+    return JSONResponse([TASK] * 20)
+
+
+async def create_task(request: Request):
+    await request.body()
+    return JSONResponse(TASK, status_code=201)
+
+
+async def task_detail(request: Request):
+    if request.method == "DELETE":
+        return Response(status_code=204)
+    await request.body()
+    return JSONResponse(TASK)
+
+
+def build_app(middleware_classes) -> Starlette:
+    """Routes of the profile wrapped in middleware (outermost last, like add_middleware)."""
+    cors = Middleware(
+        CORSMiddleware,
+        allow_origins=[ORIGIN],
+        allow_credentials=True,
+        allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+        allow_headers=["*"],
+    )
+    middleware = [cors] + [Middleware(cls) for cls in middleware_classes] if middleware_classes else []
+    return Starlette(
+        routes=[
+            Route("/api/tasks", list_tasks, methods=["GET"]),
+            Route("/api/tasks", create_task, methods=["POST"]),
+            Route("/api/tasks/{task_id}/complete", task_detail, methods=["PATCH"]),
+            Route("/api/tasks/{task_id}", task_detail, methods=["GET", "PUT", "DELETE"]),
+        ],
+        middleware=middleware,
+    )
+
+
+# ================== DRIVER ==================
+
+
+def make_scope(method: str, path: str) -> dict:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [
+            (b"host", b"localhost:8000"),
+            (b"origin", ORIGIN.encode()),
+            (b"cookie", b"auth_token=eyJhbGciOiJIUzI1NiJ9.e30.x"),
+            (b"content-type", b"application/json"),
+        ],
+        "client": ("127.0.0.1", 50000),
+        "server": ("localhost", 8000),
+    }
+
+
+async def request_once(app, method: str, path: str) -> float:
+    body = b'{"title": "Load test task"}' if method in ("POST", "PUT", "PATCH") else b""
+    received = False
+
+    async def receive():
+        nonlocal received
+        if received:
+            await asyncio.sleep(3600)  # never disconnect during the request
+        received = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        pass
+
+    start = time.perf_counter()
+    await app(make_scope(method, path), receive, send)
+    return time.perf_counter() - start
+
+
+async def run(app, requests: int):
+    mix = [(method, path) for weight, method, path in PROFILE for _ in range(weight)]
+    for method, path in mix * 20:  # warm-up
+        await request_once(app, method, path)
+    return [
+        await request_once(app, *mix[i % len(mix)])
+        for i in range(requests)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HTTP middleware overhead")
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--rounds", type=int, default=3, help="Interleaved rounds per variant")
+    args = parser.parse_args()
+
+    devnull = open(os.devnull, "w")
+    handler = logging.StreamHandler(devnull)
+    handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    variants = {
+        "bare": build_app(None),
+        "before": build_app([BaseHTTPSRedirectMiddleware, BaseSecurityHeadersMiddleware]),
+        "after": build_app([HTTPSRedirectMiddleware, SecurityHeadersMiddleware]),
+    }
+    timings = {name: [] for name in variants}
+    for _ in range(args.rounds):
+        for name, app in variants.items():
+            timings[name].extend(asyncio.run(run(app, args.requests)))
+
+    bare = statistics.median(timings["bare"])
+    print(f"{'variant':<8} {'median µs':>10} {'p95 µs':>10} {'overhead µs':>12}")
+    for name, samples in timings.items():
+        samples.sort()
+        median = statistics.median(samples)
+        p95 = samples[int(len(samples) * 0.95)]
+        print(f"{name:<8} {median * 1e6:>10.1f} {p95 * 1e6:>10.1f} {(median - bare) * 1e6:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Connection Checkout Benchmark
+
+Measures what pre-ping costs per request. Each iteration does what one API
+request does: check out a pooled connection, run one indexed query, and
+return the connection. The variants are:
+
+- pre-ping: the direct connection settings (pool_pre_ping=True, a
+  SELECT 1 round trip on every checkout)
+- pooler:   pooler mode from src/db/session.py (no pre-ping; only
+  connections idle for DB_PING_IDLE_SECONDS are pinged)
+
+The difference between the two is one network round trip per request.
+With Neon in the same region that is roughly 1-3 ms, and tens of ms
+across regions. Against a local database it looks negligible, so
+--rtt-ms routes the connections through an in-process TCP proxy that
+delays every packet, to show the effect at realistic latency (use it
+with a local PostgreSQL; TLS endpoints such as Neon need their real
+host name).
+
+Usage:
+    cd phase-2/backend
+    DATABASE_URL=postgresql://postgres@localhost/todo \
+        python scripts/benchmark_pool.py --requests 2000 --rtt-ms 2
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import socket
+import statistics
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import text  # noqa: E402
+from sqlalchemy.engine import make_url  # noqa: E402
+
+from src.db import session  # noqa: E402
+
+
+def start_delay_proxy(host: str, port: int, rtt: float) -> int:
+    """Forward a local port to host:port, delaying each chunk by half the RTT per direction."""
+    loop = asyncio.new_event_loop()
+    listener = socket.create_server(("127.0.0.1", 0))
+
+    async def pump(reader, writer):
+        try:
+            while data := await reader.read(65536):
+                await asyncio.sleep(rtt / 2)
+                writer.write(data)
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def handle(client_reader, client_writer):
+        upstream_reader, upstream_writer = await asyncio.open_connection(host, port)
+        await asyncio.gather(
+            pump(client_reader, upstream_writer),
+            pump(upstream_reader, client_writer),
+            return_exceptions=True,
+        )
+
+    async def serve():
+        server = await asyncio.start_server(handle, sock=listener)
+        await server.serve_forever()
+
+    threading.Thread(target=loop.run_until_complete, args=(serve(),), daemon=True).start()
+    return listener.getsockname()[1]
+
+
+def run(engine, requests: int) -> list:
+    query = text("SELECT id FROM users LIMIT 1")
+    with engine.connect() as connection:  # warm up: open the pooled connection
+        connection.execute(query)
+    timings = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        with engine.connect() as connection:
+            connection.execute(query).all()
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pre-ping vs pooler mode checkouts")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=3, help="Interleaved rounds per variant")
+    parser.add_argument("--rtt-ms", type=float, default=0, help="Simulated network round trip")
+    args = parser.parse_args()
+
+    logging.getLogger("src.db.session").setLevel(logging.WARNING)
+    url = make_url(session.get_database_url())
+    if args.rtt_ms:
+        proxy_port = start_delay_proxy(url.host or "localhost", url.port or 5432, args.rtt_ms / 1000)
+        url = url.set(host="127.0.0.1", port=proxy_port)
+    url = url.render_as_string(hide_password=False)
+
+    engines = {}
+    for name, pooler in (("pre-ping", "false"), ("pooler", "true")):
+        session.DATABASE_POOLER = pooler
+        engines[name] = session._create_engine(url, name)
+
+    timings = {name: [] for name in engines}
+    for _ in range(args.rounds):
+        for name, engine in engines.items():
+            timings[name].extend(run(engine, args.requests))
+
+    baseline = statistics.median(timings["pre-ping"])
+    print(f"{'variant':<9} {'median ms':>10} {'p95 ms':>8} {'saved ms':>9}")
+    for name, samples in timings.items():
+        samples.sort()
+        median = statistics.median(samples)
+        p95 = samples[int(len(samples) * 0.95)]
+        print(f"{name:<9} {median * 1e3:>10.2f} {p95 * 1e3:>8.2f} {(baseline - median) * 1e3:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Response Serialization Benchmark
+
+Measures CPU time to turn a large task list (1,000 tasks with tags, as
+loaded from the database) into a JSON response body, in-process and
+without a database:
+
+- stdlib:    FastAPI's response_model path (validate + serialize to
+             Python objects) rendered with json.dumps (previous default)
+- orjson:    the same path rendered with src.serialization.JSONResponse
+             (the app's default_response_class)
+- validated: src.serialization.model_response (one TypeAdapter pass that
+             validates and writes JSON, used by the list endpoints)
+
+Also compares event encoding (TaskEvent payloads as sent by the Kafka
+producer and the Dapr client) with json.dumps and src.serialization.dumps.
+
+Usage:
+    cd phase-2/backend
+    python scripts/benchmark_serialization.py --tasks 1000
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from fastapi.routing import APIRoute, serialize_response  # noqa: E402
+from starlette.responses import JSONResponse as StdlibJSONResponse  # noqa: E402
+
+from src import serialization  # noqa: E402
+from src.events.event_schemas import TaskEvent  # noqa: E402
+from src.models.tag import Tag  # noqa: E402
+from src.models.task import Task, TaskResponse  # noqa: E402
+
+USER_ID = "550e8400-e29b-41d4-a716-446655440000"
+
+
+def make_tasks(count: int) -> List[Task]:
+    """Task rows with two tags each, like get_user_tasks() returns them."""
+    now = datetime(2025, 12, 7, 16, 0, 0)
+    tags = [
+        Tag(id=f"750e8400-e29b-41d4-a716-44665544{i:04d}", name=f"tag-{i}", color="#3b82f6", user_id=USER_ID)
+        for i in range(10)
+    ]
+    tasks = []
+    for i in range(count):
+        task = Task(
+            id=f"650e8400-e29b-41d4-a716-4466{i:08d}",
+            title=f"Task {i}: complete project documentation",
+            description="Write comprehensive README and API docs",
+            is_complete=bool(i % 3 == 0),
+            priority=i % 3 + 1,
+            due_date=now + timedelta(days=i % 30),
+            user_id=USER_ID,
+            created_at=now,
+            updated_at=now + timedelta(minutes=i),
+            change_seq=i,
+        )
+        task.tags = [tags[i % 10], tags[(i + 1) % 10]]
+        tasks.append(task)
+    return tasks
+
+
+async def list_tasks():
+    """Stand-in endpoint; only its response_model matters."""
+
+
+def run_sync(coroutine):
+    """Run a coroutine that never suspends (no event loop overhead in samples)."""
+    try:
+        coroutine.send(None)
+    except StopIteration as stop:
+        return stop.value
+    raise RuntimeError("coroutine suspended")
+
+
+def cpu_time(fn, repeat: int) -> List[float]:
+    """CPU seconds per call of fn, one sample per repetition."""
+    fn()  # warm-up (builds cached serializers)
+    samples = []
+    for _ in range(repeat):
+        start = time.process_time()
+        fn()
+        samples.append(time.process_time() - start)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JSON response serialization")
+    parser.add_argument("--tasks", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    if serialization.orjson is None:
+        print("warning: orjson is not installed; src.serialization uses stdlib json")
+
+    tasks = make_tasks(args.tasks)
+    field = APIRoute("/api/tasks", list_tasks, response_model=List[TaskResponse]).response_field
+
+    def response_model_path(response_class):
+        content = run_sync(serialize_response(field=field, response_content=tasks))
+        return response_class(content).body
+
+    def validated_path():
+        return serialization.model_response(tasks, List[TaskResponse]).body
+
+    bodies = {
+        "stdlib": lambda: response_model_path(StdlibJSONResponse),
+        "orjson": lambda: response_model_path(serialization.JSONResponse),
+        "validated": validated_path,
+    }
+    decoded = {name: json.loads(body()) for name, body in bodies.items()}
+    assert decoded["stdlib"] == decoded["orjson"] == decoded["validated"], "bodies differ"
+
+    events = [
+        TaskEvent(
+            event_type="task.updated",
+            task_id=task.id,
+            task_data=TaskResponse.model_validate(task).model_dump(mode="json"),
+            user_id=USER_ID,
+        ).to_dict()
+        for task in tasks
+    ]
+    encoders = {
+        "stdlib": lambda: [json.dumps(event).encode("utf-8") for event in events],
+        "orjson": lambda: [serialization.dumps(event) for event in events],
+    }
+
+    print(f"{args.tasks} tasks, {len(bodies['stdlib']())} byte body, CPU ms per response")
+    print(f"{'variant':<10} {'median':>8} {'min':>8}")
+    for name, body in bodies.items():
+        samples = cpu_time(body, args.repeat)
+        print(f"{name:<10} {statistics.median(samples) * 1e3:>8.2f} {min(samples) * 1e3:>8.2f}")
+
+    print(f"\n{args.tasks} task events, CPU ms per batch")
+    for name, encode in encoders.items():
+        samples = cpu_time(encode, args.repeat)
+        print(f"{name:<10} {statistics.median(samples) * 1e3:>8.2f} {min(samples) * 1e3:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
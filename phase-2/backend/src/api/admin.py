@@ -0,0 +1,44 @@
+"""
+Admin API Endpoints
+
+Operational endpoints for profiling admins (see src/profiling.py).
+Only mounted when PROFILING_ENABLED=true.
+"""
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import Response
+
+from src.models.user import User
+from src.profiling import (
+    MAX_WORKER_PROFILE_SECONDS,
+    profile_worker,
+    require_profiling_admin,
+)
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+@router.get(
+    "/profile",
+    summary="Profile Worker",
+    description="Samples every thread of the worker serving this request and returns a speedscope profile",
+    response_class=Response,
+)
+async def get_worker_profile(
+    seconds: float = Query(5, gt=0, le=MAX_WORKER_PROFILE_SECONDS, description="Sampling duration"),
+    _admin: User = Depends(require_profiling_admin),
+) -> Response:
+    """
+    Capture a sampled stack profile of the whole worker.
+
+    Only the worker handling this request is profiled; with several
+    workers, repeat the call to reach the others.
+
+    Returns:
+        Speedscope JSON file (https://www.speedscope.app)
+
+    Raises:
+        HTTPException 401/403: If the caller is not a profiling admin
+        HTTPException 409: If a worker profile is already running
+    """
+    return await profile_worker(seconds)
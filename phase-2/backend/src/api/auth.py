@@ -5,6 +5,7 @@ Thin controllers for user authentication (signup, login, logout).
 Proxies authentication requests to Better Auth server and validates JWT tokens.
 """
 
+import logging
 import os
 import httpx
 from fastapi import APIRouter, Depends, Response, Request, HTTPException
@@ -28,7 +29,7 @@ limiter = Limiter(key_func=get_remote_address)
 # CRITICAL: Must be set in Railway environment variables
 # Default to localhost for local development only
 AUTH_SERVER_URL = os.getenv("AUTH_SERVER_URL", "http://localhost:3001")
-print(f"🔗 Backend using AUTH_SERVER_URL: {AUTH_SERVER_URL}")  # Debug log
+logging.getLogger(__name__).debug(f"Backend using AUTH_SERVER_URL: {AUTH_SERVER_URL}")
 
 
 @router.post(
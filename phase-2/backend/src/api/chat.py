@@ -11,7 +11,10 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import func
 from sqlmodel import Session, select
 
+from src import serialization
 from src.auth.dependencies import get_current_user
+from src.db.query_stats import query_budget
+from src.db.replica import replica_read
 from src.db.session import get_session
 from src.models.conversation import (
     Conversation,
@@ -22,7 +25,6 @@ from src.models.conversation import (
     MessageResponse,
 )
 from src.models.user import User
-from src.services.agent_service import AgentService
 
 router = APIRouter(prefix="/api/chat", tags=["chat"])
 
@@ -71,7 +73,35 @@ async def create_conversation(
         )
 
 
+@replica_read
+def _list_conversation_page(
+    session: Session, user_id: str, limit: int, offset: int
+) -> tuple[list[Conversation], dict[UUID, int]]:
+    """Page of the user's conversations (latest first) and their message counts."""
+    query = (
+        select(Conversation)
+        .where(Conversation.user_id == user_id)
+        .order_by(Conversation.updated_at.desc())
+        .limit(limit)
+        .offset(offset)
+    )
+
+    conversations = session.exec(query).all()
+
+    # Get message counts for the page in one grouped query
+    message_counts = {}
+    if conversations:
+        count_query = (
+            select(Message.conversation_id, func.count(Message.id))
+            .where(Message.conversation_id.in_([conv.id for conv in conversations]))
+            .group_by(Message.conversation_id)
+        )
+        message_counts = dict(session.exec(count_query).all())
+    return list(conversations), message_counts
+
+
 @router.get("/conversations", response_model=list[ConversationResponse], status_code=200)
+@query_budget(4)
 async def list_conversations(
     limit: int = 50,
     offset: int = 0,
@@ -91,37 +121,23 @@ async def list_conversations(
         List of ConversationResponse objects
     """
     try:
-        # Build query
-        query = (
-            select(Conversation)
-            .where(Conversation.user_id == current_user.id)
-            .order_by(Conversation.updated_at.desc())
-            .limit(limit)
-            .offset(offset)
+        conversations, message_counts = _list_conversation_page(
+            session, current_user.id, limit, offset
         )
 
-        conversations = session.exec(query).all()
-
-        # Get message counts for each conversation
-        responses = []
-        for conv in conversations:
-            count_query = select(func.count(Message.id)).where(
-                Message.conversation_id == conv.id
-            )
-            message_count = session.exec(count_query).one()
-
-            responses.append(
-                ConversationResponse(
-                    id=conv.id,
-                    user_id=conv.user_id,
-                    title=conv.title,
-                    message_count=message_count,
-                    created_at=conv.created_at,
-                    updated_at=conv.updated_at,
-                )
+        responses = [
+            ConversationResponse(
+                id=conv.id,
+                user_id=conv.user_id,
+                title=conv.title,
+                message_count=message_counts.get(conv.id, 0),
+                created_at=conv.created_at,
+                updated_at=conv.updated_at,
             )
+            for conv in conversations
+        ]
 
-        return responses
+        return serialization.model_response(responses, list[ConversationResponse])
 
     except Exception as e:
         raise HTTPException(
@@ -259,7 +275,9 @@ async def send_chat_message(
             for msg in history_messages
         ]
 
-        # Process message through agent
+        # Process message through agent (the agent stack is imported on first use)
+        from src.services.agent_service import AgentService
+
         agent_service = AgentService(session)
         agent_result = await agent_service.process_user_message(
             user_id=current_user.id,
@@ -372,18 +390,21 @@ async def get_conversation_messages(
 
     messages = session.exec(query).all()
 
-    return [
-        MessageResponse(
-            id=msg.id,
-            conversation_id=msg.conversation_id,
-            user_id=msg.user_id,
-            role=msg.role,
-            content=msg.content,
-            tool_calls=msg.tool_calls,
-            created_at=msg.created_at,
-        )
-        for msg in messages
-    ]
+    return serialization.model_response(
+        [
+            MessageResponse(
+                id=msg.id,
+                conversation_id=msg.conversation_id,
+                user_id=msg.user_id,
+                role=msg.role,
+                content=msg.content,
+                tool_calls=msg.tool_calls,
+                created_at=msg.created_at,
+            )
+            for msg in messages
+        ],
+        list[MessageResponse],
+    )
 
 
 @router.delete(
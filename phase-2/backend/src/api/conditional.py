@@ -0,0 +1,97 @@
+"""
+Conditional Requests
+
+ETag / Last-Modified helpers for GET endpoints (RFC 9110 section 13).
+
+Collection ETags are derived from the user's change sequence (see
+services/task_sync.py), which every task and tag write advances, so a
+matching If-None-Match can be answered with 304 before running the list
+query. The ETag also covers the user and the query string: a browser
+shared by two accounts never revalidates one user's cached list with
+the other's version.
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+
+from fastapi import Request, Response
+
+# Clients may store responses but must revalidate every time; shared
+# caches must not store them (responses are per user)
+CACHE_CONTROL = "private, no-cache"
+
+
+def collection_etag(request: Request, user_id: str, version: int) -> str:
+    """Weak ETag for a user's collection at a change sequence value."""
+    digest = hashlib.blake2b(
+        f"{user_id}?{sorted(request.query_params.multi_items())}".encode(),
+        digest_size=8,
+    ).hexdigest()
+    return f'W/"{version}-{digest}"'
+
+
+def resource_etag(user_id: str, resource_id: str, version: int) -> str:
+    """Weak ETag for a single resource at its change sequence value."""
+    digest = hashlib.blake2b(f"{user_id}/{resource_id}".encode(), digest_size=8).hexdigest()
+    return f'W/"{version}-{digest}"'
+
+
+def http_date(value: datetime) -> str:
+    """Format a naive-UTC timestamp as an HTTP date (second precision)."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def is_not_modified(
+    request: Request, etag: str, last_modified: Optional[datetime] = None
+) -> bool:
+    """
+    Evaluate If-None-Match / If-Modified-Since against current validators.
+
+    If-None-Match uses weak comparison and takes precedence;
+    If-Modified-Since is only consulted when it is absent.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        current = _opaque_tag(etag)
+        return any(_opaque_tag(tag) == current for tag in if_none_match.split(","))
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            return False
+        modified = last_modified.replace(tzinfo=timezone.utc, microsecond=0)
+        return modified <= since
+
+    return False
+
+
+def set_validators(
+    response: Response, etag: str, last_modified: Optional[datetime] = None
+) -> None:
+    """Attach ETag, Last-Modified and Cache-Control to a response."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    if last_modified is not None:
+        response.headers["Last-Modified"] = http_date(last_modified)
+
+
+def not_modified(etag: str, last_modified: Optional[datetime] = None) -> Response:
+    """304 response carrying the current validators."""
+    response = Response(status_code=304)
+    set_validators(response, etag, last_modified)
+    return response
+
+
+def _opaque_tag(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
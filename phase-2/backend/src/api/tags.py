@@ -5,12 +5,15 @@ Thin controllers for tag CRUD operations.
 All business logic delegated to TagService.
 """
 
-from typing import List
+from typing import List, Union
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 
+from src import serialization
+from src.api import conditional
 from src.auth.dependencies import get_current_user
-from src.models.tag import Tag, TagCreate, TagResponse, TagUpdate
+from src.db.query_stats import query_budget
+from src.models.tag import Tag, TagCreate, TagResponse, TagUpdate, TagWithCountResponse
 from src.models.task import TaskResponse
 from src.models.user import User
 from src.services.tag_service import TagService
@@ -21,7 +24,7 @@ router = APIRouter(prefix="/api/tags", tags=["tags"])
 
 @router.get(
     "",
-    response_model=List[TagResponse],
+    response_model=List[Union[TagWithCountResponse, TagResponse]],
     status_code=200,
     responses={
         200: {
@@ -39,6 +42,9 @@ router = APIRouter(prefix="/api/tags", tags=["tags"])
                 }
             },
         },
+        304: {
+            "description": "Not modified (If-None-Match matches the current ETag)",
+        },
         401: {
             "description": "Not authenticated",
             "content": {
@@ -49,7 +55,11 @@ router = APIRouter(prefix="/api/tags", tags=["tags"])
         },
     },
 )
+@query_budget(4)
 async def list_tags(
+    request: Request,
+    with_counts: bool = Query(False, description="Include task_count per tag"),
+    sort_by: str = Query("name", regex="^(name|task_count)$", description="Sort field (name or task_count)"),
     current_user: User = Depends(get_current_user),
     tag_service: TagService = Depends(),
 ):
@@ -57,10 +67,15 @@ async def list_tags(
     Get all tags for authenticated user.
 
     Retrieves all tags owned by the current authenticated user.
-    Tags are sorted alphabetically by name.
+    Tags are sorted alphabetically by name unless sort_by is given.
+
+    **Query Parameters:**
+    - with_counts: Include `task_count` (number of tasks with the tag) per tag
+    - sort_by: `name` (default) or `task_count` (most used first, for tag clouds)
 
     **Response:**
-    - 200: Array of tags
+    - 200: Array of tags, with a weak `ETag`
+    - 304: Nothing changed since the ETag sent in `If-None-Match`
     - 401: Not authenticated (missing or invalid auth token)
 
     **Authentication:**
@@ -80,10 +95,21 @@ async def list_tags(
             "user_id": "550e8400-e29b-41d4-a716-446655440000"
         }
     ]
+
+    GET /api/tags?with_counts=true&sort_by=task_count
     ```
     """
-    tags = await tag_service.get_user_tags(current_user.id)
-    return tags
+    # Revalidations are answered from the user's version (see list_tasks)
+    version = await tag_service.get_version(current_user.id)
+    etag = conditional.collection_etag(request, current_user.id, version)
+    if conditional.is_not_modified(request, etag):
+        return conditional.not_modified(etag)
+
+    tags = await tag_service.get_user_tags(current_user.id, sort_by=sort_by)
+    response_model = TagWithCountResponse if with_counts else TagResponse
+    response = serialization.model_response(tags, List[response_model])
+    conditional.set_validators(response, etag)
+    return response
 
 
 @router.post(
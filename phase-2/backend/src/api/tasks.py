@@ -5,17 +5,34 @@ Thin controllers for task CRUD operations.
 All business logic delegated to TaskService.
 """
 
+import io
 from datetime import datetime
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, Response, UploadFile, status
+from fastapi.responses import StreamingResponse
 
+from src import serialization
+from src.api import conditional
 from src.api.dependencies import get_event_publisher
 from src.auth.dependencies import get_current_user
+from src.db.query_stats import query_budget
 from src.events.dapr_publisher import DaprEventPublisher
 from src.models.priority import Priority
-from src.models.task import Task, TaskCreate, TaskResponse, TaskToggleComplete, TaskUpdate
+from src.models.sync import TaskChangesResponse
+from src.models.task import (
+    Task,
+    TaskBatchRequest,
+    TaskBatchResponse,
+    TaskCreate,
+    TaskImportResult,
+    TaskResponse,
+    TaskSearchResult,
+    TaskToggleComplete,
+    TaskUpdate,
+)
 from src.models.user import User
+from src.services import task_sync, task_transfer
 from src.services.task_service import TaskService
 
 router = APIRouter(prefix="/api/tasks", tags=["tasks"])
@@ -29,19 +46,25 @@ router = APIRouter(prefix="/api/tasks", tags=["tasks"])
         200: {
             "description": "List of tasks",
         },
+        304: {
+            "description": "Not modified (If-None-Match matches the current ETag)",
+        },
         401: {
             "description": "Not authenticated",
         },
     },
 )
+@query_budget(5)
 async def list_tasks(
+    request: Request,
     is_complete: Optional[bool] = Query(None, description="Filter by completion status"),
     priority: Optional[int] = Query(None, ge=Priority.LOW, le=Priority.HIGH, description="Filter by priority (1=low, 2=medium, 3=high)"),
     tags: Optional[str] = Query(None, description="Filter by tag IDs (comma-separated)"),
+    match: str = Query("all", regex="^(all|any)$", description="Tag match mode (all or any)"),
     search: Optional[str] = Query(None, description="Search in title and description"),
     due_date_before: Optional[datetime] = Query(None, description="Filter by due date before (ISO 8601)"),
     due_date_after: Optional[datetime] = Query(None, description="Filter by due date after (ISO 8601)"),
-    sort_by: str = Query("created_at", description="Sort field (created_at, due_date, priority, title, updated_at)"),
+    sort_by: str = Query("created_at", description="Sort field (created_at, due_date, priority, title, updated_at, relevance)"),
     sort_order: str = Query("desc", regex="^(asc|desc)$", description="Sort order (asc or desc)"),
     limit: int = Query(50, ge=1, le=100, description="Maximum tasks to return"),
     offset: int = Query(0, ge=0, description="Number of tasks to skip"),
@@ -58,17 +81,20 @@ async def list_tasks(
     **Query Parameters:**
     - is_complete: Optional boolean to filter by completion status
     - priority: Optional priority filter (1=low, 2=medium, 3=high)
-    - tags: Comma-separated list of tag IDs to filter (tasks must have ALL tags)
-    - search: Search query for title and description (case-insensitive partial match)
+    - tags: Comma-separated list of tag IDs to filter
+    - match: `all` (default) - tasks must have ALL tags, `any` - at least one tag
+    - search: Search query for title and description (full-text with websearch
+      syntax on PostgreSQL, e.g. `"weekly report" -draft`)
     - due_date_before: Filter by due date before this ISO 8601 datetime
     - due_date_after: Filter by due date after this ISO 8601 datetime
-    - sort_by: Field to sort by (default: created_at)
+    - sort_by: Field to sort by (default: created_at; relevance = best search match first)
     - sort_order: Sort direction (asc or desc, default: desc)
     - limit: Maximum tasks to return (1-100, default: 50)
     - offset: Number of tasks to skip for pagination (default: 0)
 
     **Response:**
-    - 200: Array of tasks matching the filter criteria
+    - 200: Array of tasks matching the filter criteria, with a weak `ETag`
+    - 304: Nothing changed since the ETag sent in `If-None-Match`
     - 401: Not authenticated
 
     **Authentication:**
@@ -85,10 +111,21 @@ async def list_tasks(
     # Filter by tags and due date
     GET /api/tasks?tags=tag_id1,tag_id2&due_date_after=2025-12-01T00:00:00Z
 
+    # Tasks with either tag
+    GET /api/tasks?tags=tag_id1,tag_id2&match=any
+
     # Sort by due date, oldest first
     GET /api/tasks?sort_by=due_date&sort_order=asc
     ```
     """
+    # Answer revalidations from the user's version without the list query.
+    # The version is read first: a write committing meanwhile only makes
+    # the ETag older than the body, which costs the client one refetch.
+    version = await task_service.get_version(current_user.id)
+    etag = conditional.collection_etag(request, current_user.id, version)
+    if conditional.is_not_modified(request, etag):
+        return conditional.not_modified(etag)
+
     # Parse tags parameter
     tag_ids = None
     if tags:
@@ -99,6 +136,7 @@ async def list_tasks(
         is_complete=is_complete,
         priority=priority,
         tag_ids=tag_ids,
+        tag_match=match,
         search=search,
         due_date_before=due_date_before,
         due_date_after=due_date_after,
@@ -107,7 +145,149 @@ async def list_tasks(
         limit=limit,
         offset=offset,
     )
-    return tasks
+    response = serialization.model_response(tasks, List[TaskResponse])
+    conditional.set_validators(response, etag)
+    return response
+
+
+@router.get(
+    "/search",
+    response_model=List[TaskSearchResult],
+    status_code=200,
+    responses={
+        200: {
+            "description": "Matching tasks, best match first",
+        },
+        401: {
+            "description": "Not authenticated",
+        },
+    },
+)
+@query_budget(4)
+async def search_tasks(
+    q: str = Query(..., min_length=1, max_length=200, description="Search query"),
+    is_complete: Optional[bool] = Query(None, description="Filter by completion status"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum results to return"),
+    offset: int = Query(0, ge=0, description="Number of results to skip"),
+    current_user: User = Depends(get_current_user),
+    task_service: TaskService = Depends(),
+):
+    """
+    Search tasks by relevance with highlighted snippets.
+
+    **Query Parameters:**
+    - q: Search query. Supports quoted phrases, OR and -exclusion
+    - is_complete: Optional boolean to filter by completion status
+    - limit: Maximum results to return (1-100, default: 20)
+    - offset: Number of results to skip for pagination (default: 0)
+
+    **Response:**
+    - 200: Tasks with `relevance` score and `snippet` (matches wrapped in `<mark>`)
+    - 401: Not authenticated
+
+    **Example:**
+    ```
+    GET /api/tasks/search?q="quarterly report" -draft
+    ```
+    """
+    results = await task_service.search_tasks(
+        user_id=current_user.id,
+        search=q,
+        is_complete=is_complete,
+        limit=limit,
+        offset=offset,
+    )
+    return serialization.model_response(
+        [
+            TaskSearchResult(
+                **TaskResponse.model_validate(task).model_dump(),
+                relevance=relevance,
+                snippet=snippet,
+            )
+            for task, relevance, snippet in results
+        ],
+        List[TaskSearchResult],
+    )
+
+
+@router.get(
+    "/changes",
+    response_model=TaskChangesResponse,
+    status_code=200,
+    responses={
+        200: {
+            "description": "Tasks changed and deleted since the cursor",
+        },
+        400: {
+            "description": "Cursor is ahead of the server (client must resync)",
+        },
+        401: {
+            "description": "Not authenticated",
+        },
+    },
+)
+@query_budget(7)
+async def get_task_changes(
+    since: int = Query(0, ge=0, description="Cursor from the previous response (0 for a full sync)"),
+    limit: int = Query(
+        task_sync.DEFAULT_CHANGES_LIMIT,
+        ge=1,
+        le=task_sync.MAX_CHANGES_LIMIT,
+        description="Target number of changes per page",
+    ),
+    current_user: User = Depends(get_current_user),
+    task_service: TaskService = Depends(),
+):
+    """
+    Incremental sync: tasks created, updated or deleted after a cursor.
+
+    Every write to the user's tasks advances a per-user change sequence.
+    Clients keep the `since` value of the last response and pass it back to
+    receive only what changed; `since=0` returns every task.
+
+    **Query Parameters:**
+    - since: Cursor from the previous response (default: 0)
+    - limit: Target changes per page (1-1000, default: 500). A page never
+      splits one write, so it may be slightly larger
+
+    **Response:**
+    - 200: `changes` (full tasks, oldest change first), `deleted` (task IDs),
+      `since` (next cursor) and `has_more` (request again right away)
+    - 400: Cursor is ahead of the server; discard local state and resync
+      with `since=0`
+    - 401: Not authenticated
+
+    **Example:**
+    ```
+    GET /api/tasks/changes?since=42
+
+    Response 200:
+    {
+        "changes": [{"id": "...", "title": "Buy milk", "change_seq": 43, ...}],
+        "deleted": ["650e8400-e29b-41d4-a716-446655440002"],
+        "since": 44,
+        "has_more": false
+    }
+    ```
+    """
+    try:
+        tasks, deleted, next_since, has_more = await task_service.get_changes(
+            user_id=current_user.id,
+            since=since,
+            limit=limit,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return serialization.model_response(
+        TaskChangesResponse(
+            changes=[TaskResponse.model_validate(task) for task in tasks],
+            deleted=deleted,
+            since=next_since,
+            has_more=has_more,
+        ),
+        TaskChangesResponse,
+    )
 
 
 @router.post(
@@ -240,6 +420,230 @@ async def create_task(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    status_code=200,
+    responses={
+        200: {
+            "description": "All tasks as NDJSON or CSV (streamed)",
+            "content": {"application/x-ndjson": {}, "text/csv": {}},
+        },
+        401: {
+            "description": "Not authenticated",
+        },
+    },
+)
+async def export_tasks(
+    format: str = Query("ndjson", regex="^(ndjson|csv)$", description="Export format (ndjson or csv)"),
+    current_user: User = Depends(get_current_user),
+    task_service: TaskService = Depends(),
+):
+    """
+    Export all tasks of the authenticated user, oldest first.
+
+    The response is streamed from a database cursor, so exports of any size
+    use constant memory. Records carry tag names, and the file can be fed
+    back to POST /api/tasks/import.
+
+    **Query Parameters:**
+    - format: `ndjson` (default, one JSON object per line) or `csv`
+      (tags joined with `;`)
+
+    **Example:**
+    ```
+    GET /api/tasks/export?format=csv
+
+    Response 200 (text/csv):
+    id,title,description,is_complete,priority,due_date,created_at,updated_at,tags
+    650e8400-...,Buy milk,,false,2,,2025-12-07T16:00:00,2025-12-07T16:00:00,errands;home
+    ```
+    """
+    records = task_service.export_tasks(current_user.id)
+    if format == "csv":
+        body = task_transfer.iter_csv(records)
+    else:
+        body = task_transfer.iter_ndjson(records)
+
+    return StreamingResponse(
+        body,
+        media_type=task_transfer.MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="tasks.{format}"'},
+    )
+
+
+@router.post(
+    "/import",
+    response_model=TaskImportResult,
+    status_code=200,
+    responses={
+        200: {
+            "description": "Import summary",
+        },
+        400: {
+            "description": "File is not UTF-8 encoded",
+        },
+        401: {
+            "description": "Not authenticated",
+        },
+    },
+)
+async def import_tasks(
+    file: UploadFile = File(..., description="NDJSON or CSV file (as produced by export)"),
+    format: Optional[str] = Query(None, regex="^(ndjson|csv)$", description="File format (default: from file name)"),
+    current_user: User = Depends(get_current_user),
+    task_service: TaskService = Depends(),
+):
+    """
+    Import tasks from an NDJSON or CSV upload.
+
+    The file is parsed line by line and loaded in chunks of multi-row
+    INSERTs in one transaction. Tags are matched by name and created when
+    missing. Task IDs in the file are ignored (new IDs are assigned).
+    Invalid lines are skipped and reported.
+
+    **Fields per record:**
+    - title (required), description, is_complete, priority (1-3),
+      due_date, created_at, updated_at (ISO 8601), tags (tag names)
+
+    **Response:**
+    - 200: `imported` and `failed` counts and the first `errors` (line, error)
+    - 400: File is not UTF-8 encoded
+    - 401: Not authenticated
+
+    **Example:**
+    ```
+    curl -F file=@tasks.ndjson https://.../api/tasks/import
+    ```
+    """
+    if format is None:
+        is_csv = (file.filename or "").lower().endswith(".csv") or file.content_type == "text/csv"
+        format = "csv" if is_csv else "ndjson"
+
+    stream = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    parse = task_transfer.parse_csv if format == "csv" else task_transfer.parse_ndjson
+
+    try:
+        return await task_service.import_tasks(current_user.id, parse(stream))
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="File must be UTF-8 encoded")
+    finally:
+        stream.detach()
+
+
+@router.post(
+    "/batch",
+    response_model=TaskBatchResponse,
+    status_code=200,
+    responses={
+        200: {
+            "description": "Per-operation results, in request order",
+        },
+        401: {
+            "description": "Not authenticated",
+        },
+        422: {
+            "description": "Malformed operation (unknown op, missing fields, too many operations)",
+        },
+    },
+)
+async def batch_tasks(
+    batch: TaskBatchRequest,
+    current_user: User = Depends(get_current_user),
+    task_service: TaskService = Depends(),
+    event_publisher: DaprEventPublisher = Depends(get_event_publisher),
+):
+    """
+    Create, update, complete and delete many tasks in one request.
+
+    All operations run in a single transaction. Operations that fail (task
+    not found, not owned, invalid tags) are reported per item and the rest
+    are applied, unless `atomic` is true, in which case nothing is applied
+    and the remaining items are reported with status 424. Updates and
+    completions of a task deleted by a later operation are reported with
+    status 409.
+
+    **Request Body:**
+    - operations: 1-500 operations, each with `op` and:
+      - create: `create` (same fields as POST /api/tasks)
+      - update: `task_id` and `update` (same fields as PATCH /api/tasks/{id})
+      - complete: `task_id` and optional `is_complete` (default true)
+      - delete: `task_id`
+    - atomic: Apply nothing if any operation fails (default false)
+
+    **Response:**
+    - 200: `results` (index, op, status_code, task_id, task, error per
+      operation), `succeeded`, `failed`, `applied`
+    - 401: Not authenticated
+    - 422: Malformed request
+
+    **Side Effects:**
+    - Task events for all applied operations are published in one bulk request
+    - task.completed only for operations that marked an incomplete task complete
+
+    **Example:**
+    ```json
+    POST /api/tasks/batch
+    {
+        "operations": [
+            {"op": "create", "create": {"title": "Buy milk"}},
+            {"op": "complete", "task_id": "650e8400-e29b-41d4-a716-446655440001"},
+            {"op": "delete", "task_id": "650e8400-e29b-41d4-a716-446655440002"}
+        ]
+    }
+    ```
+    """
+    results, applied = await task_service.batch_tasks(
+        batch.operations, current_user.id, atomic=batch.atomic
+    )
+
+    if applied:
+        events = []
+        for operation, result in zip(batch.operations, results):
+            if result.error or result.task is None:
+                continue
+            task_data = _task_event_data(result.task)
+            if operation.op == "create":
+                events.append(("task.created", task_data))
+            elif operation.op == "delete":
+                events.append(("task.deleted", task_data))
+            elif operation.op == "complete":
+                # Re-completing a completed task is an update, not a completion
+                events.append(
+                    ("task.completed" if result.completed else "task.updated", task_data)
+                )
+            else:
+                events.append(("task.updated", task_data))
+                if result.completed:
+                    events.append(("task.completed", task_data))
+
+        # Publish all events in one bulk request (fire-and-forget, non-blocking)
+        await event_publisher.publish_task_events(events, user_id=current_user.id)
+
+    failed = sum(1 for result in results if result.error)
+    return TaskBatchResponse(
+        results=results,
+        succeeded=len(results) - failed,
+        failed=failed,
+        applied=applied,
+    )
+
+
+def _task_event_data(task: TaskResponse) -> dict:
+    """Task payload for task lifecycle events."""
+    return {
+        "id": task.id,
+        "title": task.title,
+        "description": task.description,
+        "is_complete": task.is_complete,
+        "priority": task.priority,
+        "due_date": task.due_date.isoformat() if task.due_date else None,
+        "user_id": task.user_id,
+        "created_at": task.created_at.isoformat(),
+        "updated_at": task.updated_at.isoformat(),
+    }
+
+
 @router.get(
     "/{task_id}",
     response_model=TaskResponse,
@@ -287,8 +691,11 @@ async def create_task(
         },
     },
 )
+@query_budget(4)
 async def get_task(
     task_id: str,
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     task_service: TaskService = Depends(),
 ):
@@ -302,7 +709,8 @@ async def get_task(
     - task_id: UUID of the task to retrieve
 
     **Response:**
-    - 200: Task data retrieved successfully
+    - 200: Task data retrieved successfully, with `ETag` and `Last-Modified`
+    - 304: Not modified (`If-None-Match`, or `If-Modified-Since` without it)
     - 401: Not authenticated (missing or invalid auth token)
     - 403: Forbidden (task belongs to different user)
     - 404: Task not found
@@ -331,6 +739,13 @@ async def get_task(
     ```
     """
     task = await task_service.get_task(task_id, current_user.id)
+
+    # The ETag follows change_seq, which also moves when tags change
+    etag = conditional.resource_etag(current_user.id, task.id, task.change_seq)
+    if conditional.is_not_modified(request, etag, task.updated_at):
+        return conditional.not_modified(etag, task.updated_at)
+    conditional.set_validators(response, etag, task.updated_at)
+
     return task
 
 
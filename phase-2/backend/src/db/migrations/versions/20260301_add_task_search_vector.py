@@ -0,0 +1,67 @@
+"""Add full-text search vector to tasks
+
+Adds a generated tsvector column over title (weight A) and description
+(weight B) with a GIN index, used by task search (websearch_to_tsquery +
+ts_rank). Replaces the per-column indexes from 20260131_023941, which task
+search never used:
+- ix_tasks_title_gin / ix_tasks_description_gin (expression indexes that
+  only match queries repeating the exact to_tsvector expression)
+- ix_tasks_description (btree, cannot serve ILIKE '%term%')
+
+ix_tasks_title is kept because it serves sort_by=title.
+
+Revision ID: 20260301_task_search_tsv
+Revises: 20260201_fix_conv_uid
+Create Date: 2026-03-01 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20260301_task_search_tsv"
+down_revision: Union[str, Sequence[str], None] = "20260201_fix_conv_uid"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add generated search_vector column and GIN index to tasks."""
+    op.execute("DROP INDEX IF EXISTS ix_tasks_title_gin")
+    op.execute("DROP INDEX IF EXISTS ix_tasks_description_gin")
+    op.execute("DROP INDEX IF EXISTS ix_tasks_description")
+
+    op.execute(
+        """
+        ALTER TABLE tasks
+        ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(description, '')), 'B')
+        ) STORED
+        """
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_tasks_search_vector "
+        "ON tasks USING GIN (search_vector)"
+    )
+
+
+def downgrade() -> None:
+    """Drop search_vector and restore the previous search indexes."""
+    op.execute("DROP INDEX IF EXISTS ix_tasks_search_vector")
+    op.execute("ALTER TABLE tasks DROP COLUMN IF EXISTS search_vector")
+
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_tasks_title_gin ON tasks "
+        "USING GIN (to_tsvector('english', title))"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_tasks_description_gin ON tasks "
+        "USING GIN (to_tsvector('english', description))"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_tasks_description ON tasks (description)"
+    )
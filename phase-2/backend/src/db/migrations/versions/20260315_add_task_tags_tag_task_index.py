@@ -0,0 +1,43 @@
+"""Add covering (tag_id, task_id) index to task_tags
+
+Tag filtering resolves tag IDs to task IDs with a single semi-join
+(task_id IN (SELECT task_id FROM task_tags WHERE tag_id IN (...)
+GROUP BY task_id HAVING count(*) = n)). The composite primary key is
+(task_id, tag_id), so it cannot serve a lookup by tag_id; this index
+answers it with an index-only scan.
+
+Replaces ix_task_tags_tag_id, which is a prefix of the new index.
+
+Revision ID: 20260315_task_tags_tag_task
+Revises: 20260301_task_search_tsv
+Create Date: 2026-03-15 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20260315_task_tags_tag_task"
+down_revision: Union[str, Sequence[str], None] = "20260301_task_search_tsv"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create (tag_id, task_id) index and drop the single-column tag_id index."""
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ix_task_tags_tag_task "
+        "ON task_tags (tag_id, task_id)"
+    )
+    op.execute("DROP INDEX IF EXISTS ix_task_tags_tag_id")
+    op.execute("ANALYZE task_tags")
+
+
+def downgrade() -> None:
+    """Restore the single-column tag_id index."""
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_task_tags_tag_id ON task_tags (tag_id)"
+    )
+    op.execute("DROP INDEX IF EXISTS ix_task_tags_tag_task")
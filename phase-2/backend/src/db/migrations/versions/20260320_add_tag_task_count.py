@@ -0,0 +1,48 @@
+"""Add maintained task_count to tags
+
+Stores the number of tasks carrying each tag so GET /api/tags?with_counts=true
+is a single query on ix_tags_user_id instead of a task_tags aggregate.
+TaskService keeps the column in sync whenever associations change; this
+migration backfills it from task_tags.
+
+Revision ID: 20260320_tag_task_count
+Revises: 20260315_task_tags_tag_task
+Create Date: 2026-03-20 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20260320_tag_task_count"
+down_revision: Union[str, Sequence[str], None] = "20260315_task_tags_tag_task"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add task_count column and backfill it from task_tags."""
+    op.add_column(
+        "tags",
+        sa.Column("task_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.execute(
+        """
+        UPDATE tags
+        SET task_count = counts.task_count
+        FROM (
+            SELECT tag_id, count(*) AS task_count
+            FROM task_tags
+            GROUP BY tag_id
+        ) AS counts
+        WHERE tags.id = counts.tag_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop task_count column."""
+    op.drop_column("tags", "task_count")
@@ -0,0 +1,78 @@
+"""Add per-user change sequence and task tombstones for incremental sync
+
+GET /api/tasks/changes?since=N returns tasks whose change_seq is greater
+than N plus tombstones of deleted tasks. Writers take the next value from
+user_sync_state and stamp it on the rows they change.
+
+Existing tasks are backfilled with change_seq = 1 and their owners' counters
+start at 1, so a client syncing from since=0 receives every task.
+Tombstones are kept indefinitely.
+
+Revision ID: 20260325_task_change_seq
+Revises: 20260320_tag_task_count
+Create Date: 2026-03-25 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20260325_task_change_seq"
+down_revision: Union[str, Sequence[str], None] = "20260320_tag_task_count"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create sync tables, add tasks.change_seq and backfill it."""
+    op.create_table(
+        "user_sync_state",
+        sa.Column("user_id", sa.String(), nullable=False),
+        sa.Column("change_seq", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.ForeignKeyConstraint(["user_id"], ["user.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+    op.create_table(
+        "task_tombstones",
+        sa.Column("task_id", sa.String(), nullable=False),
+        sa.Column("user_id", sa.String(), nullable=False),
+        sa.Column("change_seq", sa.BigInteger(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["user.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("task_id"),
+    )
+    op.create_index(
+        "ix_task_tombstones_user_id_change_seq",
+        "task_tombstones",
+        ["user_id", "change_seq"],
+    )
+
+    op.add_column(
+        "tasks",
+        sa.Column("change_seq", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+    op.execute("UPDATE tasks SET change_seq = 1")
+    op.execute(
+        """
+        INSERT INTO user_sync_state (user_id, change_seq)
+        SELECT DISTINCT user_id, 1 FROM tasks
+        ON CONFLICT (user_id) DO NOTHING
+        """
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_tasks_user_id_change_seq "
+        "ON tasks (user_id, change_seq)"
+    )
+    op.execute("ANALYZE tasks")
+
+
+def downgrade() -> None:
+    """Drop tasks.change_seq and the sync tables."""
+    op.execute("DROP INDEX IF EXISTS ix_tasks_user_id_change_seq")
+    op.drop_column("tasks", "change_seq")
+    op.drop_index("ix_task_tombstones_user_id_change_seq", table_name="task_tombstones")
+    op.drop_table("task_tombstones")
+    op.drop_table("user_sync_state")
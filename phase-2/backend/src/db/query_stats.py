@@ -0,0 +1,169 @@
+"""
+Per-Request SQL Instrumentation
+
+Counts queries and database time per request:
+- instrument_engine(): cursor execute hooks on an engine, adding every
+  query to the current request's QueryStats and logging slow queries
+- track_queries(): binds a fresh QueryStats to the current context
+  (done per request by QueryStatsMiddleware in src/middleware.py)
+- untracked(): excludes queries that are not the request's own
+- query_budget(): declares the maximum queries a route may run
+
+Slow queries are logged with their parameters redacted (only the count
+is logged), since parameters carry user data such as titles and emails.
+
+Usage:
+    @router.get("")
+    @query_budget(4)
+    async def list_tasks(...):
+        ...
+"""
+
+import logging
+import os
+import re
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from todo_observability import metrics
+
+logger = logging.getLogger(__name__)
+
+# Queries slower than this are logged (milliseconds, 0 disables the log)
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "500"))
+
+# Longest statement text included in a slow query log line
+MAX_LOGGED_STATEMENT = 2000
+
+_QUERY_STARTED = "query_stats_started"
+
+_WHITESPACE = re.compile(r"\s+")
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class QueryBudgetExceededError(RuntimeError):
+    """A route ran more queries than its declared budget (strict mode only)."""
+
+
+@dataclass
+class QueryStats:
+    """Queries run in one request."""
+
+    count: int = 0
+    duration: float = 0.0  # Seconds spent in cursor execution
+
+    def server_timing(self) -> str:
+        """Server-Timing header value, e.g. `db;dur=12.3;desc="5 queries"`."""
+        return f'db;dur={self.duration * 1000:.1f};desc="{self.count} queries"'
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    Collect queries run in the current context (and threads started from it).
+
+    Yields:
+        QueryStats updated as queries complete
+    """
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+@contextmanager
+def untracked() -> Iterator[None]:
+    """Leave queries out of the current request's stats (e.g. health checks)."""
+    token = _current_stats.set(None)
+    try:
+        yield
+    finally:
+        _current_stats.reset(token)
+
+
+def query_budget(max_queries: int) -> Callable[[F], F]:
+    """
+    Declare the maximum number of queries an endpoint may run per request.
+
+    QueryStatsMiddleware logs requests over budget, and fails them when
+    QUERY_BUDGET_STRICT is enabled (as in the test suite).
+
+    Args:
+        max_queries: Query budget per request
+    """
+
+    def decorator(endpoint: F) -> F:
+        endpoint.__query_budget__ = max_queries
+        return endpoint
+
+    return decorator
+
+
+def get_query_budget(endpoint: Any) -> Optional[int]:
+    """Declared query budget of an endpoint, if any."""
+    return getattr(endpoint, "__query_budget__", None)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    Register the per-request query hooks on an engine.
+
+    Args:
+        engine: SQLAlchemy engine (idempotent per engine)
+    """
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault(_QUERY_STARTED, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get(_QUERY_STARTED)
+    if not started:
+        return
+    duration = time.perf_counter() - started.pop()
+
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.duration += duration
+
+    if SLOW_QUERY_MS and duration * 1000 >= SLOW_QUERY_MS:
+        metrics.DB_SLOW_QUERIES.inc()
+        logger.warning(
+            f"Slow query ({duration * 1000:.1f} ms, "
+            f"{_parameter_count(parameters, executemany)} parameters redacted): "
+            f"{_format_statement(statement)}"
+        )
+
+
+def _parameter_count(parameters: Any, executemany: bool) -> int:
+    """Number of bound values (summed over rows for executemany)."""
+    if not parameters:
+        return 0
+    if executemany:
+        return sum(len(row) for row in parameters)
+    return len(parameters)
+
+
+def _format_statement(statement: str) -> str:
+    """Statement on one line, truncated to MAX_LOGGED_STATEMENT characters."""
+    statement = _WHITESPACE.sub(" ", statement).strip()
+    if len(statement) > MAX_LOGGED_STATEMENT:
+        return statement[:MAX_LOGGED_STATEMENT] + "..."
+    return statement
@@ -0,0 +1,298 @@
+"""
+Read Replica Routing
+
+Sends read-only service calls to a read replica when DATABASE_READ_URL is
+set; without it everything runs on the primary as before.
+
+- replica_read: marks a read-only service method (or a function taking
+  the session first) as safe to serve from the replica. Only its SELECTs
+  are routed, by RoutingSession in src/db/session.py.
+- Read-your-writes: once a session has written, it stays on the primary.
+  ReadReplicaMiddleware (src/middleware.py) also sets a short-lived
+  cookie on responses of requests that wrote, and requests carrying it
+  read from the primary for DATABASE_READ_STICKY_SECONDS. A cookie (not
+  per-process state) so stickiness holds across gunicorn workers.
+- Fallback: the replica is health-checked at most every
+  DATABASE_READ_CHECK_INTERVAL seconds per worker. While it is down or
+  lagging more than DATABASE_READ_MAX_LAG_SECONDS, reads go to the
+  primary. A replica_read call failing on the replica with a connection
+  error is retried once on the primary.
+
+Keep the sticky window above the maximum lag, otherwise a client can
+read from a replica that has not caught up with its write yet.
+
+Usage:
+    class TaskService:
+        @replica_read
+        async def get_user_tasks(self, user_id: str, ...):
+            ...
+"""
+
+import functools
+import inspect
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+from prometheus_client import Counter, Gauge
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+from sqlmodel import Session
+
+from src.db import query_stats
+
+logger = logging.getLogger(__name__)
+
+# Replica connection URL (unset: no replica, all reads on the primary)
+DATABASE_READ_URL = os.getenv("DATABASE_READ_URL")
+READ_REPLICA_ENABLED = bool(DATABASE_READ_URL)
+
+# Seconds a client reads from the primary after one of its writes
+READ_STICKY_SECONDS = int(os.getenv("DATABASE_READ_STICKY_SECONDS", "5"))
+
+# Replication lag above which reads fall back to the primary
+READ_MAX_LAG_SECONDS = float(os.getenv("DATABASE_READ_MAX_LAG_SECONDS", "2"))
+
+# Seconds between replica health checks (per worker)
+READ_CHECK_INTERVAL = float(os.getenv("DATABASE_READ_CHECK_INTERVAL", "5"))
+
+# Cookie marking a client that wrote recently
+STICKY_COOKIE = "db_read_primary"
+
+# Zero when the replica has replayed everything it received (an idle
+# primary would otherwise look like growing lag), else the age of the
+# last replayed transaction; zero on a primary
+REPLICA_LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+    """
+)
+
+# Backend-only metrics (served with the shared ones on /metrics)
+DB_REPLICA_READS = Counter(
+    "db_replica_reads_total",
+    "Replica-eligible queries by the database that served them",
+    ["target"],
+)
+DB_REPLICA_LAG = Gauge(
+    "db_replica_lag_seconds",
+    "Read replica replication lag at the last health check",
+    multiprocess_mode="livemax",
+)
+
+# Session.info keys
+_READ_DEPTH = "replica_read_depth"  # Nesting of replica_read calls
+_WROTE = "replica_wrote"  # Session has written: stay on the primary
+_USED = "replica_used"  # A query of the current replica_read call ran on the replica
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@dataclass
+class ReadRouting:
+    """Read routing state of one request."""
+
+    sticky: bool = False  # Client wrote recently: read from the primary
+    wrote: bool = False  # This request wrote: make the client sticky
+
+
+@dataclass
+class _ReplicaHealth:
+    available: bool = True
+    checked_at: float = float("-inf")
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+_current_routing: ContextVar[Optional[ReadRouting]] = ContextVar("read_routing", default=None)
+
+_health = _ReplicaHealth()
+
+
+@contextmanager
+def route_reads(sticky: bool = False) -> Iterator[ReadRouting]:
+    """
+    Bind read routing state to the current request (ReadReplicaMiddleware).
+
+    Args:
+        sticky: Whether the client carries the sticky cookie
+
+    Yields:
+        ReadRouting, with `wrote` set once the request writes
+    """
+    routing = ReadRouting(sticky=sticky)
+    token = _current_routing.set(routing)
+    try:
+        yield routing
+    finally:
+        _current_routing.reset(token)
+
+
+def sticky_cookie() -> str:
+    """Set-Cookie value keeping the client on the primary after a write."""
+    return (
+        f"{STICKY_COOKIE}=1; Max-Age={READ_STICKY_SECONDS}; Path=/; "
+        "HttpOnly; Secure; SameSite=None"
+    )
+
+
+def record_write(session: Session) -> None:
+    """Pin the session, and the client of the current request, to the primary."""
+    session.info[_WROTE] = True
+    routing = _current_routing.get()
+    if routing is not None:
+        routing.wrote = True
+
+
+def use_replica(session: Session, replica: Engine) -> bool:
+    """
+    Whether a SELECT of this session may run on the replica.
+
+    Only inside replica_read calls, before the session or the client wrote,
+    and while the replica is healthy.
+    """
+    if not session.info.get(_READ_DEPTH):
+        return False
+    routing = _current_routing.get()
+    if session.info.get(_WROTE) or (routing is not None and routing.sticky) or not replica_available(replica):
+        DB_REPLICA_READS.labels("primary").inc()
+        return False
+    session.info[_USED] = True
+    DB_REPLICA_READS.labels("replica").inc()
+    return True
+
+
+# ================== HEALTH ==================
+
+
+def replica_lag(replica: Engine) -> float:
+    """
+    Replication lag of the replica in seconds (0 on non-PostgreSQL databases).
+
+    Raises:
+        SQLAlchemyError: If the replica cannot be reached
+    """
+    with query_stats.untracked(), replica.connect() as connection:
+        if connection.dialect.name != "postgresql":
+            connection.execute(text("SELECT 1"))
+            return 0.0
+        return float(connection.execute(REPLICA_LAG_QUERY).scalar() or 0)
+
+
+def replica_available(replica: Engine) -> bool:
+    """
+    Whether reads may go to the replica (up and within the lag limit).
+
+    Re-checked at most every READ_CHECK_INTERVAL seconds; concurrent callers
+    use the last result instead of waiting for a check in progress.
+    """
+    now = time.monotonic()
+    if now - _health.checked_at < READ_CHECK_INTERVAL or not _health.lock.acquire(blocking=False):
+        return _health.available
+    try:
+        try:
+            lag = replica_lag(replica)
+        except Exception as e:
+            available = False
+            reason = f"unreachable ({e.__class__.__name__})"
+        else:
+            DB_REPLICA_LAG.set(lag)
+            available = lag <= READ_MAX_LAG_SECONDS
+            reason = f"lagging {lag:.1f}s"
+        if available != _health.available:
+            if available:
+                logger.info("Read replica available again, routing reads to it")
+            else:
+                logger.warning(f"Read replica {reason}, reading from the primary")
+        _health.available = available
+        _health.checked_at = time.monotonic()
+    finally:
+        _health.lock.release()
+    return _health.available
+
+
+def mark_replica_unavailable(error: Exception) -> None:
+    """Send reads to the primary until the next health check."""
+    logger.warning(f"Read replica query failed, reading from the primary: {error}")
+    _health.available = False
+    _health.checked_at = time.monotonic()
+
+
+# ================== SERVICE METHODS ==================
+
+
+def _session_of(args: tuple) -> Optional[Session]:
+    target = args[0]
+    session = target if isinstance(target, Session) else getattr(target, "session", None)
+    return session if isinstance(session, Session) else None
+
+
+@contextmanager
+def _replica_reads(session: Session) -> Iterator[None]:
+    session.info[_READ_DEPTH] = session.info.get(_READ_DEPTH, 0) + 1
+    session.info.pop(_USED, None)
+    try:
+        yield
+    finally:
+        session.info[_READ_DEPTH] -= 1
+
+
+def _retry_on_primary(session: Session, error: OperationalError) -> bool:
+    # Connection errors (or recovery conflicts) of a query that ran on the
+    # replica; the session must be rolled back before it can be used again
+    if not session.info.pop(_USED, False):
+        return False
+    mark_replica_unavailable(error)
+    session.rollback()
+    return True
+
+
+def replica_read(func: F) -> F:
+    """
+    Allow the SELECTs of a read-only call to run on the read replica.
+
+    The decorated function must not write. Methods find the session in
+    `self.session`, plain functions take it as first argument. Without a
+    replica, or with a session that is not a RoutingSession, the call runs
+    on the primary as usual.
+    """
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            session = _session_of(args)
+            if session is None:
+                return await func(*args, **kwargs)
+            try:
+                with _replica_reads(session):
+                    return await func(*args, **kwargs)
+            except OperationalError as e:
+                if not _retry_on_primary(session, e):
+                    raise
+            return await func(*args, **kwargs)
+
+        return async_wrapper  # type: ignore[return-value]
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        session = _session_of(args)
+        if session is None:
+            return func(*args, **kwargs)
+        try:
+            with _replica_reads(session):
+                return func(*args, **kwargs)
+        except OperationalError as e:
+            if not _retry_on_primary(session, e):
+                raise
+        return func(*args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
@@ -3,6 +3,9 @@ Database Session Management
 
 Provides database session dependency for FastAPI and context manager
 for scripts/tests. Uses connection pooling for production performance.
+The engine is created on first use (get_engine()), not at import.
+With DATABASE_READ_URL set, get_session() routes read-only service calls
+to the read replica (src/db/replica.py).
 
 Example Usage:
     # In FastAPI endpoint:
@@ -18,12 +21,26 @@ Example Usage:
         # Auto-commits on context exit
 """
 
+import logging
 import os
+import time
 from contextlib import contextmanager
-from typing import Generator
+from functools import lru_cache
+from typing import Generator, Optional
 
 from dotenv import load_dotenv
+from sqlalchemy import Select, event
+from sqlalchemy.engine import URL, Engine, make_url
+from sqlalchemy.exc import DisconnectionError
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.sql.dml import UpdateBase
 from sqlmodel import Session, create_engine
+from todo_observability import metrics, tracing
+
+from src.db import replica
+from src.db.query_stats import instrument_engine
+
+logger = logging.getLogger(__name__)
 
 # Load environment variables (.env file is optional in production)
 try:
@@ -32,43 +49,189 @@ except Exception:
     # Ignore if .env file doesn't exist (production deployment)
     pass
 
-# Get database URL from environment with Railway fallback
-DATABASE_URL = (
-    os.getenv("DATABASE_URL")
-    or os.getenv("DB_URL")
-    or os.getenv("POSTGRES_URL")
-    or os.getenv("DATABASE_PRIVATE_URL")  # Railway sometimes uses this
-)
-
-if not DATABASE_URL:
-    print("❌ No DATABASE_URL found in environment variables")
-    print("Available environment variables:")
-    for key in sorted(os.environ.keys()):
-        if "URL" in key or "DATABASE" in key or "DB" in key or "POSTGRES" in key:
-            print(f"  {key}={os.environ[key][:50]}...")
-        else:
-            print(f"  {key}")
+# Environment variables checked for the database URL, in order
+# (Railway sometimes uses DATABASE_PRIVATE_URL)
+DATABASE_URL_VARIABLES = ("DATABASE_URL", "DB_URL", "POSTGRES_URL", "DATABASE_PRIVATE_URL")
+
+# Connection pool per engine and per worker process (gunicorn runs several,
+# so the server sees workers x (size + overflow) connections at most)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))  # Wait for a free connection
+
+# Connection pooler (PgBouncer, Neon's "-pooler" endpoints) in front of the
+# database: "auto" detects Neon pooled hosts, "true"/"false" force the mode.
+# In pooler mode:
+# - no pre-ping on every checkout (a SELECT 1 round trip per request);
+#   only connections idle for DB_PING_IDLE_SECONDS are pinged, and a
+#   connection failing mid-request invalidates the pool as usual
+# - connections are recycled sooner (DB_POOL_RECYCLE, default 300s)
+# - no session-level startup options (PgBouncer rejects unknown startup
+#   parameters); set the timezone on the database instead (Neon: UTC)
+# - psycopg 3 URLs (postgresql+psycopg://) get prepared statements
+#   disabled, which break under transaction pooling. psycopg2, the
+#   default driver, never prepares statements server-side.
+DATABASE_POOLER = os.getenv("DATABASE_POOLER", "auto").lower()
+DB_PING_IDLE_SECONDS = float(os.getenv("DB_PING_IDLE_SECONDS", "30"))
+
+# connection_record.info key: when the connection was last returned
+_LAST_CHECKIN = "last_checkin"
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool recording checkout latency (queue wait when the pool is exhausted)."""
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            metrics.DB_POOL_CHECKOUT_DURATION.observe(time.perf_counter() - started)
+
+
+def get_database_url() -> str:
+    """
+    Database URL from the environment (see DATABASE_URL_VARIABLES).
+
+    Raises:
+        ValueError: If none of the variables is set
+    """
+    for name in DATABASE_URL_VARIABLES:
+        url = os.getenv(name)
+        if url:
+            return url
     raise ValueError(
         "DATABASE_URL environment variable is not set. "
         "Please set DATABASE_URL in Railway environment variables."
     )
 
-print(f"✅ Using database: {DATABASE_URL[:50]}...")
 
-# Create SQLAlchemy engine with connection pooling
-# For production with Neon Serverless PostgreSQL
-engine = create_engine(
-    DATABASE_URL,
-    echo=False,  # Set to True for SQL query logging in development
-    pool_pre_ping=True,  # Verify connections before using them
-    pool_size=5,  # Number of persistent connections to maintain
-    max_overflow=10,  # Allow up to 10 additional connections on demand
-    pool_recycle=3600,  # Recycle connections after 1 hour
-    connect_args={
-        "connect_timeout": 10,  # Connection timeout in seconds
-        "options": "-c timezone=utc",  # Use UTC timezone for all connections
-    },
-)
+def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+    metrics.DB_POOL_CONNECTIONS_IN_USE.inc()
+
+
+def _on_checkin(dbapi_connection, connection_record):
+    metrics.DB_POOL_CONNECTIONS_IN_USE.dec()
+
+
+def _record_checkin_time(dbapi_connection, connection_record):
+    connection_record.info[_LAST_CHECKIN] = time.monotonic()
+
+
+def _ping_if_idle(dbapi_connection, connection_record, connection_proxy):
+    # Pooler mode liveness check: busy connections are used without a
+    # round trip, idle ones are pinged (DisconnectionError makes the pool
+    # discard the connection and check out another one)
+    last_checkin = connection_record.info.get(_LAST_CHECKIN)
+    if last_checkin is None or time.monotonic() - last_checkin < DB_PING_IDLE_SECONDS:
+        return
+    try:
+        cursor = dbapi_connection.cursor()
+        cursor.execute("SELECT 1")
+        cursor.close()
+    except Exception as e:
+        raise DisconnectionError(f"Idle connection failed ping: {e}") from e
+
+
+def uses_pooler(url: URL) -> bool:
+    """Whether the URL goes through a transaction pooler (see DATABASE_POOLER)."""
+    if DATABASE_POOLER in ("true", "false"):
+        return DATABASE_POOLER == "true"
+    return "-pooler." in (url.host or "")
+
+
+def _create_engine(url: str, name: str, connect_timeout: int = 10) -> Engine:
+    """Pooled, instrumented engine (shared by the primary and the read replica)."""
+    url = make_url(url)
+    pooler = uses_pooler(url)
+    connect_args = {"connect_timeout": connect_timeout}  # Connection timeout in seconds
+    if not pooler:
+        connect_args["options"] = "-c timezone=utc"  # Use UTC timezone for all connections
+    if pooler and url.drivername == "postgresql+psycopg":
+        connect_args["prepare_threshold"] = None  # No server-side prepared statements
+
+    # For production with Neon Serverless PostgreSQL
+    engine = create_engine(
+        url,
+        poolclass=InstrumentedQueuePool,
+        echo=False,  # Set to True for SQL query logging in development
+        pool_pre_ping=not pooler,  # Verify connections before using them
+        pool_size=DB_POOL_SIZE,  # Number of persistent connections to maintain
+        max_overflow=DB_MAX_OVERFLOW,  # Additional connections on demand
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "300" if pooler else "3600")),
+        connect_args=connect_args,
+    )
+
+    if pooler and DB_PING_IDLE_SECONDS > 0:
+        # Registered before the metrics listeners, so a failed ping (and the
+        # retried checkout) is not counted as a connection in use
+        event.listen(engine, "checkout", _ping_if_idle)
+        event.listen(engine, "checkin", _record_checkin_time)
+
+    # Per-request query counting and slow query log
+    instrument_engine(engine)
+    tracing.trace_engine(engine)
+    event.listen(engine, "checkout", _on_checkout)
+    event.listen(engine, "checkin", _on_checkin)
+    logger.info(f"{name} engine created for {url.host}" + (" (pooler mode)" if pooler else ""))
+    return engine
+
+
+@lru_cache(maxsize=None)
+def get_engine() -> Engine:
+    """
+    Shared SQLAlchemy engine, created on first use.
+
+    Importing this module has no side effects, so tools and workers that
+    never touch the database (and test collection) skip engine setup.
+    Creating the engine does not open a connection either.
+
+    Returns:
+        Engine with connection pooling, pool metrics and query tracking
+    """
+    return _create_engine(get_database_url(), "Database")
+
+
+@lru_cache(maxsize=None)
+def get_read_engine() -> Optional[Engine]:
+    """
+    Read replica engine (DATABASE_READ_URL), created on first use.
+
+    A short connect timeout keeps an unreachable replica from stalling
+    requests; reads then fall back to the primary (src/db/replica.py).
+
+    Returns:
+        Replica engine, or None when no replica is configured
+    """
+    if not replica.DATABASE_READ_URL:
+        return None
+    return _create_engine(replica.DATABASE_READ_URL, "Read replica", connect_timeout=3)
+
+
+class RoutingSession(Session):
+    """
+    Session sending the SELECTs of replica_read calls to the read replica.
+
+    Writes (flushes, INSERT/UPDATE/DELETE statements) always go to the
+    primary and pin the session there (see src/db/replica.py).
+    """
+
+    def get_bind(self, mapper=None, *, clause=None, **kw):
+        read_engine = get_read_engine()
+        if read_engine is not None:
+            if self._flushing or isinstance(clause, UpdateBase):
+                replica.record_write(self)
+            elif isinstance(clause, Select) and replica.use_replica(self, read_engine):
+                return read_engine
+        return super().get_bind(mapper, clause=clause, **kw)
+
+
+def __getattr__(name: str):
+    # Backwards compatible `from src.db.session import engine`
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_session() -> Generator[Session, None, None]:
@@ -87,7 +250,7 @@ def get_session() -> Generator[Session, None, None]:
             tasks = session.exec(select(Task)).all()
             return tasks
     """
-    with Session(engine) as session:
+    with RoutingSession(get_engine()) as session:
         yield session
 
 
@@ -117,7 +280,7 @@ def get_session_context() -> Generator[Session, None, None]:
             raise ValueError("Oops!")
             # Session is rolled back, task not saved
     """
-    with Session(engine) as session:
+    with Session(get_engine()) as session:
         try:
             yield session
             session.commit()
@@ -143,7 +306,7 @@ def init_db() -> None:
     """
     from sqlmodel import SQLModel
 
-    SQLModel.metadata.create_all(engine)
+    SQLModel.metadata.create_all(get_engine())
 
 
 def check_connection() -> bool:
@@ -163,7 +326,7 @@ def check_connection() -> bool:
             raise RuntimeError("Database connection failed!")
     """
     try:
-        with engine.connect() as conn:
+        with get_engine().connect() as conn:
             conn.execute("SELECT 1")
         return True
     except Exception as e:
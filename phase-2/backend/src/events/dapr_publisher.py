@@ -14,7 +14,10 @@ Topics:
 import asyncio
 import logging
 import os
-from typing import Any, Dict, Optional
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from todo_observability import metrics
 
 from src.events.event_schemas import TaskEvent
 from src.services.dapr_client import DaprClient, get_dapr_client
@@ -72,6 +75,7 @@ class DaprEventPublisher:
             logger.debug(f"Event publishing disabled, skipping {topic}")
             return True  # Pretend success for graceful degradation
 
+        started = time.perf_counter()
         try:
             client = await self._get_client()
             success = await client.publish_event(
@@ -86,12 +90,58 @@ class DaprEventPublisher:
             else:
                 logger.warning(f"Failed to publish event to {topic}")
 
+            metrics.record_event_publish(topic, started, success)
             return success
 
         except Exception as e:
+            metrics.record_event_publish(topic, started, False)
             logger.error(f"Error publishing event to {topic}: {e}", exc_info=True)
             return False
 
+    async def publish_events_bulk(
+        self,
+        topic: str,
+        events: List[Dict[str, Any]],
+        metadata: Optional[Dict[str, str]] = None,
+    ) -> bool:
+        """
+        Publish a batch of events to a Kafka topic in one Dapr call.
+
+        Args:
+            topic: Kafka topic name
+            events: Event payloads (JSON-serializable)
+            metadata: Optional metadata applied to the whole batch
+
+        Returns:
+            True if every event was published, False otherwise
+        """
+        if not EVENT_PUBLISHING_ENABLED:
+            logger.debug(f"Event publishing disabled, skipping {len(events)} events to {topic}")
+            return True
+
+        started = time.perf_counter()
+        try:
+            client = await self._get_client()
+            success = await client.publish_events_bulk(
+                pubsub_name=PUBSUB_COMPONENT_NAME,
+                topic=topic,
+                events=events,
+                metadata=metadata,
+            )
+
+            if success:
+                logger.debug(f"Bulk published {len(events)} events to {topic} via Dapr")
+            else:
+                logger.warning(f"Failed to bulk publish {len(events)} events to {topic}")
+
+            metrics.record_event_publish(topic, started, success)
+            return success
+
+        except Exception as e:
+            metrics.record_event_publish(topic, started, False)
+            logger.error(f"Error bulk publishing events to {topic}: {e}", exc_info=True)
+            return False
+
     async def publish_task_event(
         self,
         event_type: str,
@@ -128,6 +178,46 @@ class DaprEventPublisher:
         )
         return True
 
+    async def publish_task_events(
+        self,
+        events: List[Tuple[str, Dict[str, Any]]],
+        user_id: str,
+    ) -> bool:
+        """
+        Publish many task lifecycle events in one bulk request (fire-and-forget).
+
+        Each entry is still a regular TaskEvent on 'task-events', so
+        consumers handle them exactly like individually published events.
+
+        Args:
+            events: (event_type, task_data) pairs
+            user_id: User ID who triggered the events
+
+        Returns:
+            True if publish was scheduled (or disabled)
+        """
+        if not EVENT_PUBLISHING_ENABLED or not events:
+            return True
+
+        payloads = [
+            TaskEvent(
+                event_type=event_type,
+                task_id=task_data.get("id"),
+                task_data=task_data,
+                user_id=user_id,
+            ).to_dict()
+            for event_type, task_data in events
+        ]
+
+        # Fire-and-forget: publish in background task
+        asyncio.create_task(
+            self.publish_events_bulk(
+                topic="task-events",
+                events=payloads,
+            )
+        )
+        return True
+
     async def publish_reminder_event(
         self,
         reminder_data: Dict[str, Any],
@@ -11,15 +11,16 @@ Topics:
 - Audit logs (audit-logs topic)
 """
 
-import json
 import logging
 import os
 from typing import Any, Dict, Optional
 
 from aiokafka import AIOKafkaProducer
 from aiokafka.errors import KafkaError
+from todo_observability.tracing import kafka_headers
 
 from src.events.event_schemas import TaskEvent
+from src.serialization import dumps
 
 logger = logging.getLogger(__name__)
 
@@ -56,7 +57,7 @@ class KafkaEventProducer:
             self.producer = AIOKafkaProducer(
                 bootstrap_servers=self.bootstrap_servers,
                 client_id=self.client_id,
-                value_serializer=lambda v: json.dumps(v).encode("utf-8"),
+                value_serializer=dumps,
                 # Reliability settings
                 acks="all",  # Wait for all replicas to acknowledge
                 retries=3,  # Retry up to 3 times on failure
@@ -112,11 +113,12 @@ class KafkaEventProducer:
             # Encode key if provided
             key_bytes = key.encode("utf-8") if key else None
 
-            # Send message
+            # Send message (trace context in the record headers)
             await self.producer.send_and_wait(
                 topic=topic,
                 value=data,
                 key=key_bytes,
+                headers=kafka_headers(),
             )
 
             logger.debug(f"Published event to {topic}: {event_type}")
@@ -0,0 +1,149 @@
+"""
+Worker Process Lifecycle
+
+Helpers for running the app under gunicorn with several uvicorn workers
+(see gunicorn.conf.py): sizing the worker count from the container CPU
+limit, making per-process state fork-safe, and releasing it on shutdown.
+
+With preload_app the master imports src.main once and forks the workers
+from it. Anything the master created that owns a socket, thread or event
+loop binding must not be shared with the children:
+
+- the database engine pools (created in the master when tracing
+  instruments them): inherited connections are dropped without closing
+  them, so the master's sockets stay intact
+- the event publisher and Dapr/Kafka client singletons: forgotten, each
+  worker creates its own on first use
+
+Pure in-memory caches (e.g. the serialization TypeAdapter cache) are safe
+to share and are kept copy-on-write.
+
+This module is imported by gunicorn.conf.py before the app, so it must
+stay free of heavy imports.
+"""
+
+import logging
+import math
+import os
+import sys
+from typing import Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# cgroup files holding the container CPU limit (v2, then v1)
+CGROUP_V2_CPU_MAX = "/sys/fs/cgroup/cpu.max"
+CGROUP_V1_CPU_QUOTA = "/sys/fs/cgroup/cpu/cpu.cfs_quota_us"
+CGROUP_V1_CPU_PERIOD = "/sys/fs/cgroup/cpu/cpu.cfs_period_us"
+
+# Workers per CPU: async workers only need ~1 per core, the second one
+# keeps requests flowing while a worker is busy with bcrypt or a large
+# serialization
+WORKERS_PER_CPU = 2
+MIN_WORKERS = 2
+
+# Module-level singletons dropped in forked workers: module -> attribute
+_PROCESS_SINGLETONS = {
+    "src.events.dapr_publisher": "_publisher_instance",
+    "src.events.kafka_producer": "_producer_instance",
+    "src.services.dapr_client": "_dapr_client_instance",
+}
+
+
+def _read(path: str) -> Optional[str]:
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def cpu_limit() -> float:
+    """
+    CPUs available to this container.
+
+    Checked in order: CPU_LIMIT_MILLICORES (set by the k8s manifests from
+    limits.cpu through the downward API), the cgroup v2/v1 CPU quota, then
+    the CPUs this process may run on.
+
+    Returns:
+        Number of CPUs, possibly fractional (e.g. 0.5 for a 500m limit)
+    """
+    millicores = os.getenv("CPU_LIMIT_MILLICORES")
+    if millicores:
+        return int(millicores) / 1000
+
+    cpu_max = _read(CGROUP_V2_CPU_MAX)
+    if cpu_max:
+        quota, _, period = cpu_max.partition(" ")
+        if quota != "max":
+            return int(quota) / int(period or 100000)
+    else:
+        quota = _read(CGROUP_V1_CPU_QUOTA)
+        period = _read(CGROUP_V1_CPU_PERIOD)
+        if quota and period and int(quota) > 0:
+            return int(quota) / int(period)
+
+    return len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+
+
+def default_worker_count() -> int:
+    """
+    Number of gunicorn workers: WEB_CONCURRENCY if set, otherwise
+    WORKERS_PER_CPU per CPU of the container limit (at least MIN_WORKERS).
+    """
+    configured = os.getenv("WEB_CONCURRENCY")
+    if configured:
+        return int(configured)
+    return max(MIN_WORKERS, math.ceil(cpu_limit() * WORKERS_PER_CPU))
+
+
+def _created_engines() -> List[Any]:
+    # Primary and read replica engines, if this process created them
+    from src.db.session import get_engine, get_read_engine
+
+    return [
+        getter() for getter in (get_engine, get_read_engine)
+        if getter.cache_info().currsize and getter() is not None
+    ]
+
+
+def reset_after_fork() -> None:
+    """
+    Drop per-process state inherited from the gunicorn master.
+
+    Called in each worker right after fork (gunicorn post_fork hook).
+    """
+    for engine in _created_engines():
+        # close=False: the connections belong to the master's pool
+        engine.dispose(close=False)
+
+    for module_name, attribute in _PROCESS_SINGLETONS.items():
+        module = sys.modules.get(module_name)
+        if module is not None:
+            setattr(module, attribute, None)
+
+
+async def shutdown_worker() -> None:
+    """
+    Release per-process resources when a worker stops (app lifespan).
+
+    Runs after in-flight requests have drained, so closing the clients and
+    the pool cannot cut off a request.
+    """
+    for module_name, shutdown in (
+        ("src.services.dapr_client", "shutdown_dapr_client"),
+        ("src.events.kafka_producer", "shutdown_kafka_producer"),
+    ):
+        module = sys.modules.get(module_name)
+        if module is not None:
+            try:
+                await getattr(module, shutdown)()
+            except Exception as e:
+                logger.warning(f"{shutdown} failed: {e}")
+
+    publisher = sys.modules.get("src.events.dapr_publisher")
+    if publisher is not None:
+        publisher._publisher_instance = None
+
+    for engine in _created_engines():
+        engine.dispose()
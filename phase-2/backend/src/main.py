@@ -4,31 +4,42 @@ FastAPI Backend - Main Application Entry Point
 Phase II Full-Stack Todo Application
 """
 
+import asyncio
+import hmac
+import importlib
 import logging
 import os
 import uuid
+from contextlib import asynccontextmanager
 from typing import Optional
 
 from dotenv import load_dotenv
-from fastapi import Depends, FastAPI, HTTPException, Request, status
+from fastapi import Depends, FastAPI, Header, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.middleware.base import BaseHTTPMiddleware
 from fastapi.responses import JSONResponse
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
 from sqlmodel import Session, select
+from todo_observability import metrics, tracing
 
-from src.api import auth, chat, health, tags, tasks
+from src import lifecycle, profiling, serialization
+from src.api import admin, auth, chat, health, tags, tasks
 from src.auth.dependencies import get_current_user
+from src.db import replica
 from src.db.session import get_session
+from src.middleware import (
+    HTTPSRedirectMiddleware,
+    QueryStatsMiddleware,
+    ReadReplicaMiddleware,
+    SecurityHeadersMiddleware,
+)
 from src.models.conversation import (
     Conversation,
     Message,
     MessageCreate,
 )
 from src.models.user import User
-from src.services.agent_service import AgentService
 
 # Load environment variables
 load_dotenv()
@@ -40,75 +51,29 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Initialize limiter
+limiter = Limiter(key_func=get_remote_address)
 
-class HTTPSRedirectMiddleware(BaseHTTPMiddleware):
-    """
-    Middleware to force HTTPS in redirect responses.
-
-    Railway's reverse proxy handles HTTPS but FastAPI's redirect_slashes
-    generates HTTP redirect URLs. This middleware fixes the Location header.
-    """
-
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
-
-        # Log ALL responses for debugging
-        logger.info(f"HTTPSRedirectMiddleware: {request.method} {request.url.path} → {response.status_code}")
-
-        # Fix redirect Location headers to use HTTPS
-        if response.status_code in (301, 302, 303, 307, 308):
-            location = response.headers.get("location", "")
-            logger.info(f"Redirect detected! Location header: {location}")
-            if location.startswith("http://"):
-                # Replace http:// with https://
-                fixed_location = location.replace("http://", "https://", 1)
-                response.headers["location"] = fixed_location
-                logger.info(f"✅ Fixed redirect: {location} → {fixed_location}")
-            else:
-                logger.info(f"⚠️ Location already HTTPS or empty: {location}")
-
-        return response
-
-
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    """
-    Middleware to add OWASP-recommended security headers.
-
-    Headers added:
-    - Strict-Transport-Security: Force HTTPS (HSTS)
-    - X-Content-Type-Options: Prevent MIME-type sniffing
-    - X-Frame-Options: Prevent clickjacking
-    - Content-Security-Policy: Mitigate XSS attacks
-    - X-XSS-Protection: Enable browser XSS protection
-    - Referrer-Policy: Control referrer information
-    """
-
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
-
-        # HSTS: Force HTTPS for 1 year (31536000 seconds)
-        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-
-        # Prevent MIME-type sniffing
-        response.headers["X-Content-Type-Options"] = "nosniff"
-
-        # Prevent clickjacking (deny iframe embedding)
-        response.headers["X-Frame-Options"] = "DENY"
-
-        # Content Security Policy - strict policy for API
-        response.headers["Content-Security-Policy"] = "default-src 'self'; frame-ancestors 'none'"
-
-        # Enable browser XSS protection (legacy, but still useful)
-        response.headers["X-XSS-Protection"] = "1; mode=block"
+# Import the agent stack (agents, openai) in the background once the app
+# has started, so neither startup nor the first chat request waits for it.
+# Set AGENT_PRELOAD=false on workers that only serve task endpoints.
+AGENT_PRELOAD = os.getenv("AGENT_PRELOAD", "true").lower() == "true"
 
-        # Referrer policy - strict for security
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
 
-        return response
+def _preload_agent_stack() -> None:
+    try:
+        importlib.import_module("src.services.agent_service")
+    except Exception as e:
+        logger.warning(f"Agent stack preload failed (retried on first chat request): {e}")
 
 
-# Initialize limiter
-limiter = Limiter(key_func=get_remote_address)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if AGENT_PRELOAD:
+        asyncio.get_running_loop().run_in_executor(None, _preload_agent_stack)
+    yield
+    # In-flight requests have drained (graceful shutdown), release clients and pool
+    await lifecycle.shutdown_worker()
 
 app = FastAPI(
     title="Phase II Todo API",
@@ -189,6 +154,10 @@ All endpoints are prefixed with `/api/`.
         },
     ],
     redirect_slashes=False,  # Disable automatic trailing slash redirects (breaks CORS)
+    default_response_class=serialization.JSONResponse,  # orjson-encoded responses
+    lifespan=lifespan,
+    # ?profile=1 admin check, only when profiling is enabled (see src/profiling.py)
+    dependencies=[Depends(profiling.authorize_request_profile)] if profiling.PROFILING_ENABLED else None,
 )
 
 # CORS Configuration from environment variables
@@ -212,6 +181,24 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-request SQL query count and time (Server-Timing header, metrics)
+app.add_middleware(QueryStatsMiddleware)
+
+# Read-your-writes for read replica routing, only with DATABASE_READ_URL
+if replica.READ_REPLICA_ENABLED:
+    app.add_middleware(ReadReplicaMiddleware)
+
+# Admin-only request profiling (?profile=1), off by default
+if profiling.PROFILING_ENABLED:
+    app.add_middleware(profiling.ProfilingMiddleware)
+
+# Request latency metrics (added last, so it wraps every other middleware)
+app.add_middleware(metrics.MetricsMiddleware)
+
+# Distributed tracing, enabled by OTEL_TRACES_EXPORTER (see
+# todo_observability.tracing); engines are traced where they are created
+tracing.configure_tracing("todo-backend", app=app)
+
 # TrustedHostMiddleware disabled for Railway deployment
 # Railway provides its own host validation at the load balancer level
 
@@ -266,6 +253,8 @@ app.include_router(auth.router)
 app.include_router(tasks.router)
 app.include_router(tags.router)
 app.include_router(chat.router)
+if profiling.PROFILING_ENABLED:
+    app.include_router(admin.router)
 
 
 @app.post("/api/{user_id}/chat", response_model=dict, status_code=status.HTTP_200_OK, tags=["chat"])
@@ -356,7 +345,9 @@ async def chat(
             {"role": msg.role, "content": msg.content} for msg in history_messages
         ]
 
-        # Process message through agent
+        # Process message through agent (the agent stack is imported on first use)
+        from src.services.agent_service import AgentService
+
         agent_service = AgentService(session)
         agent_result = await agent_service.process_user_message(
             user_id=str(current_user.id),
@@ -425,6 +416,36 @@ async def health_check():
     }
 
 
+def require_metrics_token(authorization: Optional[str] = Header(None)) -> None:
+    """
+    Restrict /metrics to scrapers holding METRICS_TOKEN.
+
+    The backend is publicly reachable, so /metrics is disabled (404) unless
+    METRICS_TOKEN is set. Prometheus sends it as a bearer token
+    (scrape config: authorization.credentials).
+
+    Raises:
+        HTTPException 404: If METRICS_TOKEN is not configured
+        HTTPException 401: If the bearer token is missing or wrong
+    """
+    expected = os.getenv("METRICS_TOKEN")
+    if not expected:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(token.encode(), expected.encode()):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid metrics token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+@app.get("/metrics", include_in_schema=False, dependencies=[Depends(require_metrics_token)])
+async def prometheus_metrics():
+    """Prometheus metrics (request latency, DB pool, events, LLM calls)"""
+    return metrics.metrics_response()
+
+
 if __name__ == "__main__":
     import uvicorn
 
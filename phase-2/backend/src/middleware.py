@@ -0,0 +1,209 @@
+"""
+HTTP Middleware
+
+Pure ASGI middleware applied to every request:
+- HTTPSRedirectMiddleware: rewrites http:// redirect Location headers
+- SecurityHeadersMiddleware: adds OWASP-recommended security headers
+- QueryStatsMiddleware: counts SQL queries per request (Server-Timing)
+- ReadReplicaMiddleware: read-your-writes for read replica routing
+
+All patch the `http.response.start` message in place instead of
+subclassing BaseHTTPMiddleware, which wraps every response in an extra
+task and memory stream. Response bodies pass through untouched, so
+streaming responses are not buffered.
+"""
+
+import logging
+import os
+import random
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import cookie_parser
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from todo_observability import metrics
+
+from src.db import query_stats, replica
+
+logger = logging.getLogger(__name__)
+
+# Fraction of requests logged (at DEBUG) by HTTPSRedirectMiddleware, e.g.
+# REQUEST_LOG_SAMPLE_RATE=0.01 logs about one request in a hundred
+REQUEST_LOG_SAMPLE_RATE = float(os.getenv("REQUEST_LOG_SAMPLE_RATE", "0"))
+
+REDIRECT_STATUS_CODES = frozenset((301, 302, 303, 307, 308))
+
+# Fail requests over their route's query budget instead of only logging
+# them (enabled by the test suite)
+QUERY_BUDGET_STRICT = os.getenv("QUERY_BUDGET_STRICT", "false").lower() == "true"
+
+# Headers added by SecurityHeadersMiddleware (replacing any set by the app)
+SECURITY_HEADERS = [
+    # HSTS: Force HTTPS for 1 year (31536000 seconds)
+    (b"strict-transport-security", b"max-age=31536000; includeSubDomains"),
+    # Prevent MIME-type sniffing
+    (b"x-content-type-options", b"nosniff"),
+    # Prevent clickjacking (deny iframe embedding)
+    (b"x-frame-options", b"DENY"),
+    # Content Security Policy - strict policy for API
+    (b"content-security-policy", b"default-src 'self'; frame-ancestors 'none'"),
+    # Enable browser XSS protection (legacy, but still useful)
+    (b"x-xss-protection", b"1; mode=block"),
+    # Referrer policy - strict for security
+    (b"referrer-policy", b"strict-origin-when-cross-origin"),
+]
+
+_SECURITY_HEADER_NAMES = frozenset(name for name, _ in SECURITY_HEADERS)
+
+
+class HTTPSRedirectMiddleware:
+    """
+    Middleware to force HTTPS in redirect responses.
+
+    Railway's reverse proxy handles HTTPS but FastAPI's redirect_slashes
+    generates HTTP redirect URLs. This middleware fixes the Location header.
+
+    Per-request logging is off by default; set REQUEST_LOG_SAMPLE_RATE and
+    enable DEBUG logging for this module to log a sample of requests.
+    """
+
+    def __init__(self, app: ASGIApp, sample_rate: float = REQUEST_LOG_SAMPLE_RATE):
+        self.app = app
+        self.sample_rate = sample_rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        log_request = (
+            self.sample_rate > 0
+            and random.random() < self.sample_rate
+            and logger.isEnabledFor(logging.DEBUG)
+        )
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if log_request:
+                    logger.debug(f"{scope['method']} {scope['path']} → {status_code}")
+
+                # Fix redirect Location headers to use HTTPS
+                if status_code in REDIRECT_STATUS_CODES:
+                    headers = MutableHeaders(scope=message)
+                    location = headers.get("location", "")
+                    if location.startswith("http://"):
+                        headers["location"] = "https://" + location[len("http://"):]
+                        logger.debug(f"Fixed redirect: {location} → {headers['location']}")
+
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+class SecurityHeadersMiddleware:
+    """
+    Middleware to add OWASP-recommended security headers.
+
+    Headers added:
+    - Strict-Transport-Security: Force HTTPS (HSTS)
+    - X-Content-Type-Options: Prevent MIME-type sniffing
+    - X-Frame-Options: Prevent clickjacking
+    - Content-Security-Policy: Mitigate XSS attacks
+    - X-XSS-Protection: Enable browser XSS protection
+    - Referrer-Policy: Control referrer information
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = [
+                    header
+                    for header in message.get("headers", ())
+                    if header[0].lower() not in _SECURITY_HEADER_NAMES
+                ]
+                headers.extend(SECURITY_HEADERS)
+                message["headers"] = headers
+
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+class QueryStatsMiddleware:
+    """
+    Middleware tracking SQL queries and database time per request.
+
+    Adds `Server-Timing: db;dur=<ms>;desc="<n> queries"` to responses,
+    records per-route query metrics and checks the route's declared
+    query_budget(). Over-budget requests are logged, or raise
+    QueryBudgetExceededError in strict mode so tests fail.
+
+    The header reflects queries run before the response starts; queries
+    of streaming responses after that are still counted in the metrics.
+    """
+
+    def __init__(self, app: ASGIApp, strict: bool = QUERY_BUDGET_STRICT):
+        self.app = app
+        self.strict = strict
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with query_stats.track_queries() as stats:
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    MutableHeaders(scope=message).append("Server-Timing", stats.server_timing())
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
+
+        route = metrics.route_template(scope)
+        metrics.DB_QUERIES_PER_REQUEST.labels(route).observe(stats.count)
+        metrics.DB_TIME_PER_REQUEST.labels(route).observe(stats.duration)
+
+        budget = query_stats.get_query_budget(getattr(scope.get("route"), "endpoint", None))
+        if budget is not None and stats.count > budget:
+            metrics.DB_QUERY_BUDGET_EXCEEDED.labels(route).inc()
+            message = f"{scope['method']} {route} ran {stats.count} queries (budget {budget})"
+            if self.strict:
+                raise query_stats.QueryBudgetExceededError(message)
+            logger.warning(f"Query budget exceeded: {message}")
+
+
+class ReadReplicaMiddleware:
+    """
+    Middleware keeping clients on the primary database right after a write.
+
+    Binds the request's read routing state (src/db/replica.py): requests
+    with the sticky cookie read from the primary, and requests that wrote
+    get the cookie, so their next reads see the write even if the replica
+    lags. Only installed when DATABASE_READ_URL is set.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        cookies = cookie_parser(Headers(scope=scope).get("cookie", ""))
+        with replica.route_reads(sticky=replica.STICKY_COOKIE in cookies) as routing:
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start" and routing.wrote:
+                    MutableHeaders(scope=message).append("Set-Cookie", replica.sticky_cookie())
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
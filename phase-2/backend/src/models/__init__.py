@@ -5,7 +5,8 @@ Contains all SQLModel database models.
 """
 
 from src.models.priority import Priority
-from src.models.tag import Tag, TagCreate, TagResponse, TagUpdate
+from src.models.sync import TaskChangesResponse, TaskTombstone, UserSyncState
+from src.models.tag import Tag, TagCreate, TagResponse, TagUpdate, TagWithCountResponse
 from src.models.task import Task, TaskCreate, TaskResponse, TaskToggleComplete, TaskUpdate
 from src.models.task_tag import TaskTag
 from src.models.user import User
@@ -17,10 +18,14 @@ __all__ = [
     "TaskUpdate",
     "TaskResponse",
     "TaskToggleComplete",
+    "TaskChangesResponse",
+    "TaskTombstone",
+    "UserSyncState",
     "TaskTag",
     "Tag",
     "TagCreate",
     "TagUpdate",
     "TagResponse",
+    "TagWithCountResponse",
     "Priority",
 ]
@@ -0,0 +1,84 @@
+"""
+Sync Models
+
+Per-user change sequence and delete tombstones backing the incremental
+sync feed (GET /api/tasks/changes).
+"""
+
+from datetime import datetime
+from typing import List
+
+from sqlalchemy import BigInteger, Index
+from sqlmodel import Field, SQLModel
+
+from src.models.task import TaskResponse
+
+
+class UserSyncState(SQLModel, table=True):
+    """
+    Per-user change counter.
+
+    Every write transaction touching a user's tasks increments change_seq
+    once and stamps the rows it changed with the new value. The counter row
+    stays locked until commit, so a user's writes commit in sequence order.
+    """
+
+    __tablename__ = "user_sync_state"
+
+    user_id: str = Field(
+        foreign_key="user.id",
+        primary_key=True,
+        description="Owner user ID",
+    )
+    change_seq: int = Field(
+        default=0,
+        sa_type=BigInteger,
+        description="Last change sequence value handed out",
+    )
+
+
+class TaskTombstone(SQLModel, table=True):
+    """
+    Record of a deleted task, so sync clients can drop it locally.
+    """
+
+    __tablename__ = "task_tombstones"
+    __table_args__ = (
+        Index("ix_task_tombstones_user_id_change_seq", "user_id", "change_seq"),
+    )
+
+    task_id: str = Field(
+        primary_key=True,
+        description="ID of the deleted task",
+    )
+    user_id: str = Field(
+        foreign_key="user.id",
+        description="Owner user ID",
+    )
+    change_seq: int = Field(
+        sa_type=BigInteger,
+        description="Change sequence value of the delete",
+    )
+    deleted_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        description="Deletion timestamp (UTC)",
+    )
+
+
+class TaskChangesResponse(SQLModel):
+    """Schema for GET /api/tasks/changes response"""
+
+    changes: List[TaskResponse]  # Created or updated since the cursor
+    deleted: List[str]  # IDs of tasks deleted since the cursor
+    since: int  # Cursor for the next request
+    has_more: bool  # More changes are pending; request again with `since`
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "changes": [],
+                "deleted": ["650e8400-e29b-41d4-a716-446655440002"],
+                "since": 42,
+                "has_more": False,
+            }
+        }
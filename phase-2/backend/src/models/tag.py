@@ -114,6 +114,11 @@ class Tag(TagBase, table=True):
         index=True,  # Index for fast user tag queries
         description="Owner user ID (foreign key to user table - Better Auth string ID)",
     )
+    # Maintained by TaskService whenever task-tag associations change
+    task_count: int = Field(
+        default=0,
+        description="Number of tasks carrying this tag",
+    )
 
     # Many-to-many relationship with tasks
     tasks: List["Task"] = Relationship(
@@ -224,3 +229,26 @@ class TagResponse(TagBase):
                 "user_id": "550e8400-e29b-41d4-a716-446655440000",
             }
         }
+
+
+class TagWithCountResponse(TagResponse):
+    """
+    Tag with its usage count (GET /api/tags?with_counts=true).
+
+    task_count is maintained incrementally, so listing counts does not
+    read task_tags.
+    """
+
+    task_count: int
+
+    class Config:
+        from_attributes = True
+        json_schema_extra = {
+            "example": {
+                "id": "750e8400-e29b-41d4-a716-446655440002",
+                "name": "work",
+                "color": "#3b82f6",
+                "user_id": "550e8400-e29b-41d4-a716-446655440000",
+                "task_count": 12,
+            }
+        }
@@ -8,7 +8,8 @@ import uuid
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import field_validator
+from pydantic import field_validator, model_validator
+from sqlalchemy import BigInteger, Index
 from sqlmodel import Field, Relationship, SQLModel
 
 from src.models.priority import Priority
@@ -66,6 +67,10 @@ class Task(TaskBase, table=True):
     """
 
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Incremental sync: tasks changed since a client's cursor
+        Index("ix_tasks_user_id_change_seq", "user_id", "change_seq"),
+    )
 
     # Better Auth uses string IDs (not UUIDs)
     id: str = Field(
@@ -102,6 +107,11 @@ class Task(TaskBase, table=True):
         default_factory=datetime.utcnow,
         description="Last update timestamp (UTC)",
     )
+    change_seq: int = Field(
+        default=0,
+        sa_type=BigInteger,
+        description="User change sequence value of the last write (see task_sync)",
+    )
 
     # Many-to-many relationship with tags
     tags: List["Tag"] = Relationship(
@@ -253,6 +263,7 @@ class TaskResponse(TaskBase):
     user_id: str  # UUID v4 as string (matches Better Auth)
     created_at: datetime
     updated_at: datetime
+    change_seq: int = 0  # Sync cursor value of the last change
     tags: List["TagResponse"] = []  # Associated tags
 
     class Config:
@@ -279,7 +290,133 @@ class TaskResponse(TaskBase):
         }
 
 
+class TaskSearchResult(TaskResponse):
+    """
+    Schema for a task search hit.
+
+    Adds the relevance score and a snippet with matches wrapped in
+    <mark> tags.
+    """
+
+    relevance: float
+    snippet: Optional[str] = None
+
+
+# Operations accepted by POST /api/tasks/batch
+BATCH_OPERATIONS = ("create", "update", "complete", "delete")
+
+# Maximum operations per batch request
+MAX_BATCH_OPERATIONS = 500
+
+
+class TaskBatchOperation(SQLModel):
+    """
+    One operation in a batch request.
+
+    - create: requires `create`
+    - update: requires `task_id` and `update`
+    - complete: requires `task_id`; `is_complete` defaults to true
+    - delete: requires `task_id`
+    """
+
+    op: str = Field(description="Operation (create, update, complete, delete)")
+    task_id: Optional[str] = Field(
+        default=None,
+        description="Target task ID (update, complete, delete)",
+    )
+    create: Optional[TaskCreate] = Field(
+        default=None,
+        description="New task fields (create)",
+    )
+    update: Optional[TaskUpdate] = Field(
+        default=None,
+        description="Fields to change (update)",
+    )
+    is_complete: bool = Field(
+        default=True,
+        description="New completion status (complete)",
+    )
+
+    @model_validator(mode="after")
+    def check_operation_fields(self) -> "TaskBatchOperation":
+        """Ensure each operation carries the fields it needs."""
+        if self.op not in BATCH_OPERATIONS:
+            raise ValueError(
+                f"Invalid operation '{self.op}'. Valid options: {', '.join(BATCH_OPERATIONS)}"
+            )
+        if self.op == "create" and self.create is None:
+            raise ValueError("create operation requires 'create'")
+        if self.op != "create" and not self.task_id:
+            raise ValueError(f"{self.op} operation requires 'task_id'")
+        if self.op == "update" and self.update is None:
+            raise ValueError("update operation requires 'update'")
+        return self
+
+
+class TaskBatchRequest(SQLModel):
+    """Schema for POST /api/tasks/batch"""
+
+    operations: List[TaskBatchOperation] = Field(
+        min_length=1,
+        max_length=MAX_BATCH_OPERATIONS,
+        description="Operations, applied in one transaction",
+    )
+    atomic: bool = Field(
+        default=False,
+        description="Apply nothing if any operation fails",
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "operations": [
+                    {"op": "create", "create": {"title": "Buy milk"}},
+                    {"op": "complete", "task_id": "650e8400-e29b-41d4-a716-446655440001"},
+                    {"op": "delete", "task_id": "650e8400-e29b-41d4-a716-446655440002"},
+                ],
+                "atomic": False,
+            }
+        }
+
+
+class TaskBatchItemResult(SQLModel):
+    """Result of one batch operation, in request order."""
+
+    index: int
+    op: str
+    status_code: int  # HTTP-style status of this item (200, 201, 204, 400, 403, 404, 409)
+    task_id: Optional[str] = None
+    task: Optional[TaskResponse] = None
+    error: Optional[str] = None
+    completed: bool = False  # This operation changed is_complete from False to True
+
+
+class TaskBatchResponse(SQLModel):
+    """Schema for POST /api/tasks/batch response"""
+
+    results: List[TaskBatchItemResult]
+    succeeded: int
+    failed: int
+    applied: bool  # False when an atomic batch was rejected
+
+
+class TaskImportError(SQLModel):
+    """A rejected line of a task import."""
+
+    line: int  # 1-based line number in the upload
+    error: str
+
+
+class TaskImportResult(SQLModel):
+    """Schema for POST /api/tasks/import response"""
+
+    imported: int
+    failed: int
+    errors: List[TaskImportError] = []  # First errors only (see MAX_IMPORT_ERRORS)
+
+
 # Forward reference for Tag model (circular import)
 from src.models.tag import Tag, TagResponse  # noqa: E402
 
 Task.model_rebuild()
+TaskBatchItemResult.model_rebuild()
@@ -0,0 +1,242 @@
+"""
+On-Demand Profiling
+
+Admin-only profiling of a live worker, off unless PROFILING_ENABLED=true.
+When disabled, main.py installs none of this, so requests pay nothing.
+
+- ?profile=1 on any request: the response is replaced by a pyinstrument
+  report of that request (HTML, or speedscope JSON with
+  ?profile=1&profile_format=speedscope). The response is buffered, so
+  do not use it on streaming endpoints.
+- GET /admin/profile?seconds=N (src/api/admin.py): sampled stacks of every
+  thread in the worker for N seconds, as a speedscope profile
+  (open it at https://www.speedscope.app)
+
+Both require an authenticated user whose email is listed in
+PROFILING_ADMIN_EMAILS (comma-separated).
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Tuple
+
+from fastapi import Depends, HTTPException, Request, status
+from sqlmodel import Session
+from starlette.datastructures import QueryParams
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.auth.dependencies import get_current_user
+from src.db.session import get_session
+from src.models.user import User
+from src.serialization import dumps
+
+PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "false").lower() == "true"
+
+PROFILING_ADMIN_EMAILS = frozenset(
+    email.strip().lower()
+    for email in os.getenv("PROFILING_ADMIN_EMAILS", "").split(",")
+    if email.strip()
+)
+
+# Query parameter enabling the per-request profile
+PROFILE_PARAM = "profile"
+PROFILE_FORMAT_PARAM = "profile_format"
+
+# Sampling intervals (seconds) for request profiles and worker profiles
+REQUEST_PROFILE_INTERVAL = 0.001
+WORKER_SAMPLE_INTERVAL = 0.005
+
+# Longest worker profile accepted by /admin/profile
+MAX_WORKER_PROFILE_SECONDS = 60
+
+# request.state key set once the profiling admin check passed
+_AUTHORIZED = "profile_authorized"
+
+_worker_profile_lock = asyncio.Lock()
+
+
+def is_profiling_admin(user: User) -> bool:
+    """Whether the user may profile workers (email in PROFILING_ADMIN_EMAILS)."""
+    return bool(user.email) and user.email.lower() in PROFILING_ADMIN_EMAILS
+
+
+def require_profiling_admin(current_user: User = Depends(get_current_user)) -> User:
+    """
+    FastAPI dependency allowing only profiling admins.
+
+    Raises:
+        HTTPException 403: If the user is not a profiling admin
+    """
+    if not is_profiling_admin(current_user):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Profiling is restricted to admins",
+        )
+    return current_user
+
+
+async def authorize_request_profile(
+    request: Request,
+    db_session: Session = Depends(get_session),
+) -> None:
+    """
+    App-wide dependency authorizing ?profile=1 for ProfilingMiddleware.
+
+    Requests without the parameter pass through. With it, the caller must
+    be a profiling admin (401/403 otherwise). The session is the request's
+    cached one, so routes using get_session share it.
+    """
+    if request.query_params.get(PROFILE_PARAM) != "1":
+        return
+    user = await get_current_user(request, db_session)
+    require_profiling_admin(user)
+    setattr(request.state, _AUTHORIZED, True)
+
+
+class ProfilingMiddleware:
+    """
+    Middleware replacing the response of ?profile=1 requests with a profile.
+
+    Only requests carrying the parameter are profiled and buffered; the
+    report is returned only if authorize_request_profile() accepted the
+    caller, otherwise the original response (e.g. 403) is sent.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or b"profile=" not in scope["query_string"]:
+            await self.app(scope, receive, send)
+            return
+
+        params = QueryParams(scope["query_string"])
+        if params.get(PROFILE_PARAM) != "1":
+            await self.app(scope, receive, send)
+            return
+
+        from pyinstrument import Profiler
+
+        # Shared with request.state, where the authorization flag is set
+        state = scope.setdefault("state", {})
+        messages: List[Message] = []
+
+        async def buffer(message: Message) -> None:
+            messages.append(message)
+
+        profiler = Profiler(interval=REQUEST_PROFILE_INTERVAL, async_mode="enabled")
+        profiler.start()
+        try:
+            await self.app(scope, receive, buffer)
+        finally:
+            profiler.stop()
+
+        if not state.get(_AUTHORIZED):
+            for message in messages:
+                await send(message)
+            return
+
+        if params.get(PROFILE_FORMAT_PARAM) == "speedscope":
+            from pyinstrument.renderers import SpeedscopeRenderer
+
+            response = Response(
+                profiler.output(SpeedscopeRenderer()), media_type="application/json"
+            )
+        else:
+            response = Response(profiler.output_html(), media_type="text/html")
+        await response(scope, receive, send)
+
+
+# ================== WORKER PROFILE ==================
+
+
+def sample_worker(seconds: float, interval: float = WORKER_SAMPLE_INTERVAL) -> Dict[str, Any]:
+    """
+    Sample the stacks of every thread in this process.
+
+    Runs in its own thread (the sampler skips itself), so the event loop
+    and threadpool keep serving requests while being sampled.
+
+    Args:
+        seconds: How long to sample
+        interval: Time between samples
+
+    Returns:
+        Speedscope file with one sampled profile per thread
+    """
+    sampler = threading.get_ident()
+    frame_ids: Dict[Tuple[str, str, int], int] = {}
+    frames: List[Dict[str, Any]] = []
+    samples: Dict[int, List[List[int]]] = {}
+    weights: Dict[int, List[float]] = {}
+
+    started = last = time.perf_counter()
+    deadline = started + seconds
+    while True:
+        now = time.perf_counter()
+        elapsed, last = now - last, now
+        for ident, frame in sys._current_frames().items():
+            if ident == sampler:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                key = (code.co_qualname, code.co_filename, code.co_firstlineno)
+                frame_id = frame_ids.get(key)
+                if frame_id is None:
+                    frame_id = frame_ids[key] = len(frames)
+                    frames.append({"name": key[0], "file": key[1], "line": key[2]})
+                stack.append(frame_id)
+                frame = frame.f_back
+            stack.reverse()
+            samples.setdefault(ident, []).append(stack)
+            weights.setdefault(ident, []).append(elapsed)
+        if now >= deadline:
+            break
+        time.sleep(interval)
+
+    thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+    duration = time.perf_counter() - started
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "name": f"worker {os.getpid()} ({seconds:g}s)",
+        "exporter": "todo-backend",
+        "shared": {"frames": frames},
+        "profiles": [
+            {
+                "type": "sampled",
+                "name": thread_names.get(ident, str(ident)),
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": duration,
+                "samples": samples[ident],
+                "weights": weights[ident],
+            }
+            for ident in samples
+        ],
+    }
+
+
+async def profile_worker(seconds: float) -> Response:
+    """
+    Worker profile as a speedscope download (one profile at a time).
+
+    Raises:
+        HTTPException 409: If a worker profile is already running
+    """
+    if _worker_profile_lock.locked():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A worker profile is already running",
+        )
+    async with _worker_profile_lock:
+        profile = await asyncio.to_thread(sample_worker, seconds)
+    return Response(
+        dumps(profile),
+        media_type="application/json",
+        headers={"Content-Disposition": f'attachment; filename="worker-{os.getpid()}.speedscope.json"'},
+    )
@@ -0,0 +1,106 @@
+"""
+JSON Serialization
+
+Project-wide JSON encoding for API responses and event payloads:
+- dumps(): orjson-backed encoding to UTF-8 bytes (stdlib json fallback)
+- JSONResponse: default FastAPI response class rendering with dumps()
+- model_response(): validates and encodes response models in one pass,
+  skipping FastAPI's response_model round trip
+
+orjson is a required dependency; the stdlib fallback keeps tooling that
+imports the app without it (scripts, partial environments) working.
+"""
+
+import json
+from datetime import date, datetime, time
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from pydantic import TypeAdapter
+from starlette.responses import JSONResponse as StarletteJSONResponse
+from starlette.responses import Response
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """Encode types neither encoder handles natively (matches orjson for dates)."""
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    return str(obj)
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Encode an object as compact UTF-8 JSON.
+
+    datetime/date/time values are encoded as ISO 8601 strings and other
+    unsupported types (UUID, Decimal, ...) with str().
+
+    Args:
+        obj: JSON-compatible object (dicts, lists, scalars, datetimes)
+
+    Returns:
+        Encoded JSON bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        obj, default=_default, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class JSONResponse(StarletteJSONResponse):
+    """
+    JSON response rendered with dumps().
+
+    Installed as the app's default_response_class, so every endpoint
+    without an explicit response class is encoded with orjson.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+@lru_cache(maxsize=None)
+def _type_adapter(response_type: Any) -> TypeAdapter:
+    """Cached TypeAdapter per response type (building one compiles a serializer)."""
+    return TypeAdapter(response_type)
+
+
+def model_response(
+    content: Any,
+    response_type: Any,
+    status_code: int = 200,
+    headers: Optional[Dict[str, str]] = None,
+) -> Response:
+    """
+    Build a JSON response for a response model type in a single pass.
+
+    FastAPI validates an endpoint's return value against response_model,
+    converts it to Python primitives and only then encodes it. This
+    validates content once with a cached TypeAdapter (ORM rows via
+    from_attributes; already built models of the type pass through
+    without re-validation) and lets pydantic's serializer write the JSON
+    directly, with the same output as the response_model path. Keep
+    response_model on the route for the OpenAPI schema.
+
+    Args:
+        content: ORM rows or model instances for response_type
+        response_type: Response model type, e.g. List[TaskResponse]
+        status_code: HTTP status code
+        headers: Extra response headers
+
+    Returns:
+        Response with the serialized body
+    """
+    adapter = _type_adapter(response_type)
+    return Response(
+        content=adapter.dump_json(adapter.validate_python(content, from_attributes=True)),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
@@ -11,6 +11,7 @@ Based on Phase III Agent Behavior Specification.
 import json
 import logging
 import re
+import time
 import uuid
 from dataclasses import dataclass
 from datetime import datetime
@@ -18,9 +19,26 @@ from typing import Any, Optional
 
 import os
 
-from agents import Agent, ModelProvider, OpenAIChatCompletionsModel, RunConfig, RunContextWrapper, Runner, function_tool
+from agents import (
+    Agent,
+    AgentSpanData,
+    FunctionSpanData,
+    GenerationSpanData,
+    ModelProvider,
+    OpenAIChatCompletionsModel,
+    RunConfig,
+    RunContextWrapper,
+    Runner,
+    TracingProcessor,
+    function_tool,
+    set_trace_processors,
+)
 from openai import AsyncOpenAI
+from opentelemetry import context as otel_context
+from opentelemetry import trace as otel_trace
 from sqlmodel import Session
+from todo_observability import metrics
+from todo_observability.tracing import tracer, tracing_enabled
 
 from src.models.conversation import Message
 from src.services.mcp_tools import MCPToolsService
@@ -667,6 +685,70 @@ class GeminiModelProvider(ModelProvider):
         )
 
 
+class OpenTelemetryTraceProcessor(TracingProcessor):
+    """
+    Agents SDK trace processor re-emitting agent runs as OpenTelemetry spans.
+
+    Each run, agent, LLM generation and tool call becomes a span of the
+    current request's trace, so SQL queries made by a tool nest under it.
+    Tool inputs and outputs are not recorded (they carry user data).
+    Installed below in place of the SDK's default OpenAI exporter when
+    tracing is enabled.
+    """
+
+    def __init__(self, otel_tracer: Optional[otel_trace.Tracer] = None):
+        self._tracer = otel_tracer or tracer
+        self._spans: dict[str, tuple[otel_trace.Span, object]] = {}
+
+    def on_trace_start(self, trace) -> None:
+        self._start(trace.trace_id, f"agent_run {trace.name}", {})
+
+    def on_trace_end(self, trace) -> None:
+        self._end(trace.trace_id, None)
+
+    def on_span_start(self, span) -> None:
+        data = span.span_data
+        if isinstance(data, FunctionSpanData):
+            name, attributes = f"execute_tool {data.name}", {"gen_ai.tool.name": data.name}
+        elif isinstance(data, GenerationSpanData):
+            name, attributes = f"chat {data.model}", {"gen_ai.request.model": data.model or ""}
+        elif isinstance(data, AgentSpanData):
+            name, attributes = f"invoke_agent {data.name}", {"gen_ai.agent.name": data.name}
+        else:
+            name, attributes = f"agent {data.type}", {}
+        self._start(span.span_id, name, attributes)
+
+    def on_span_end(self, span) -> None:
+        self._end(span.span_id, span.error)
+
+    def shutdown(self) -> None:
+        self._spans.clear()
+
+    def force_flush(self) -> None:
+        pass
+
+    def _start(self, key: str, name: str, attributes: dict) -> None:
+        otel_span = self._tracer.start_span(name, attributes=attributes)
+        token = otel_context.attach(otel_trace.set_span_in_context(otel_span))
+        self._spans[key] = (otel_span, token)
+
+    def _end(self, key: str, error) -> None:
+        entry = self._spans.pop(key, None)
+        if entry is None:
+            return
+        otel_span, token = entry
+        if error:
+            otel_span.set_status(otel_trace.Status(otel_trace.StatusCode.ERROR, error.get("message")))
+        otel_context.detach(token)
+        otel_span.end()
+
+
+# Re-emit agent runs as OpenTelemetry spans instead of sending them to the
+# OpenAI traces API (see todo_observability.tracing)
+if tracing_enabled():
+    set_trace_processors([OpenTelemetryTraceProcessor()])
+
+
 class AgentService:
     """
     Service for managing OpenAI Agent interactions with MCP tools.
@@ -1320,6 +1402,7 @@ IMPORTANT: Use the conversation history above to understand what the user is ref
         result = None
         last_error = None
         for model_name in self.MODELS:
+            started = time.perf_counter()
             try:
                 logger.info(f"Trying model: {model_name}")
                 # Create agent and config for this specific model
@@ -1338,9 +1421,11 @@ IMPORTANT: Use the conversation history above to understand what the user is ref
                     context=context,
                     run_config=run_config,
                 )
+                metrics.LLM_REQUEST_DURATION.labels(model_name, "success").observe(time.perf_counter() - started)
                 logger.info(f"Model {model_name} succeeded")
                 break  # Success, stop trying
             except Exception as model_err:
+                metrics.LLM_REQUEST_DURATION.labels(model_name, "error").observe(time.perf_counter() - started)
                 err_str = str(model_err).lower()
                 last_error = model_err
                 # Retry on rate limit or model not found errors
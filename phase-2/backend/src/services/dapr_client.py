@@ -8,13 +8,14 @@ Wrapper for Dapr sidecar HTTP API:
 - Service-to-service invocation
 """
 
-import json
 import logging
 import os
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import httpx
 
+from src.serialization import dumps
+
 logger = logging.getLogger(__name__)
 
 
@@ -76,7 +77,7 @@ class DaprClient:
         try:
             response = await self.client.post(
                 url,
-                json=data,
+                content=dumps(data),
                 headers={"Content-Type": "application/json"},
                 params=metadata or {},
             )
@@ -97,6 +98,66 @@ class DaprClient:
             logger.error(f"Unexpected error publishing event: {e}", exc_info=True)
             return False
 
+    async def publish_events_bulk(
+        self,
+        pubsub_name: str,
+        topic: str,
+        events: List[Dict[str, Any]],
+        metadata: Optional[Dict[str, str]] = None,
+    ) -> bool:
+        """
+        Publish many events to a Kafka topic in a single Dapr request.
+
+        Uses the Dapr bulk publish API so a batch of N events costs one
+        sidecar round-trip instead of N.
+
+        Args:
+            pubsub_name: Pub/sub component name (e.g., 'kafka-pubsub')
+            topic: Topic name (e.g., 'reminders')
+            events: List of event payloads (JSON-serializable)
+            metadata: Optional metadata applied to the whole batch
+
+        Returns:
+            True if every entry was published, False otherwise
+        """
+        if not events:
+            return True
+
+        url = f"{self.base_url}/v1.0-alpha1/publish/bulk/{pubsub_name}/{topic}"
+
+        entries = [
+            {
+                "entryId": str(index),
+                "event": event,
+                "contentType": "application/json",
+            }
+            for index, event in enumerate(events)
+        ]
+
+        try:
+            response = await self.client.post(
+                url,
+                content=dumps(entries),
+                headers={"Content-Type": "application/json"},
+                params=metadata or {},
+            )
+
+            if response.status_code == 204:
+                logger.debug(f"Bulk published {len(events)} events to {topic} via Dapr")
+                return True
+            else:
+                logger.error(
+                    f"Failed to bulk publish events: {response.status_code} {response.text}"
+                )
+                return False
+
+        except httpx.HTTPError as e:
+            logger.error(f"HTTP error bulk publishing events: {e}")
+            return False
+        except Exception as e:
+            logger.error(f"Unexpected error bulk publishing events: {e}", exc_info=True)
+            return False
+
     async def subscribe_to_topic(
         self,
         pubsub_name: str,
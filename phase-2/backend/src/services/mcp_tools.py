@@ -10,10 +10,13 @@ import json
 import uuid
 from typing import Any, Optional
 
-from sqlalchemy import func
+from sqlalchemy import func, update
 from sqlmodel import Session, select
 
+from src.models.tag import Tag
 from src.models.task import Task
+from src.models.task_tag import TaskTag
+from src.services import task_sync
 
 
 class MCPToolsService:
@@ -70,6 +73,7 @@ class MCPToolsService:
                 title=title.strip(),
                 description=description.strip() if description else None,
                 is_complete=False,
+                change_seq=task_sync.next_change_seq(self.session, user_id),
             )
 
             self.session.add(task)
@@ -190,6 +194,7 @@ class MCPToolsService:
 
             # Mark as complete
             task.is_complete = True
+            task.change_seq = task_sync.next_change_seq(self.session, user_id)
             self.session.add(task)
             self.session.commit()
             self.session.refresh(task)
@@ -246,8 +251,24 @@ class MCPToolsService:
                     "error": "Not authorized to access this task",
                 }
 
-            # Delete task
+            # Delete task-tag associations, keeping the tags' task_count in sync
+            task_tags = self.session.exec(
+                select(TaskTag).where(TaskTag.task_id == task_id_str)
+            ).all()
+            if task_tags:
+                self.session.execute(
+                    update(Tag)
+                    .where(Tag.id.in_([tt.tag_id for tt in task_tags]))
+                    .values(task_count=Tag.task_count - 1)
+                )
+            for tt in task_tags:
+                self.session.delete(tt)
+
+            # Delete task, leaving a tombstone for sync clients
             self.session.delete(task)
+            task_sync.record_tombstones(
+                self.session, user_id, [task_id_str], task_sync.next_change_seq(self.session, user_id)
+            )
             self.session.commit()
 
             return {
@@ -326,6 +347,8 @@ class MCPToolsService:
             if is_complete is not None:
                 task.is_complete = is_complete
 
+            task.change_seq = task_sync.next_change_seq(self.session, user_id)
+
             # Save changes
             self.session.add(task)
             self.session.commit()
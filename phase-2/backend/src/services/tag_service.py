@@ -11,8 +11,11 @@ from typing import List, Optional
 from fastapi import Depends, HTTPException
 from sqlmodel import Session, select
 
+from src.db.replica import replica_read
 from src.db.session import get_session
 from src.models.tag import Tag, TagCreate, TagUpdate
+from src.models.task_tag import TaskTag
+from src.services import task_sync
 
 
 class TagService:
@@ -84,31 +87,59 @@ class TagService:
             user_id=user_id,
         )
 
-        # Persist to database
+        # Persist to database (advancing the version behind tag list ETags)
         self.session.add(tag)
+        task_sync.next_change_seq(self.session, user_id)
         self.session.commit()
         self.session.refresh(tag)
 
         return tag
 
-    async def get_user_tags(self, user_id: str) -> List[Tag]:
+    @replica_read
+    async def get_user_tags(self, user_id: str, sort_by: str = "name") -> List[Tag]:
         """
         Get all tags for user.
 
+        Tags carry their maintained task_count, so usage counts come from
+        this single query on ix_tags_user_id.
+
         Args:
             user_id: User ID to get tags for
+            sort_by: "name" (alphabetically) or "task_count" (most used
+                first, then by name)
 
         Returns:
-            List of Tag objects sorted by name (alphabetically)
+            List of Tag objects
+
+        Raises:
+            ValueError: If sort_by is invalid
 
         Example:
             tags = await service.get_user_tags(user_id)
         """
-        query = select(Tag).where(Tag.user_id == user_id).order_by(Tag.name)
+        if sort_by == "name":
+            order = (Tag.name,)
+        elif sort_by == "task_count":
+            order = (Tag.task_count.desc(), Tag.name)
+        else:
+            raise ValueError(
+                f"Invalid sort field '{sort_by}'. Valid options: name, task_count"
+            )
+
+        query = select(Tag).where(Tag.user_id == user_id).order_by(*order)
 
         tags = self.session.exec(query).all()
         return list(tags)
 
+    @replica_read
+    async def get_version(self, user_id: str) -> int:
+        """
+        Current change sequence value of the user's tags and tasks.
+
+        Tag writes and task writes that change tag counts advance it.
+        """
+        return task_sync.current_change_seq(self.session, user_id)
+
     async def get_tag(self, tag_id: str, user_id: str) -> Tag:
         """
         Get single tag with ownership verification.
@@ -191,6 +222,10 @@ class TagService:
         if tag_data.color is not None:
             tag.color = tag_data.color
 
+        # Tasks embed their tags, so sync clients must refetch tagged tasks
+        if self.session.is_modified(tag):
+            self._touch_tagged_tasks(tag_id, user_id)
+
         # Persist changes
         self.session.add(tag)
         self.session.commit()
@@ -218,10 +253,21 @@ class TagService:
         # Get tag with ownership check
         tag = await self.get_tag(tag_id, user_id)
 
+        # Tagged tasks change for sync clients (before associations go)
+        self._touch_tagged_tasks(tag_id, user_id)
+
         # Delete from database (cascade will handle task_tags)
         self.session.delete(tag)
         self.session.commit()
 
+    def _touch_tagged_tasks(self, tag_id: str, user_id: str) -> None:
+        """Stamp every task carrying a tag with a new change sequence value."""
+        task_sync.touch_tasks(
+            self.session,
+            select(TaskTag.task_id).where(TaskTag.tag_id == tag_id),
+            task_sync.next_change_seq(self.session, user_id),
+        )
+
     async def get_or_create_tag(
         self, name: str, color: str, user_id: str
     ) -> Tag:
@@ -0,0 +1,116 @@
+"""
+Task Search
+
+Keyword search over task title and description:
+- PostgreSQL: generated tsvector column (tasks.search_vector) with a GIN
+  index, websearch_to_tsquery parsing, ts_rank relevance and ts_headline
+  snippets
+- Other databases (SQLite in tests): case-insensitive ILIKE match with a
+  title-first relevance and snippets highlighted in Python
+
+The search_vector column is created by migration 20260301_task_search_vector
+and is not part of the Task model, so it is referenced by name.
+"""
+
+import re
+from typing import Optional, Tuple
+
+from sqlalchemy import Float, case, func, literal, literal_column
+from sqlmodel import Session
+
+from src.models.task import Task
+
+# Text search configuration used for the generated column and queries
+SEARCH_CONFIG = "english"
+
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_STOP = "</mark>"
+
+# Approximate snippet length (characters) for the ILIKE fallback
+SNIPPET_LENGTH = 160
+
+_HEADLINE_OPTIONS = (
+    f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_STOP}, "
+    "MaxFragments=2, MaxWords=20, MinWords=5, FragmentDelimiter= ... "
+)
+
+_search_vector = literal_column("tasks.search_vector")
+
+
+def uses_full_text(session: Session) -> bool:
+    """Whether the session's database supports tsvector search."""
+    return session.get_bind().dialect.name == "postgresql"
+
+
+def apply_search(query, session: Session, text: str) -> Tuple[object, object]:
+    """
+    Filter a Task query by a search string.
+
+    Args:
+        query: Select statement over Task
+        session: Database session (selects the search strategy)
+        text: User search input (websearch syntax on PostgreSQL:
+              quoted phrases, OR, -exclusion)
+
+    Returns:
+        (filtered query, relevance expression - higher is more relevant)
+    """
+    if uses_full_text(session):
+        ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, text)
+        query = query.where(_search_vector.op("@@")(ts_query))
+        return query, func.ts_rank(_search_vector, ts_query)
+
+    pattern = f"%{text}%"
+    title_match = Task.title.ilike(pattern)
+    query = query.where(title_match | Task.description.ilike(pattern))
+    relevance = case((title_match, literal(1.0, Float)), else_=literal(0.5, Float))
+    return query, relevance
+
+
+def snippet_expression(session: Session, text: str):
+    """
+    SQL expression producing a highlighted snippet, or None when snippets
+    are built in Python (see highlight_snippet).
+    """
+    if not uses_full_text(session):
+        return None
+
+    return func.ts_headline(
+        SEARCH_CONFIG,
+        func.concat_ws(" ", Task.title, Task.description),
+        func.websearch_to_tsquery(SEARCH_CONFIG, text),
+        _HEADLINE_OPTIONS,
+    )
+
+
+def highlight_snippet(task: Task, text: str) -> Optional[str]:
+    """
+    Build a highlighted snippet around the first match of text (fallback).
+
+    Args:
+        task: Matching task
+        text: Search input
+
+    Returns:
+        Snippet with matches wrapped in <mark> tags, or None if no match
+    """
+    pattern = re.compile(re.escape(text.strip()), re.IGNORECASE)
+
+    for source in (task.description, task.title):
+        if not source:
+            continue
+        match = pattern.search(source)
+        if not match:
+            continue
+
+        start = max(0, match.start() - SNIPPET_LENGTH // 2)
+        end = min(len(source), start + SNIPPET_LENGTH)
+        fragment = pattern.sub(
+            lambda m: f"{HIGHLIGHT_START}{m.group(0)}{HIGHLIGHT_STOP}",
+            source[start:end],
+        )
+        prefix = "..." if start > 0 else ""
+        suffix = "..." if end < len(source) else ""
+        return f"{prefix}{fragment}{suffix}"
+
+    return None
@@ -6,17 +6,41 @@ Follows "fat services" pattern - all business logic lives here.
 """
 
 import uuid
+from collections import Counter, defaultdict
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from fastapi import Depends, HTTPException
-from sqlmodel import Session, select
+from sqlalchemy import delete, insert, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlmodel import Session, func, select
 
+from src.db.replica import replica_read
 from src.db.session import get_session
 from src.models.priority import Priority
 from src.models.tag import Tag
-from src.models.task import Task, TaskCreate, TaskUpdate
+from src.models.task import (
+    Task,
+    TaskBatchItemResult,
+    TaskBatchOperation,
+    TaskCreate,
+    TaskImportError,
+    TaskImportResult,
+    TaskResponse,
+    TaskUpdate,
+)
 from src.models.task_tag import TaskTag
+from src.services import task_search, task_sync, task_transfer
+
+# Rows fetched per server-side cursor round-trip when exporting
+EXPORT_BATCH_SIZE = 1000
+
+# Rows per multi-row INSERT when importing
+IMPORT_BATCH_SIZE = 1000
+
+# Maximum per-line errors reported by an import
+MAX_IMPORT_ERRORS = 100
 
 
 class TaskService:
@@ -95,29 +119,27 @@ class TaskService:
             user_id=user_id,
             created_at=datetime.utcnow(),
             updated_at=datetime.utcnow(),
+            change_seq=task_sync.next_change_seq(self.session, user_id),
         )
 
-        # Persist to database
+        # Persist task and tag associations in one transaction
         self.session.add(task)
+        if tags:
+            added = self._insert_task_tags([(task.id, tag.id) for tag in tags])
+            self._adjust_tag_counts(added, 1)
         self.session.commit()
         self.session.refresh(task)
 
-        # Associate tags
-        if tags:
-            for tag in tags:
-                task_tag = TaskTag(task_id=task.id, tag_id=tag.id)
-                self.session.add(task_tag)
-            self.session.commit()
-            self.session.refresh(task)
-
         return task
 
+    @replica_read
     async def get_user_tasks(
         self,
         user_id: str,
         is_complete: Optional[bool] = None,
         priority: Optional[int] = None,
         tag_ids: Optional[List[str]] = None,
+        tag_match: str = "all",
         search: Optional[str] = None,
         due_date_before: Optional[datetime] = None,
         due_date_after: Optional[datetime] = None,
@@ -133,11 +155,15 @@ class TaskService:
             user_id: User ID to get tasks for
             is_complete: Optional completion status filter
             priority: Optional priority filter (1=low, 2=medium, 3=high)
-            tag_ids: Optional list of tag IDs to filter by (tasks must have ALL tags)
+            tag_ids: Optional list of tag IDs to filter by
+            tag_match: "all" - tasks must have every tag (default),
+                "any" - tasks must have at least one of the tags
             search: Optional search query for title/description
+                (full-text on PostgreSQL, see task_search)
             due_date_before: Optional due date upper bound
             due_date_after: Optional due date lower bound
-            sort_by: Field to sort by (created_at, due_date, priority, title)
+            sort_by: Field to sort by (created_at, due_date, priority, title,
+                relevance - best search match first, requires search)
             sort_order: Sort direction (asc or desc)
             limit: Maximum tasks to return (default: 50)
             offset: Number of tasks to skip (default: 0)
@@ -171,11 +197,9 @@ class TaskService:
             query = query.where(Task.priority == priority)
 
         # Apply search filter (title or description)
+        relevance = None
         if search:
-            search_term = f"%{search}%"
-            query = query.where(
-                (Task.title.ilike(search_term)) | (Task.description.ilike(search_term))
-            )
+            query, relevance = task_search.apply_search(query, self.session, search)
 
         # Apply due date filters
         if due_date_before:
@@ -183,35 +207,125 @@ class TaskService:
         if due_date_after:
             query = query.where(Task.due_date >= due_date_after)
 
-        # Apply tag filter (tasks must have ALL specified tags)
+        # Apply tag filter (ALL or ANY of the specified tags)
         if tag_ids:
-            for tag_id in tag_ids:
-                # Subquery to check if task has this tag
-                tag_subquery = select(TaskTag).where(
-                    TaskTag.task_id == Task.id,
-                    TaskTag.tag_id == tag_id
-                )
-                query = query.where(tag_subquery.exists())
+            query = self._apply_tag_filter(query, tag_ids, tag_match)
 
-        # Apply sorting
-        sort_field = self._get_sort_field(sort_by)
-        if sort_order == "desc":
-            query = query.order_by(sort_field.desc())
+        # Apply sorting (relevance is always best match first)
+        if sort_by == "relevance":
+            if relevance is not None:
+                query = query.order_by(relevance.desc())
+            query = query.order_by(Task.created_at.desc())
         else:
-            query = query.order_by(sort_field.asc())
+            sort_field = self._get_sort_field(sort_by)
+            if sort_order == "desc":
+                query = query.order_by(sort_field.desc())
+            else:
+                query = query.order_by(sort_field.asc())
 
         # Apply pagination
         query = query.limit(limit).offset(offset)
 
-        # Execute query with eager loading of tags
-        tasks = self.session.exec(query).all()
+        tasks = list(self.session.exec(query).all())
+        self._load_tags(tasks)
 
-        # Manually load tags for each task (SQLModel limitation)
-        for task in tasks:
-            tag_query = select(Tag).join(TaskTag).where(TaskTag.task_id == task.id)
-            task.tags = list(self.session.exec(tag_query).all())
+        return tasks
+
+    @replica_read
+    async def search_tasks(
+        self,
+        user_id: str,
+        search: str,
+        is_complete: Optional[bool] = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> List[Tuple[Task, float, Optional[str]]]:
+        """
+        Search user's tasks, best match first, with highlighted snippets.
+
+        On PostgreSQL this uses the GIN-indexed search_vector column with
+        ts_rank ordering and ts_headline snippets; elsewhere it falls back
+        to ILIKE matching and snippets built in Python.
+
+        Args:
+            user_id: User ID to search within
+            search: Search query (websearch syntax on PostgreSQL)
+            is_complete: Optional completion status filter
+            limit: Maximum results to return (default: 20)
+            offset: Number of results to skip (default: 0)
+
+        Returns:
+            List of (task, relevance, snippet) tuples; snippets wrap matches
+            in <mark> tags
+        """
+        query, relevance = task_search.apply_search(
+            select(Task).where(Task.user_id == user_id), self.session, search
+        )
+        snippet = task_search.snippet_expression(self.session, search)
+
+        columns = [relevance.label("relevance")]
+        if snippet is not None:
+            columns.append(snippet.label("snippet"))
+        query = query.add_columns(*columns)
+
+        if is_complete is not None:
+            query = query.where(Task.is_complete == is_complete)
+
+        query = (
+            query.order_by(relevance.desc(), Task.created_at.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+
+        rows = self.session.execute(query).all()
+        self._load_tags(row[0] for row in rows)
+
+        results = []
+        for row in rows:
+            task = row[0]
+            task_snippet = (
+                row[2] if snippet is not None
+                else task_search.highlight_snippet(task, search)
+            )
+            results.append((task, float(row[1]), task_snippet))
+
+        return results
+
+    def _apply_tag_filter(self, query, tag_ids: List[str], tag_match: str = "all"):
+        """
+        Restrict a Task query to tasks carrying the given tags.
+
+        Uses a single semi-join on task_tags regardless of how many tags
+        are requested (served by the (tag_id, task_id) index):
+        - all: task_id IN (SELECT task_id ... WHERE tag_id IN (...)
+               GROUP BY task_id HAVING count(*) = n)
+        - any: task_id IN (SELECT task_id ... WHERE tag_id IN (...))
+
+        Args:
+            query: Select statement over Task
+            tag_ids: Tag IDs to filter by (duplicates ignored)
+            tag_match: "all" or "any"
+
+        Returns:
+            Filtered select statement
+
+        Raises:
+            ValueError: If tag_match is invalid
+        """
+        if tag_match not in ("all", "any"):
+            raise ValueError(
+                f"Invalid tag match '{tag_match}'. Valid options: all, any"
+            )
+
+        unique_ids = list(dict.fromkeys(tag_ids))
+        tagged = select(TaskTag.task_id).where(TaskTag.tag_id.in_(unique_ids))
 
-        return list(tasks)
+        if tag_match == "all" and len(unique_ids) > 1:
+            tagged = tagged.group_by(TaskTag.task_id).having(
+                func.count() == len(unique_ids)
+            )
+
+        return query.where(Task.id.in_(tagged))
 
     def _get_sort_field(self, sort_by: str):
         """
@@ -236,17 +350,20 @@ class TaskService:
 
         if sort_by not in valid_fields:
             raise ValueError(
-                f"Invalid sort field '{sort_by}'. Valid options: {', '.join(valid_fields.keys())}"
+                f"Invalid sort field '{sort_by}'. "
+                f"Valid options: {', '.join(valid_fields.keys())}, relevance"
             )
 
         return valid_fields[sort_by]
 
+    @replica_read
     async def count_user_tasks(
         self,
         user_id: str,
         is_complete: Optional[bool] = None,
         priority: Optional[int] = None,
         tag_ids: Optional[List[str]] = None,
+        tag_match: str = "all",
         search: Optional[str] = None,
         due_date_before: Optional[datetime] = None,
         due_date_after: Optional[datetime] = None,
@@ -259,6 +376,7 @@ class TaskService:
             is_complete: Optional completion status filter
             priority: Optional priority filter
             tag_ids: Optional list of tag IDs to filter by
+            tag_match: "all" or "any" of tag_ids (see get_user_tasks)
             search: Optional search query
             due_date_before: Optional due date upper bound
             due_date_after: Optional due date lower bound
@@ -266,8 +384,6 @@ class TaskService:
         Returns:
             Total count of matching tasks
         """
-        from sqlmodel import func
-
         # Build base query (same as get_user_tasks)
         query = select(Task).where(Task.user_id == user_id)
 
@@ -278,10 +394,7 @@ class TaskService:
             query = query.where(Task.priority == priority)
 
         if search:
-            search_term = f"%{search}%"
-            query = query.where(
-                (Task.title.ilike(search_term)) | (Task.description.ilike(search_term))
-            )
+            query, _ = task_search.apply_search(query, self.session, search)
 
         if due_date_before:
             query = query.where(Task.due_date <= due_date_before)
@@ -289,17 +402,70 @@ class TaskService:
             query = query.where(Task.due_date >= due_date_after)
 
         if tag_ids:
-            for tag_id in tag_ids:
-                tag_subquery = select(TaskTag).where(
-                    TaskTag.task_id == Task.id,
-                    TaskTag.tag_id == tag_id
-                )
-                query = query.where(tag_subquery.exists())
+            query = self._apply_tag_filter(query, tag_ids, tag_match)
 
         # Count
         count_query = select(func.count()).select_from(query.subquery())
         return self.session.exec(count_query).one()
 
+    @replica_read
+    async def get_changes(
+        self,
+        user_id: str,
+        since: int = 0,
+        limit: int = task_sync.DEFAULT_CHANGES_LIMIT,
+    ) -> Tuple[List[Task], List[str], int, bool]:
+        """
+        Get tasks created, updated or deleted after a sync cursor.
+
+        Changes are returned oldest first; a page always contains every
+        change of the transactions it covers (see task_sync.change_window).
+
+        Args:
+            user_id: User ID
+            since: Change sequence value the client has applied (0 for all)
+            limit: Target number of changes per page
+
+        Returns:
+            (changed tasks with tags loaded, deleted task IDs, cursor for
+            the next request, whether more changes follow)
+
+        Raises:
+            ValueError: If since is ahead of the user's change sequence
+
+        Example:
+            tasks, deleted, since, has_more = await service.get_changes(user_id, since=42)
+        """
+        upper, has_more = task_sync.change_window(self.session, user_id, since, limit)
+        if upper == since:
+            return [], [], since, False
+
+        tasks = list(
+            self.session.exec(
+                select(Task)
+                .where(
+                    Task.user_id == user_id,
+                    Task.change_seq > since,
+                    Task.change_seq <= upper,
+                )
+                .order_by(Task.change_seq, Task.id)
+            ).all()
+        )
+        self._load_tags(tasks)
+        deleted = task_sync.deleted_task_ids(self.session, user_id, since, upper)
+
+        return tasks, deleted, upper, has_more
+
+    @replica_read
+    async def get_version(self, user_id: str) -> int:
+        """
+        Current change sequence value of the user's tasks and tags.
+
+        Advances with every write, so it versions list responses (ETags)
+        with a single primary-key lookup.
+        """
+        return task_sync.current_change_seq(self.session, user_id)
+
     async def get_task(self, task_id: str, user_id: str) -> Task:
         """
         Get single task with ownership verification.
@@ -330,9 +496,7 @@ class TaskService:
                 detail="Not authorized to access this task",
             )
 
-        # Load tags
-        tag_query = select(Tag).join(TaskTag).where(TaskTag.task_id == task.id)
-        task.tags = list(self.session.exec(tag_query).all())
+        self._load_tags([task])
 
         return task
 
@@ -365,6 +529,23 @@ class TaskService:
         task = await self.get_task(task_id, user_id)
 
         # Update only provided fields
+        self._apply_update(task, task_data)
+        task.change_seq = task_sync.next_change_seq(self.session, user_id)
+
+        # Persist changes
+        self.session.add(task)
+        self.session.commit()
+        self.session.refresh(task)
+
+        return task
+
+    def _apply_update(self, task: Task, task_data: TaskUpdate) -> None:
+        """
+        Apply the provided fields of an update to a task (not persisted).
+
+        Raises:
+            ValueError: If the new title is empty
+        """
         if task_data.title is not None:
             if not task_data.title.strip():
                 raise ValueError("Title cannot be empty")
@@ -385,13 +566,6 @@ class TaskService:
         # Update timestamp
         task.updated_at = datetime.utcnow()
 
-        # Persist changes
-        self.session.add(task)
-        self.session.commit()
-        self.session.refresh(task)
-
-        return task
-
     async def toggle_complete(
         self, task_id: str, is_complete: bool, user_id: str
     ) -> Task:
@@ -419,6 +593,7 @@ class TaskService:
         # Update completion status
         task.is_complete = is_complete
         task.updated_at = datetime.utcnow()
+        task.change_seq = task_sync.next_change_seq(self.session, user_id)
 
         # Persist changes
         self.session.add(task)
@@ -448,18 +623,18 @@ class TaskService:
         task = await self.get_task(task_id, user_id)
 
         # Delete task-tag associations first
-        self.session.exec(
+        task_tags = self.session.exec(
             select(TaskTag).where(TaskTag.task_id == task_id)
         ).all()
-
-        # Delete associations
-        for tt in self.session.exec(
-            select(TaskTag).where(TaskTag.task_id == task_id)
-        ).all():
+        self._adjust_tag_counts([tt.tag_id for tt in task_tags], -1)
+        for tt in task_tags:
             self.session.delete(tt)
 
-        # Delete from database
+        # Delete from database, leaving a tombstone for sync clients
         self.session.delete(task)
+        task_sync.record_tombstones(
+            self.session, user_id, [task_id], task_sync.next_change_seq(self.session, user_id)
+        )
         self.session.commit()
 
     async def add_tag_to_task(
@@ -508,6 +683,8 @@ class TaskService:
         # Create association
         task_tag = TaskTag(task_id=task_id, tag_id=tag_id)
         self.session.add(task_tag)
+        self._adjust_tag_counts([tag_id], 1)
+        task.change_seq = task_sync.next_change_seq(self.session, user_id)
         self.session.commit()
         self.session.refresh(task)
 
@@ -550,6 +727,8 @@ class TaskService:
             raise ValueError("Tag is not on this task")
 
         self.session.delete(task_tag)
+        self._adjust_tag_counts([tag_id], -1)
+        task.change_seq = task_sync.next_change_seq(self.session, user_id)
         self.session.commit()
         self.session.refresh(task)
 
@@ -561,7 +740,9 @@ class TaskService:
         """
         Replace all tags on a task with new set of tags.
 
-        Removes all existing tags and adds the provided tags.
+        Applied as a set diff: one DELETE for associations not in tag_ids
+        and one multi-row INSERT ... ON CONFLICT DO NOTHING for the rest, so
+        unchanged associations are not rewritten.
 
         Args:
             task_id: Task ID
@@ -581,6 +762,8 @@ class TaskService:
         # Verify task ownership
         task = await self.get_task(task_id, user_id)
 
+        tag_ids = list(dict.fromkeys(tag_ids))
+
         # Verify tag ownership
         tags = self.session.exec(
             select(Tag).where(
@@ -592,18 +775,494 @@ class TaskService:
         if len(tags) != len(tag_ids):
             raise ValueError("One or more tag IDs are invalid or don't belong to user")
 
-        # Remove all existing associations
-        for tt in self.session.exec(
-            select(TaskTag).where(TaskTag.task_id == task_id)
-        ).all():
-            self.session.delete(tt)
-
-        # Add new associations
-        for tag_id in tag_ids:
-            task_tag = TaskTag(task_id=task_id, tag_id=tag_id)
-            self.session.add(task_tag)
-
+        # Remove associations that are no longer wanted
+        removed = self.session.execute(
+            delete(TaskTag)
+            .where(TaskTag.task_id == task_id, TaskTag.tag_id.not_in(tag_ids))
+            .returning(TaskTag.tag_id)
+            .execution_options(synchronize_session=False)
+        ).scalars().all()
+
+        # Add missing associations (existing ones are left untouched)
+        added = self._insert_task_tags([(task_id, tag_id) for tag_id in tag_ids])
+
+        self._adjust_tag_counts(list(removed), -1)
+        self._adjust_tag_counts(added, 1)
+        if removed or added:
+            task.change_seq = task_sync.next_change_seq(self.session, user_id)
         self.session.commit()
         self.session.refresh(task)
 
         return task
+
+    async def batch_tasks(
+        self,
+        operations: List[TaskBatchOperation],
+        user_id: str,
+        atomic: bool = False,
+    ) -> Tuple[List[TaskBatchItemResult], bool]:
+        """
+        Apply many create/update/complete/delete operations in one transaction.
+
+        Referenced tasks and tags are resolved with one query each; creates
+        and their tag associations are multi-row INSERTs, completions one
+        UPDATE per target status and deletes one DELETE, so the number of
+        statements does not grow with the batch size (updates are flushed
+        together). Completions are applied after updates.
+
+        Operations that fail validation (missing task, wrong owner, empty
+        title, foreign tags) get an error result; the rest are applied
+        unless atomic is set. Updates and completions of a task that a
+        later operation deletes get a 409 error result.
+
+        Args:
+            operations: Operations in request order
+            user_id: User ID (owner of created tasks, for ownership checks)
+            atomic: Apply nothing if any operation fails
+
+        Returns:
+            (per-operation results in request order, whether the batch was
+            applied). Results carry the resulting task; deletes carry the
+            task as it was before deletion. Results of operations that
+            changed is_complete from False to True have completed set.
+        """
+        results: List[Optional[TaskBatchItemResult]] = [None] * len(operations)
+
+        def fail(index: int, status_code: int, error: str) -> None:
+            results[index] = TaskBatchItemResult(
+                index=index,
+                op=operations[index].op,
+                status_code=status_code,
+                task_id=operations[index].task_id,
+                error=error,
+            )
+
+        # Resolve referenced tasks and requested tags in one query each
+        task_ids = {op.task_id for op in operations if op.task_id}
+        existing = {
+            task.id: task
+            for task in self.session.exec(select(Task).where(Task.id.in_(task_ids))).all()
+        } if task_ids else {}
+
+        requested_tags = {
+            tag_id
+            for op in operations if op.op == "create"
+            for tag_id in op.create.tag_ids or []
+        }
+        owned_tags = set(
+            self.session.exec(
+                select(Tag.id).where(Tag.id.in_(requested_tags), Tag.user_id == user_id)
+            ).all()
+        ) if requested_tags else set()
+
+        now = datetime.utcnow()
+        created: Dict[int, Task] = {}
+        changed: Dict[int, Task] = {}
+        deleted: Dict[int, Task] = {}
+        completions: Dict[bool, List[str]] = defaultdict(list)
+        associations: List[Tuple[str, str]] = []
+        deleted_ids: List[str] = []
+        # Completion status as of the current operation, to detect completions
+        is_complete = {task_id: task.is_complete for task_id, task in existing.items()}
+        completed_ops = set()
+
+        for index, op in enumerate(operations):
+            if op.op == "create":
+                data = op.create
+                tag_ids = list(dict.fromkeys(data.tag_ids or []))
+                if not data.title.strip():
+                    fail(index, 400, "Title cannot be empty or whitespace")
+                    continue
+                if not owned_tags.issuperset(tag_ids):
+                    fail(index, 400, "One or more tag IDs are invalid or don't belong to user")
+                    continue
+
+                task = Task(
+                    id=str(uuid.uuid4()),
+                    title=data.title.strip(),
+                    description=data.description.strip() if data.description else None,
+                    is_complete=False,
+                    priority=data.priority or Priority.MEDIUM,
+                    due_date=data.due_date,
+                    user_id=user_id,
+                    created_at=now,
+                    updated_at=now,
+                )
+                created[index] = task
+                associations.extend((task.id, tag_id) for tag_id in tag_ids)
+                continue
+
+            task = existing.get(op.task_id)
+            if task is None or op.task_id in deleted_ids:
+                fail(index, 404, "Task not found")
+            elif task.user_id != user_id:
+                fail(index, 403, "Not authorized to access this task")
+            elif op.op == "update":
+                try:
+                    self._apply_update(task, op.update)
+                except ValueError as e:
+                    fail(index, 400, str(e))
+                    continue
+                changed[index] = task
+                if op.update.is_complete and not is_complete[task.id]:
+                    completed_ops.add(index)
+                if op.update.is_complete is not None:
+                    is_complete[task.id] = op.update.is_complete
+            elif op.op == "complete":
+                completions[op.is_complete].append(task.id)
+                changed[index] = task
+                if op.is_complete and not is_complete[task.id]:
+                    completed_ops.add(index)
+                is_complete[task.id] = op.is_complete
+            else:
+                deleted[index] = task
+                deleted_ids.append(task.id)
+
+        failed = sum(1 for result in results if result is not None)
+        if atomic and failed:
+            # Nothing has been flushed yet; discard in-memory updates
+            for task in changed.values():
+                self.session.expire(task)
+            for index, op in enumerate(operations):
+                if results[index] is None:
+                    results[index] = TaskBatchItemResult(
+                        index=index,
+                        op=op.op,
+                        status_code=424,
+                        task_id=op.task_id,
+                        error="Not applied: another operation in the atomic batch failed",
+                    )
+            return results, False
+
+        # Snapshot deleted tasks (with tags) before removing them
+        self._load_tags(deleted.values())
+        for index, task in deleted.items():
+            results[index] = TaskBatchItemResult(
+                index=index,
+                op="delete",
+                status_code=204,
+                task_id=task.id,
+                task=TaskResponse.model_validate(task),
+            )
+
+        # IDs of created/changed tasks (read before commit expires them)
+        surviving = {index: task.id for index, task in {**created, **changed}.items()}
+
+        # One change sequence value for the whole batch
+        change_seq = task_sync.next_change_seq(self.session, user_id)
+        for index, task in {**created, **changed}.items():
+            if operations[index].op != "complete":
+                task.change_seq = change_seq
+
+        # Creates and updates (flushed together), then tag associations
+        self.session.add_all(created.values())
+        self.session.flush()
+        self._adjust_tag_counts(self._insert_task_tags(associations), 1)
+
+        # Completions: one UPDATE per target status
+        for is_complete, ids in completions.items():
+            self.session.execute(
+                update(Task)
+                .where(Task.id.in_(ids))
+                .values(is_complete=is_complete, updated_at=now, change_seq=change_seq)
+                .execution_options(synchronize_session=False)
+            )
+
+        # Deletes: associations first (for tag counts), then tasks
+        if deleted_ids:
+            removed = self.session.execute(
+                delete(TaskTag)
+                .where(TaskTag.task_id.in_(deleted_ids))
+                .returning(TaskTag.tag_id)
+                .execution_options(synchronize_session=False)
+            ).scalars().all()
+            self._adjust_tag_counts(list(removed), -1)
+            self.session.execute(
+                delete(Task)
+                .where(Task.id.in_(deleted_ids))
+                .execution_options(synchronize_session=False)
+            )
+            task_sync.record_tombstones(self.session, user_id, deleted_ids, change_seq)
+
+        self.session.commit()
+
+        # Reload surviving tasks and their tags with one query each
+        reloaded: Dict[str, Task] = {}
+        surviving_ids = set(surviving.values()) - set(deleted_ids)
+        if surviving_ids:
+            reloaded = {
+                task.id: task
+                for task in self.session.exec(
+                    select(Task)
+                    .where(Task.id.in_(surviving_ids))
+                    .execution_options(populate_existing=True)
+                ).all()
+            }
+            self._load_tags(reloaded.values())
+
+        for index, task_id in surviving.items():
+            task = reloaded.get(task_id)
+            if task is None:
+                # Changed earlier in the batch, then deleted by a later operation
+                fail(index, 409, "Task was deleted by a later operation in the batch")
+                continue
+            results[index] = TaskBatchItemResult(
+                index=index,
+                op=operations[index].op,
+                status_code=201 if index in created else 200,
+                task_id=task_id,
+                task=TaskResponse.model_validate(task),
+                completed=index in completed_ops,
+            )
+
+        return results, True
+
+    def export_tasks(
+        self, user_id: str, batch_size: int = EXPORT_BATCH_SIZE
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream all of a user's tasks as export records, oldest first.
+
+        Rows come from a server-side cursor (yield_per) in partitions of
+        batch_size, with one tag query per partition, so memory use does
+        not depend on how many tasks the user has.
+
+        Args:
+            user_id: User ID to export tasks for
+            batch_size: Rows per cursor fetch
+
+        Yields:
+            Export records (see task_transfer.to_record)
+        """
+        result = self.session.execute(
+            select(
+                Task.id,
+                Task.title,
+                Task.description,
+                Task.is_complete,
+                Task.priority,
+                Task.due_date,
+                Task.created_at,
+                Task.updated_at,
+            )
+            .where(Task.user_id == user_id)
+            .order_by(Task.created_at, Task.id)
+            .execution_options(yield_per=batch_size)
+        )
+
+        for partition in result.partitions():
+            tag_names: Dict[str, List[str]] = defaultdict(list)
+            for task_id, name in self.session.execute(
+                select(TaskTag.task_id, Tag.name)
+                .join(Tag, Tag.id == TaskTag.tag_id)
+                .where(TaskTag.task_id.in_([row.id for row in partition]))
+                .order_by(Tag.name)
+            ):
+                tag_names[task_id].append(name)
+
+            for row in partition:
+                yield task_transfer.to_record(*row, tags=tag_names[row.id])
+
+    async def import_tasks(
+        self,
+        user_id: str,
+        lines: Iterable[task_transfer.ParsedLine],
+        batch_size: int = IMPORT_BATCH_SIZE,
+    ) -> TaskImportResult:
+        """
+        Import tasks from parsed NDJSON/CSV lines.
+
+        Lines are consumed incrementally and loaded in chunks of batch_size
+        with multi-row INSERTs (tasks, missing tags, associations), all in
+        one transaction. Tags are matched by name and created when missing.
+        Invalid lines are skipped and reported.
+
+        Args:
+            user_id: Owner of the imported tasks
+            lines: (line number, record or parse error) pairs, see
+                task_transfer.parse_ndjson / parse_csv
+            batch_size: Tasks per INSERT
+
+        Returns:
+            Import summary (imported/failed counts and the first errors)
+        """
+        imported = 0
+        failed = 0
+        errors: List[TaskImportError] = []
+        chunk: List[Tuple[Dict[str, Any], List[str]]] = []
+
+        for line_number, record in lines:
+            try:
+                if isinstance(record, ValueError):
+                    raise record
+                values, tag_names = task_transfer.to_task_values(record)
+            except ValueError as e:
+                failed += 1
+                if len(errors) < MAX_IMPORT_ERRORS:
+                    errors.append(TaskImportError(line=line_number, error=str(e)))
+                continue
+
+            chunk.append((values, tag_names))
+            if len(chunk) >= batch_size:
+                imported += self._insert_import_chunk(user_id, chunk)
+                chunk = []
+
+        if chunk:
+            imported += self._insert_import_chunk(user_id, chunk)
+
+        self.session.commit()
+        return TaskImportResult(imported=imported, failed=failed, errors=errors)
+
+    def _insert_import_chunk(
+        self, user_id: str, chunk: List[Tuple[Dict[str, Any], List[str]]]
+    ) -> int:
+        """
+        Insert one chunk of validated import rows; returns the number inserted.
+
+        Each chunk takes its own change sequence value, which keeps sync
+        pages for large imports near the chunk size.
+        """
+        now = datetime.utcnow()
+        change_seq = task_sync.next_change_seq(self.session, user_id)
+        rows = []
+        associations: List[Tuple[str, str]] = []
+        tag_ids = self._get_or_create_tag_ids(
+            user_id, {name for _, names in chunk for name in names}
+        )
+
+        for values, tag_names in chunk:
+            task_id = str(uuid.uuid4())
+            rows.append({
+                "created_at": now,
+                "updated_at": now,
+                **values,
+                "id": task_id,
+                "user_id": user_id,
+                "change_seq": change_seq,
+            })
+            associations.extend((task_id, tag_ids[name]) for name in tag_names)
+
+        self.session.execute(insert(Task), rows)
+        self._adjust_tag_counts(self._insert_task_tags(associations), 1)
+        return len(rows)
+
+    def _get_or_create_tag_ids(self, user_id: str, names: Iterable[str]) -> Dict[str, str]:
+        """
+        Map tag names to the user's tag IDs, creating missing tags in one INSERT.
+
+        Args:
+            user_id: Tag owner
+            names: Normalized tag names
+
+        Returns:
+            Tag ID per name
+        """
+        names = set(names)
+        if not names:
+            return {}
+
+        def lookup() -> Dict[str, str]:
+            return dict(
+                self.session.execute(
+                    select(Tag.name, Tag.id).where(Tag.user_id == user_id, Tag.name.in_(names))
+                ).all()
+            )
+
+        tag_ids = lookup()
+        missing = names - tag_ids.keys()
+        if missing:
+            if self.session.get_bind().dialect.name == "postgresql":
+                insert_tags = postgresql.insert
+            else:
+                insert_tags = sqlite.insert
+            self.session.execute(
+                insert_tags(Tag)
+                .values([
+                    {
+                        "id": str(uuid.uuid4()),
+                        "name": name,
+                        "color": Tag.model_fields["color"].default,
+                        "user_id": user_id,
+                        "task_count": 0,
+                    }
+                    for name in sorted(missing)
+                ])
+                .on_conflict_do_nothing()
+            )
+            # Re-read so tags created concurrently under the same name are used
+            tag_ids = lookup()
+
+        return tag_ids
+
+    def _load_tags(self, tasks: Iterable[Task]) -> None:
+        """Load tags for many tasks with one query (without marking them changed)."""
+        tasks = list(tasks)
+        if not tasks:
+            return
+
+        tags_by_task: Dict[str, List[Tag]] = defaultdict(list)
+        rows = self.session.execute(
+            select(TaskTag.task_id, Tag)
+            .join(Tag, Tag.id == TaskTag.tag_id)
+            .where(TaskTag.task_id.in_([task.id for task in tasks]))
+            .order_by(Tag.name)
+        ).all()
+        for task_id, tag in rows:
+            tags_by_task[task_id].append(tag)
+
+        for task in tasks:
+            set_committed_value(task, "tags", tags_by_task[task.id])
+
+    def _insert_task_tags(self, associations: List[Tuple[str, str]]) -> List[str]:
+        """
+        Insert task-tag associations in one multi-row INSERT.
+
+        Rows that already exist are skipped (ON CONFLICT DO NOTHING).
+
+        Args:
+            associations: (task_id, tag_id) pairs
+
+        Returns:
+            Tag IDs of the rows actually inserted (one entry per row)
+        """
+        if not associations:
+            return []
+
+        if self.session.get_bind().dialect.name == "postgresql":
+            insert = postgresql.insert
+        else:
+            insert = sqlite.insert
+
+        statement = (
+            insert(TaskTag)
+            .values([
+                {"task_id": task_id, "tag_id": tag_id}
+                for task_id, tag_id in associations
+            ])
+            .on_conflict_do_nothing()
+            .returning(TaskTag.tag_id)
+        )
+        return list(self.session.execute(statement).scalars().all())
+
+    def _adjust_tag_counts(self, tag_ids: List[str], delta: int) -> None:
+        """
+        Add delta to the maintained task_count of each tag.
+
+        Runs as in-database increments in the caller's transaction, so
+        concurrent tag changes cannot lose updates. A tag listed n times is
+        adjusted by n * delta; tags sharing a multiplicity share a statement.
+
+        Args:
+            tag_ids: Tag IDs whose association changed (one entry per row)
+            delta: +1 for added associations, -1 for removed ones
+        """
+        by_multiplicity: Dict[int, List[str]] = defaultdict(list)
+        for tag_id, occurrences in Counter(tag_ids).items():
+            by_multiplicity[occurrences].append(tag_id)
+
+        for occurrences, ids in by_multiplicity.items():
+            self.session.execute(
+                update(Tag)
+                .where(Tag.id.in_(ids))
+                .values(task_count=Tag.task_count + delta * occurrences)
+            )
@@ -0,0 +1,168 @@
+"""
+Task Sync
+
+Per-user change sequence behind GET /api/tasks/changes.
+
+Every write transaction on a user's tasks takes the next value of the
+user's counter (user_sync_state.change_seq) and stamps it on the rows it
+creates or changes (tasks.change_seq) or deletes (task_tombstones). A
+client that has applied all changes up to cursor N asks for rows with
+change_seq > N.
+
+The counter is incremented with an upsert, which keeps the counter row
+locked until the writing transaction ends. A user's writes therefore
+commit in sequence order, and once a reader sees counter value N every
+change with change_seq <= N is visible: pages bounded by the counter
+never skip a change that commits later with a smaller value.
+"""
+
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple, Union
+
+from sqlalchemy import Select, exists, insert, union_all, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel import Session, select
+
+from src.models.sync import TaskTombstone, UserSyncState
+from src.models.task import Task
+
+# Default and maximum rows per GET /api/tasks/changes page
+DEFAULT_CHANGES_LIMIT = 500
+MAX_CHANGES_LIMIT = 1000
+
+
+def next_change_seq(session: Session, user_id: str) -> int:
+    """
+    Take the next change sequence value for a user.
+
+    Call once per write transaction and stamp the returned value on every
+    row the transaction changes.
+    """
+    if session.get_bind().dialect.name == "postgresql":
+        upsert = postgresql.insert
+    else:
+        upsert = sqlite.insert
+
+    table = UserSyncState.__table__
+    statement = (
+        upsert(table)
+        .values(user_id=user_id, change_seq=1)
+        .on_conflict_do_update(
+            index_elements=[table.c.user_id],
+            set_={"change_seq": table.c.change_seq + 1},
+        )
+        .returning(table.c.change_seq)
+    )
+    return session.execute(statement).scalar_one()
+
+
+def current_change_seq(session: Session, user_id: str) -> int:
+    """Last change sequence value handed out for a user (0 if none)."""
+    value = session.exec(
+        select(UserSyncState.change_seq).where(UserSyncState.user_id == user_id)
+    ).first()
+    return value or 0
+
+
+def touch_tasks(
+    session: Session, task_ids: Union[Sequence[str], Select], change_seq: int
+) -> None:
+    """
+    Stamp tasks changed without loading them (bulk UPDATE, tag rename).
+
+    Args:
+        task_ids: Task IDs, or a SELECT of task IDs
+        change_seq: Value from next_change_seq
+    """
+    session.execute(
+        update(Task)
+        .where(Task.id.in_(task_ids))
+        .values(change_seq=change_seq)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def record_tombstones(
+    session: Session, user_id: str, task_ids: Sequence[str], change_seq: int
+) -> None:
+    """Record deleted tasks so sync clients can drop them."""
+    if not task_ids:
+        return
+    now = datetime.utcnow()
+    session.execute(
+        insert(TaskTombstone),
+        [
+            {"task_id": task_id, "user_id": user_id, "change_seq": change_seq, "deleted_at": now}
+            for task_id in task_ids
+        ],
+    )
+
+
+def change_window(
+    session: Session, user_id: str, since: int, limit: int
+) -> Tuple[int, bool]:
+    """
+    Pick the range of change sequence values for one page.
+
+    A page ends on a whole sequence value, so the changes of one transaction
+    are never split across pages (a page may exceed limit to finish one).
+
+    Args:
+        user_id: Owner
+        since: Client cursor (last applied change sequence value)
+        limit: Target rows per page
+
+    Returns:
+        (upper bound inclusive, whether more changes follow)
+
+    Raises:
+        ValueError: If since is ahead of the user's counter
+    """
+    current = current_change_seq(session, user_id)
+    if since > current:
+        raise ValueError("Cursor is ahead of the server; resync with since=0")
+    if since == current:
+        return current, False
+
+    seqs = _changed_seqs(user_id, since, current)
+    boundary: Optional[int] = session.execute(
+        select(seqs.c.seq).order_by(seqs.c.seq).offset(limit - 1).limit(1)
+    ).scalar()
+    if boundary is None:
+        return current, False
+
+    has_more = session.execute(
+        select(exists().where(seqs.c.seq > boundary))
+    ).scalar()
+    return boundary, bool(has_more)
+
+
+def deleted_task_ids(session: Session, user_id: str, since: int, upper: int) -> List[str]:
+    """IDs of tasks deleted within (since, upper], in sequence order."""
+    return list(
+        session.exec(
+            select(TaskTombstone.task_id)
+            .where(
+                TaskTombstone.user_id == user_id,
+                TaskTombstone.change_seq > since,
+                TaskTombstone.change_seq <= upper,
+            )
+            .order_by(TaskTombstone.change_seq, TaskTombstone.task_id)
+        ).all()
+    )
+
+
+def _changed_seqs(user_id: str, since: int, upper: int):
+    """Sequence values of changed tasks and tombstones in (since, upper]."""
+    return union_all(
+        select(Task.change_seq.label("seq")).where(
+            Task.user_id == user_id,
+            Task.change_seq > since,
+            Task.change_seq <= upper,
+        ),
+        select(TaskTombstone.change_seq.label("seq")).where(
+            TaskTombstone.user_id == user_id,
+            TaskTombstone.change_seq > since,
+            TaskTombstone.change_seq <= upper,
+        ),
+    ).subquery()
@@ -0,0 +1,247 @@
+"""
+Task Transfer
+
+Record formats for bulk task export and import:
+- NDJSON: one JSON object per line
+- CSV: header row with CSV_COLUMNS, tags joined with TAG_SEPARATOR
+
+Both directions work on iterators so a user's tasks are never held in
+memory at once: export serializes records as the database cursor yields
+them, import parses uploads line by line.
+
+Exported records carry tag names (not IDs) so they can be imported into
+another account; task IDs are informational and are regenerated on import.
+"""
+
+import csv
+import io
+import json
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
+
+from src.models.task import TaskCreate
+
+EXPORT_FORMATS = ("ndjson", "csv")
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+CSV_COLUMNS = [
+    "id",
+    "title",
+    "description",
+    "is_complete",
+    "priority",
+    "due_date",
+    "created_at",
+    "updated_at",
+    "tags",
+]
+
+TAG_SEPARATOR = ";"
+
+# Maximum tag name length (matches TagBase.name)
+MAX_TAG_NAME_LENGTH = 50
+
+ParsedLine = Tuple[int, Union[Dict[str, Any], ValueError]]
+
+
+def to_record(
+    task_id: str,
+    title: str,
+    description: Optional[str],
+    is_complete: bool,
+    priority: int,
+    due_date: Optional[datetime],
+    created_at: datetime,
+    updated_at: datetime,
+    tags: List[str],
+) -> Dict[str, Any]:
+    """Build an export record from task columns and tag names."""
+    return {
+        "id": task_id,
+        "title": title,
+        "description": description,
+        "is_complete": is_complete,
+        "priority": priority,
+        "due_date": due_date.isoformat() if due_date else None,
+        "created_at": created_at.isoformat(),
+        "updated_at": updated_at.isoformat(),
+        "tags": tags,
+    }
+
+
+def iter_ndjson(records: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """Serialize records as NDJSON lines."""
+    for record in records:
+        yield json.dumps(record, ensure_ascii=False) + "\n"
+
+
+def iter_csv(records: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """Serialize records as CSV, one chunk per row (header first)."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=CSV_COLUMNS, extrasaction="ignore")
+
+    writer.writeheader()
+    yield _drain(buffer)
+
+    for record in records:
+        writer.writerow({
+            **record,
+            "description": record["description"] or "",
+            "is_complete": "true" if record["is_complete"] else "false",
+            "due_date": record["due_date"] or "",
+            "tags": TAG_SEPARATOR.join(record["tags"]),
+        })
+        yield _drain(buffer)
+
+
+def parse_ndjson(stream: TextIO) -> Iterator[ParsedLine]:
+    """
+    Parse NDJSON incrementally.
+
+    Yields:
+        (line number, record dict or ValueError for malformed lines);
+        blank lines are skipped
+    """
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_number, ValueError(f"Invalid JSON: {e.msg}")
+            continue
+        if not isinstance(record, dict):
+            yield line_number, ValueError("Expected a JSON object")
+            continue
+        yield line_number, record
+
+
+def parse_csv(stream: TextIO) -> Iterator[ParsedLine]:
+    """
+    Parse CSV incrementally (header row required).
+
+    Yields:
+        (line number of the row's first line, record dict)
+    """
+    reader = csv.DictReader(stream)
+    if reader.fieldnames is None or "title" not in reader.fieldnames:
+        yield 1, ValueError("CSV header must include a 'title' column")
+        return
+
+    line_number = reader.line_num + 1
+    for row in reader:
+        record: Dict[str, Any] = {
+            key: value for key, value in row.items() if key is not None and value != ""
+        }
+        if "tags" in record:
+            record["tags"] = record["tags"].split(TAG_SEPARATOR)
+        yield line_number, record
+        line_number = reader.line_num + 1
+
+
+def to_task_values(record: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Validate an imported record.
+
+    Title, description, priority and due date go through TaskCreate, so
+    imports are sanitized exactly like API-created tasks.
+
+    Args:
+        record: Parsed NDJSON/CSV record
+
+    Returns:
+        (task column values without id/user_id, normalized tag names)
+
+    Raises:
+        ValueError: If the record is invalid
+    """
+    try:
+        data = TaskCreate.model_validate({
+            field: record[field]
+            for field in ("title", "description", "priority", "due_date")
+            if record.get(field) is not None
+        })
+    except ValueError as e:
+        raise ValueError(_first_error(e))
+
+    if not data.title or not data.title.strip():
+        raise ValueError("Title cannot be empty or whitespace")
+
+    values: Dict[str, Any] = {
+        "title": data.title.strip(),
+        "description": data.description.strip() if data.description else None,
+        "is_complete": _parse_bool(record.get("is_complete", False)),
+        "priority": data.priority,
+        "due_date": data.due_date,
+    }
+    for field in ("created_at", "updated_at"):
+        if record.get(field):
+            values[field] = _parse_datetime(record[field], field)
+
+    return values, normalize_tag_names(record.get("tags") or [])
+
+
+def normalize_tag_names(names: Any) -> List[str]:
+    """
+    Normalize tag names the way TagService stores them (trimmed, lowercase,
+    no angle brackets), dropping empties and duplicates.
+
+    Raises:
+        ValueError: If tags is not a list or a name is too long
+    """
+    if not isinstance(names, list):
+        raise ValueError("tags must be a list of tag names")
+
+    normalized = []
+    for name in names:
+        cleaned = str(name).strip().replace("<", "").replace(">", "").lower()
+        if not cleaned:
+            continue
+        if len(cleaned) > MAX_TAG_NAME_LENGTH:
+            raise ValueError(f"Tag name '{cleaned[:20]}...' is longer than {MAX_TAG_NAME_LENGTH}")
+        normalized.append(cleaned)
+    return list(dict.fromkeys(normalized))
+
+
+def _drain(buffer: io.StringIO) -> str:
+    value = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate(0)
+    return value
+
+
+def _parse_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.strip().lower() in ("true", "1", "yes"):
+        return True
+    if isinstance(value, str) and value.strip().lower() in ("false", "0", "no", ""):
+        return False
+    if isinstance(value, int):
+        return bool(value)
+    raise ValueError(f"Invalid is_complete value: {value!r}")
+
+
+def _parse_datetime(value: Any, field: str) -> datetime:
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        raise ValueError(f"Invalid {field}: {value!r}")
+    # Timestamps are stored as naive UTC
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _first_error(error: ValueError) -> str:
+    """Readable message for the first pydantic validation error."""
+    errors = getattr(error, "errors", None)
+    if callable(errors):
+        first = errors()[0]
+        location = ".".join(str(part) for part in first.get("loc", ()))
+        return f"{location}: {first.get('msg')}" if location else first.get("msg")
+    return str(error)
@@ -2,6 +2,7 @@
 Quick test to verify global exception handler works
 """
 from fastapi.testclient import TestClient
+
 from src.main import app
 
 client = TestClient(app)
@@ -23,7 +24,7 @@ def test_global_exception_handler():
     assert "error_id" in data
     assert len(data["error_id"]) == 36  # UUID format: xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx
 
-    print(f"✓ Global exception handler test passed!")
+    print("✓ Global exception handler test passed!")
     print(f"  Response: {data}")
 
 if __name__ == "__main__":
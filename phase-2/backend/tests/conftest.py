@@ -13,7 +13,13 @@ from fastapi.testclient import TestClient
 from sqlmodel import Session, SQLModel, create_engine
 from sqlmodel.pool import StaticPool
 
+# Routes over their declared query budget fail the test (see src/db/query_stats.py)
+os.environ.setdefault("QUERY_BUDGET_STRICT", "true")
+# Tests import the agent stack themselves when needed (see src/main.py)
+os.environ.setdefault("AGENT_PRELOAD", "false")
+
 from src.auth.jwt import create_access_token, hash_password
+from src.db.query_stats import instrument_engine
 from src.db.session import get_session
 from src.main import app
 from src.models.user import User
@@ -40,6 +46,9 @@ def engine_fixture():
     # Create all tables
     SQLModel.metadata.create_all(engine)
 
+    # Count queries per request (query budgets)
+    instrument_engine(engine)
+
     yield engine
 
     # Drop all tables after test
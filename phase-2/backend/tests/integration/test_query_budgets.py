@@ -0,0 +1,54 @@
+"""
+Integration Tests for Route Query Budgets
+
+Exercises the read endpoints that declare a query_budget() with enough
+data to expose per-row queries. The test suite runs in strict mode
+(QUERY_BUDGET_STRICT, see conftest.py), so a route over its budget raises
+QueryBudgetExceededError and fails the test.
+"""
+
+import uuid
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from src.auth.dependencies import get_current_user
+from src.main import app
+from src.models.conversation import Conversation, Message
+from src.models.user import User
+
+
+def test_read_routes_stay_within_query_budget(client: TestClient, session: Session):
+    """List, detail, search, sync and chat routes with 20 tagged tasks."""
+    user = User(id=str(uuid.uuid4()), email="budget@example.com", name="Budget")
+    session.add(user)
+    session.commit()
+    app.dependency_overrides[get_current_user] = lambda: user
+
+    tag_ids = [
+        client.post("/api/tags", json={"name": name}).json()["id"]
+        for name in ("work", "home")
+    ]
+    task_ids = [
+        client.post("/api/tasks", json={"title": f"Task {i}", "tag_ids": tag_ids}).json()["id"]
+        for i in range(20)
+    ]
+    for i in range(5):
+        conversation = Conversation(user_id=user.id, title=f"Chat {i}")
+        session.add(conversation)
+        session.flush()
+        session.add(Message(conversation_id=conversation.id, user_id=user.id, role="user", content="hi"))
+    session.commit()
+
+    for url in (
+        "/api/tasks",
+        "/api/tasks?tags=" + tag_ids[0],
+        f"/api/tasks/{task_ids[0]}",
+        "/api/tasks/search?q=task",
+        "/api/tasks/changes",
+        "/api/tags?with_counts=true",
+        "/api/chat/conversations",
+    ):
+        response = client.get(url)
+        assert response.status_code == 200, url
+        assert "server-timing" in response.headers
@@ -0,0 +1,81 @@
+"""
+Unit Tests for Conditional Request Helpers
+
+Tests ETag derivation and If-None-Match / If-Modified-Since evaluation.
+"""
+
+from datetime import datetime
+
+from starlette.requests import Request
+
+from src.api.conditional import (
+    collection_etag,
+    http_date,
+    is_not_modified,
+    resource_etag,
+)
+
+
+def make_request(query: str = "", headers: dict = None) -> Request:
+    """Build a bare GET request with the given query string and headers."""
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/api/tasks",
+        "query_string": query.encode(),
+        "headers": [
+            (name.lower().encode(), value.encode())
+            for name, value in (headers or {}).items()
+        ],
+    })
+
+
+class TestCollectionEtag:
+    """Test collection ETags"""
+
+    def test_etag_varies_by_version_user_and_query(self):
+        """Version, user and query string each change the ETag."""
+        base = collection_etag(make_request("limit=10&offset=0"), "user-a", 7)
+
+        assert base.startswith('W/"7-')
+        assert collection_etag(make_request("offset=0&limit=10"), "user-a", 7) == base
+        assert collection_etag(make_request("limit=10&offset=0"), "user-a", 8) != base
+        assert collection_etag(make_request("limit=10&offset=0"), "user-b", 7) != base
+        assert collection_etag(make_request("limit=20&offset=0"), "user-a", 7) != base
+
+
+class TestIsNotModified:
+    """Test conditional request evaluation"""
+
+    def test_if_none_match_uses_weak_comparison(self):
+        """A strong or weak form of the current ETag (in a list) matches."""
+        etag = resource_etag("user-a", "task-1", 3)
+        opaque = etag[2:]
+
+        assert is_not_modified(make_request(headers={"If-None-Match": etag}), etag)
+        assert is_not_modified(make_request(headers={"If-None-Match": f'"x", {opaque}'}), etag)
+        assert is_not_modified(make_request(headers={"If-None-Match": "*"}), etag)
+        assert not is_not_modified(make_request(headers={"If-None-Match": 'W/"2-abc"'}), etag)
+        assert not is_not_modified(make_request(), etag)
+
+    def test_if_modified_since_only_without_if_none_match(self):
+        """If-Modified-Since compares at second precision and yields to If-None-Match."""
+        etag = resource_etag("user-a", "task-1", 3)
+        updated_at = datetime(2026, 3, 1, 12, 0, 0, 500000)
+        header = http_date(updated_at)
+
+        assert header == "Sun, 01 Mar 2026 12:00:00 GMT"
+        assert is_not_modified(make_request(headers={"If-Modified-Since": header}), etag, updated_at)
+        assert not is_not_modified(
+            make_request(headers={"If-Modified-Since": "Sun, 01 Mar 2026 11:59:59 GMT"}),
+            etag,
+            updated_at,
+        )
+        assert not is_not_modified(
+            make_request(headers={"If-Modified-Since": header, "If-None-Match": '"stale"'}),
+            etag,
+            updated_at,
+        )
+        assert not is_not_modified(
+            make_request(headers={"If-Modified-Since": "not a date"}), etag, updated_at
+        )
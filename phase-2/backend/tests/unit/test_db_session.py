@@ -0,0 +1,102 @@
+"""
+Unit Tests for Database Engine Configuration
+
+Tests the connection pooler mode (PgBouncer / Neon pooled endpoints)
+without connecting: engine settings and the idle-connection ping.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import DisconnectionError
+
+from src.db import session
+
+NEON_DIRECT = "postgresql://u:p@ep-cool-123456.us-east-2.aws.neon.tech/db"
+NEON_POOLED = "postgresql://u:p@ep-cool-123456-pooler.us-east-2.aws.neon.tech/db"
+
+
+@pytest.fixture
+def connect_args(monkeypatch):
+    """connect_args passed to create_engine by the next _create_engine call."""
+    captured = {}
+    create_engine = session.create_engine
+
+    def spy(url, **kwargs):
+        captured.update(kwargs["connect_args"])
+        return create_engine(url, **kwargs)
+
+    monkeypatch.setattr(session, "create_engine", spy)
+    return captured
+
+
+class TestPoolerMode:
+    """Test engine settings per endpoint"""
+
+    def test_neon_pooled_host_is_detected(self, monkeypatch):
+        """auto mode recognizes Neon "-pooler" hosts; the setting can force either mode."""
+        assert session.uses_pooler(make_url(NEON_POOLED))
+        assert not session.uses_pooler(make_url(NEON_DIRECT))
+
+        monkeypatch.setattr(session, "DATABASE_POOLER", "true")
+        assert session.uses_pooler(make_url(NEON_DIRECT))
+
+    def test_pooler_engine_skips_pre_ping_and_startup_options(self, connect_args):
+        """No SELECT 1 per checkout, no startup options, shorter recycle."""
+        engine = session._create_engine(NEON_POOLED, "Test")
+
+        assert engine.pool._pre_ping is False
+        assert engine.pool._recycle == 300
+        assert "options" not in connect_args
+
+    def test_direct_engine_keeps_pre_ping(self, connect_args):
+        """Direct connections keep pre-ping and the UTC startup option."""
+        engine = session._create_engine(NEON_DIRECT, "Test")
+
+        assert engine.pool._pre_ping is True
+        assert connect_args["options"] == "-c timezone=utc"
+
+    def test_pool_size_from_env(self, monkeypatch):
+        """Pool size and overflow come from DB_POOL_SIZE / DB_MAX_OVERFLOW."""
+        monkeypatch.setattr(session, "DB_POOL_SIZE", 12)
+        monkeypatch.setattr(session, "DB_MAX_OVERFLOW", 3)
+
+        engine = session._create_engine(NEON_DIRECT, "Test")
+
+        assert engine.pool.size() == 12
+        assert engine.pool._max_overflow == 3
+
+
+class TestIdlePing:
+    """Test the pooler mode liveness check"""
+
+    def record(self, idle_seconds: float):
+        return SimpleNamespace(
+            info={session._LAST_CHECKIN: session.time.monotonic() - idle_seconds}
+        )
+
+    def test_recently_used_connection_is_not_pinged(self):
+        """Busy connections are handed out without a round trip."""
+        connection = Mock()
+
+        session._ping_if_idle(connection, self.record(idle_seconds=1), None)
+
+        connection.cursor.assert_not_called()
+
+    def test_idle_connection_is_pinged(self):
+        """Connections idle longer than DB_PING_IDLE_SECONDS are checked."""
+        connection = Mock()
+
+        session._ping_if_idle(connection, self.record(session.DB_PING_IDLE_SECONDS + 1), None)
+
+        connection.cursor.return_value.execute.assert_called_once_with("SELECT 1")
+
+    def test_dead_idle_connection_is_replaced(self):
+        """A failed ping raises DisconnectionError, so the pool reconnects."""
+        connection = Mock()
+        connection.cursor.return_value.execute.side_effect = OSError("server closed the connection")
+
+        with pytest.raises(DisconnectionError):
+            session._ping_if_idle(connection, self.record(session.DB_PING_IDLE_SECONDS + 1), None)
@@ -0,0 +1,99 @@
+"""
+Unit Tests for Startup Cost
+
+Imports the app in a fresh interpreter with `python -X importtime` and
+checks that startup stays cheap and side-effect free: no database URL
+needed, no agent stack (agents, openai, mcp), and a total import time
+budget. Raise IMPORT_TIME_BUDGET (seconds) on slow machines.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+IMPORT_TIME_BUDGET = float(os.getenv("IMPORT_TIME_BUDGET", "2.0"))
+
+# Loaded on the first chat request (or AGENT_PRELOAD), never at import
+DEFERRED_PACKAGES = ("agents", "openai", "mcp")
+
+
+def import_in_subprocess(module: str) -> subprocess.CompletedProcess:
+    """Import a module with -X importtime and no database URL set."""
+    env = {
+        key: value
+        for key, value in os.environ.items()
+        if key not in ("DATABASE_URL", "DB_URL", "POSTGRES_URL", "DATABASE_PRIVATE_URL")
+    }
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+
+def imported_modules(importtime_output: str) -> dict[str, int]:
+    """Module name -> cumulative import time (microseconds)."""
+    modules = {}
+    for line in importtime_output.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        modules[name.strip()] = int(cumulative)
+    return modules
+
+
+class TestStartupImports:
+    """Test what importing the app costs"""
+
+    def test_app_import_within_budget(self):
+        """src.main imports without a database and without the agent stack."""
+        result = import_in_subprocess("src.main")
+
+        assert result.returncode == 0, result.stderr[-2000:]
+        modules = imported_modules(result.stderr)
+        deferred = sorted(
+            name for name in modules if name.split(".")[0] in DEFERRED_PACKAGES
+        )
+        assert deferred == []
+        assert modules["src.main"] / 1e6 < IMPORT_TIME_BUDGET
+
+    def test_session_module_has_no_side_effects(self):
+        """Importing src.db.session prints nothing and builds no engine."""
+        result = subprocess.run(
+            [sys.executable, "-c", "import src.db.session as s; print(s.get_engine.cache_info().currsize)"],
+            cwd=BACKEND_DIR,
+            env={key: value for key, value in os.environ.items() if key != "DATABASE_URL"},
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+
+        assert result.returncode == 0, result.stderr[-2000:]
+        assert result.stdout == "0\n"
+
+    def test_tracing_builds_no_engine_at_import(self):
+        """With tracing enabled, importing the app still needs no database."""
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import src.main, src.db.session as s; print(s.get_engine.cache_info().currsize)",
+            ],
+            cwd=BACKEND_DIR,
+            env={
+                **{key: value for key, value in os.environ.items() if key != "DATABASE_URL"},
+                "OTEL_TRACES_EXPORTER": "console",
+            },
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+
+        assert result.returncode == 0, result.stderr[-2000:]
+        assert result.stdout.splitlines()[-1] == "0"
@@ -0,0 +1,78 @@
+"""
+Unit Tests for Worker Process Lifecycle
+
+Tests gunicorn worker sizing from the CPU limit and the per-process state
+reset done in forked workers.
+"""
+
+import sys
+from types import ModuleType
+
+import pytest
+
+from src import lifecycle
+
+
+@pytest.fixture(autouse=True)
+def no_overrides(monkeypatch):
+    monkeypatch.delenv("WEB_CONCURRENCY", raising=False)
+    monkeypatch.delenv("CPU_LIMIT_MILLICORES", raising=False)
+
+
+class TestWorkerCount:
+    """Test worker count derivation"""
+
+    @pytest.mark.parametrize(
+        "millicores,workers",
+        [("250", 2), ("500", 2), ("1000", 2), ("1500", 3), ("4000", 8)],
+    )
+    def test_derived_from_cpu_limit(self, monkeypatch, millicores, workers):
+        """Two workers per CPU of the limit, never fewer than two."""
+        monkeypatch.setenv("CPU_LIMIT_MILLICORES", millicores)
+
+        assert lifecycle.default_worker_count() == workers
+
+    def test_cgroup_v2_quota(self, monkeypatch, tmp_path):
+        """Without the env variable the cgroup CPU quota is used."""
+        cpu_max = tmp_path / "cpu.max"
+        cpu_max.write_text("150000 100000\n")
+        monkeypatch.setattr(lifecycle, "CGROUP_V2_CPU_MAX", str(cpu_max))
+
+        assert lifecycle.cpu_limit() == 1.5
+
+    def test_web_concurrency_wins(self, monkeypatch):
+        """WEB_CONCURRENCY overrides the derived count."""
+        monkeypatch.setenv("CPU_LIMIT_MILLICORES", "4000")
+        monkeypatch.setenv("WEB_CONCURRENCY", "3")
+
+        assert lifecycle.default_worker_count() == 3
+
+
+class TestResetAfterFork:
+    """Test per-process state after fork"""
+
+    def test_singletons_are_dropped(self, monkeypatch):
+        """Publisher and client singletons created in the master are forgotten."""
+        publisher = ModuleType("src.events.dapr_publisher")
+        publisher._publisher_instance = object()
+        monkeypatch.setitem(sys.modules, "src.events.dapr_publisher", publisher)
+
+        lifecycle.reset_after_fork()
+
+        assert publisher._publisher_instance is None
+
+    def test_engine_pool_is_replaced(self, monkeypatch):
+        """An engine built in the master gets a fresh pool in the worker."""
+        from src.db.session import get_engine
+
+        monkeypatch.setenv("DATABASE_URL", "sqlite://")
+        get_engine.cache_clear()
+        try:
+            engine = get_engine()
+            pool = engine.pool
+
+            lifecycle.reset_after_fork()
+
+            assert engine.pool is not pool
+        finally:
+            get_engine.cache_clear()
@@ -7,9 +7,12 @@ Tests the Model Context Protocol tools for task management.
 import uuid
 
 import pytest
-from sqlmodel import Session
+from sqlmodel import Session, select
 
+from src.models.tag import Tag
 from src.models.task import Task
+from src.models.task_tag import TaskTag
+from src.models.user import User
 from src.services.mcp_tools import MCPToolsService, MCP_TOOLS
 from tests.conftest import create_test_user
 
@@ -269,6 +272,24 @@ class TestDeleteTask:
         list_result = service.list_tasks(user_id=user.id)
         assert list_result["total"] == 0
 
+    def test_delete_task_updates_tag_counts(self, session: Session):
+        """Test deleting a tagged task decrements its tags' task_count."""
+        user = User(id="mcp-count-user", email="ruth@test.com", name="Ruth")
+        work = Tag(name="work", user_id=user.id, task_count=2)
+        task = Task(id=str(uuid.uuid4()), user_id=user.id, title="Tagged")
+        session.add_all([user, work, task])
+        session.commit()
+        session.add(TaskTag(task_id=task.id, tag_id=work.id))
+        session.commit()
+        service = MCPToolsService(session)
+
+        result = service.delete_task(user_id=user.id, task_id=uuid.UUID(task.id))
+
+        assert result["success"] is True
+        session.refresh(work)
+        assert work.task_count == 1
+        assert session.exec(select(TaskTag)).all() == []
+
     def test_delete_nonexistent_task(self, session: Session):
         """Test deleting nonexistent task fails."""
         user = create_test_user(session, email="sam@test.com")
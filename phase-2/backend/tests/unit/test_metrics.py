@@ -0,0 +1,81 @@
+"""
+Unit Tests for Prometheus Metrics
+
+Tests request latency labels and the /metrics exposition on a minimal app.
+"""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from todo_observability import metrics
+
+
+def make_client() -> TestClient:
+    """App with MetricsMiddleware and a /metrics route."""
+    app = FastAPI()
+    app.add_middleware(metrics.MetricsMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: str):
+        return {"id": item_id}
+
+    @app.get("/metrics")
+    async def prometheus_metrics():
+        return metrics.metrics_response()
+
+    return TestClient(app)
+
+
+def request_count(method: str, route: str, status: str) -> float:
+    labels = {"method": method, "route": route, "status": status}
+    return REGISTRY.get_sample_value("http_request_duration_seconds_count", labels) or 0
+
+
+class TestMetricsMiddleware:
+    """Test request latency recording"""
+
+    def test_labels_by_route_template(self):
+        """Path parameters collapse into the template; unknown paths share one label."""
+        client = make_client()
+        before = request_count("GET", "/items/{item_id}", "200")
+        unmatched_before = request_count("GET", metrics.UNMATCHED_ROUTE, "404")
+
+        client.get("/items/1")
+        client.get("/items/2")
+        client.get("/no/such/path")
+
+        assert request_count("GET", "/items/{item_id}", "200") == before + 2
+        assert request_count("GET", metrics.UNMATCHED_ROUTE, "404") == unmatched_before + 1
+
+    def test_metrics_endpoint_exposes_registry(self):
+        """GET /metrics returns the Prometheus text format."""
+        metrics.record_event_publish("task-events", 0.0, False)
+
+        response = make_client().get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert 'event_publish_failures_total{topic="task-events"}' in response.text
+        assert "http_request_duration_seconds_bucket" in response.text
+
+
+class TestMetricsEndpoint:
+    """Test the token gate on the backend's public /metrics"""
+
+    def test_disabled_without_token(self, client, monkeypatch):
+        """Without METRICS_TOKEN the endpoint does not exist."""
+        monkeypatch.delenv("METRICS_TOKEN", raising=False)
+
+        assert client.get("/metrics").status_code == 404
+
+    def test_requires_bearer_token(self, client, monkeypatch):
+        """Scrapers must send METRICS_TOKEN as a bearer token."""
+        monkeypatch.setenv("METRICS_TOKEN", "scrape-secret")
+
+        assert client.get("/metrics").status_code == 401
+        wrong = client.get("/metrics", headers={"Authorization": "Bearer nope"})
+        assert wrong.status_code == 401
+
+        response = client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"})
+        assert response.status_code == 200
+        assert "http_request_duration_seconds" in response.text
@@ -0,0 +1,69 @@
+"""
+Unit Tests for HTTP Middleware
+
+Tests security headers and HTTPS redirect rewriting on a minimal app.
+"""
+
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.responses import PlainTextResponse, RedirectResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from src.middleware import HTTPSRedirectMiddleware, SecurityHeadersMiddleware
+
+
+def make_client() -> TestClient:
+    """App with both middleware in src/main.py order."""
+
+    async def hello(request):
+        return PlainTextResponse("hi", headers={"X-Frame-Options": "SAMEORIGIN"})
+
+    async def moved(request):
+        return RedirectResponse("http://api.example.com/api/tasks", status_code=307)
+
+    async def moved_https(request):
+        return RedirectResponse("https://api.example.com/api/tasks", status_code=307)
+
+    app = Starlette(
+        routes=[
+            Route("/hello", hello),
+            Route("/moved", moved),
+            Route("/moved-https", moved_https),
+        ],
+        middleware=[
+            Middleware(SecurityHeadersMiddleware),
+            Middleware(HTTPSRedirectMiddleware),
+        ],
+    )
+    return TestClient(app)
+
+
+class TestSecurityHeadersMiddleware:
+    """Test security headers"""
+
+    def test_adds_security_headers_once(self):
+        """Every response gets the headers, replacing values set by the app."""
+        response = make_client().get("/hello")
+
+        assert response.text == "hi"
+        assert response.headers["strict-transport-security"] == "max-age=31536000; includeSubDomains"
+        assert response.headers["x-content-type-options"] == "nosniff"
+        assert response.headers.get_list("x-frame-options") == ["DENY"]
+        assert response.headers["referrer-policy"] == "strict-origin-when-cross-origin"
+
+
+class TestHTTPSRedirectMiddleware:
+    """Test redirect Location rewriting"""
+
+    def test_rewrites_http_location(self):
+        """http:// redirects become https://; https:// ones are left alone."""
+        client = make_client()
+
+        response = client.get("/moved", follow_redirects=False)
+        assert response.status_code == 307
+        assert response.headers["location"] == "https://api.example.com/api/tasks"
+        assert response.headers["x-frame-options"] == "DENY"
+
+        response = client.get("/moved-https", follow_redirects=False)
+        assert response.headers["location"] == "https://api.example.com/api/tasks"
@@ -0,0 +1,128 @@
+"""
+Unit Tests for On-Demand Profiling
+
+Tests the ?profile=1 request profile and the worker profile endpoint on a
+minimal app, with Better Auth sessions in an in-memory database.
+"""
+
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.pool import StaticPool
+
+from src import profiling
+from src.api import admin
+from src.db.session import get_session
+from src.models.session import BetterAuthSession
+from src.models.user import User
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Profiling-enabled app with an admin (token 'admin') and a user (token 'user')."""
+    monkeypatch.setattr(profiling, "PROFILING_ADMIN_EMAILS", frozenset({"admin@example.com"}))
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        for name in ("admin", "user"):
+            session.add(User(id=name, email=f"{name}@example.com", name=name))
+            session.add(
+                BetterAuthSession(
+                    id=name,
+                    token=name,
+                    userId=name,
+                    expiresAt=datetime.utcnow() + timedelta(hours=1),
+                )
+            )
+        session.commit()
+
+    def override_get_session():
+        with Session(engine) as session:
+            yield session
+
+    app = FastAPI(dependencies=[Depends(profiling.authorize_request_profile)])
+    app.add_middleware(profiling.ProfilingMiddleware)
+    app.include_router(admin.router)
+    app.dependency_overrides[get_session] = override_get_session
+
+    @app.get("/items")
+    async def list_items():
+        return [{"id": 1}]
+
+    return TestClient(app)
+
+
+def auth(token: str) -> dict:
+    return {"Authorization": f"Bearer {token}"}
+
+
+class TestRequestProfile:
+    """Test ?profile=1"""
+
+    def test_admin_gets_html_report(self, client):
+        """The response is replaced by a pyinstrument report."""
+        response = client.get("/items?profile=1", headers=auth("admin"))
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/html")
+        assert "pyinstrument" in response.text
+
+    def test_speedscope_format(self, client):
+        """profile_format=speedscope returns a speedscope file."""
+        response = client.get("/items?profile=1&profile_format=speedscope", headers=auth("admin"))
+
+        assert response.status_code == 200
+        assert "speedscope" in response.json()["$schema"]
+
+    def test_non_admin_is_rejected(self, client):
+        """Other users get 403, anonymous callers 401."""
+        assert client.get("/items?profile=1", headers=auth("user")).status_code == 403
+        assert client.get("/items?profile=1").status_code == 401
+
+    def test_without_parameter_is_untouched(self, client):
+        """Requests without profile=1 need no admin and are not profiled."""
+        response = client.get("/items?profile=0")
+
+        assert response.status_code == 200
+        assert response.json() == [{"id": 1}]
+
+
+class TestWorkerProfile:
+    """Test whole-worker sampling"""
+
+    def test_samples_other_threads(self):
+        """A busy thread shows up with its function in the sampled stacks."""
+        stop = threading.Event()
+
+        def busy_loop():
+            while not stop.is_set():
+                sum(range(1000))
+
+        thread = threading.Thread(target=busy_loop, name="busy")
+        thread.start()
+        try:
+            profile = profiling.sample_worker(0.05, interval=0.001)
+        finally:
+            stop.set()
+            thread.join()
+
+        names = [frame["name"] for frame in profile["shared"]["frames"]]
+        busy = next(p for p in profile["profiles"] if p["name"] == "busy")
+        assert any(name.endswith("busy_loop") for name in names)
+        assert busy["samples"] and len(busy["samples"]) == len(busy["weights"])
+
+    def test_endpoint_requires_admin(self, client):
+        """/admin/profile returns a speedscope download for admins only."""
+        assert client.get("/admin/profile?seconds=0.01", headers=auth("user")).status_code == 403
+
+        response = client.get("/admin/profile?seconds=0.01", headers=auth("admin"))
+
+        assert response.status_code == 200
+        assert "attachment" in response.headers["content-disposition"]
+        assert response.json()["profiles"]
@@ -0,0 +1,75 @@
+"""
+Unit Tests for Per-Request SQL Instrumentation
+
+Tests query counting, Server-Timing, slow query logging and query budgets
+on a minimal app.
+"""
+
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlmodel.pool import StaticPool
+
+from src.db import query_stats
+from src.db.query_stats import QueryBudgetExceededError, instrument_engine, query_budget
+from src.middleware import QueryStatsMiddleware
+
+
+def make_client(strict: bool) -> TestClient:
+    """App running three queries per request, with a budget of two."""
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    instrument_engine(engine)
+
+    app = FastAPI()
+    app.add_middleware(QueryStatsMiddleware, strict=strict)
+
+    @app.get("/items")
+    @query_budget(2)
+    def list_items():
+        with engine.connect() as conn:
+            for _ in range(3):
+                conn.execute(text("SELECT 1"))
+        return []
+
+    return TestClient(app)
+
+
+class TestQueryStatsMiddleware:
+    """Test per-request query tracking"""
+
+    def test_server_timing_counts_queries(self, caplog):
+        """Queries from sync endpoints (threadpool) count; over budget is logged."""
+        with caplog.at_level(logging.WARNING, logger="src.middleware"):
+            response = make_client(strict=False).get("/items")
+
+        assert response.status_code == 200
+        assert response.headers["server-timing"].startswith("db;dur=")
+        assert response.headers["server-timing"].endswith('desc="3 queries"')
+        assert "GET /items ran 3 queries (budget 2)" in caplog.text
+
+    def test_strict_budget_fails_request(self):
+        """Strict mode raises so the test client surfaces the overrun."""
+        with pytest.raises(QueryBudgetExceededError):
+            make_client(strict=True).get("/items")
+
+
+class TestSlowQueryLog:
+    """Test slow query logging"""
+
+    def test_logs_statement_without_parameters(self, caplog, monkeypatch):
+        """Slow queries are logged with their parameter values redacted."""
+        monkeypatch.setattr(query_stats, "SLOW_QUERY_MS", 0.000001)
+        engine = create_engine("sqlite://")
+        instrument_engine(engine)
+
+        with caplog.at_level(logging.WARNING, logger="src.db.query_stats"):
+            with engine.connect() as conn:
+                conn.execute(text("SELECT :email AS   email"), {"email": "alice@example.com"})
+
+        assert "1 parameters redacted): SELECT ? AS email" in caplog.text
+        assert "alice@example.com" not in caplog.text
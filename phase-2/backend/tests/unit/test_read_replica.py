@@ -0,0 +1,141 @@
+"""
+Unit Tests for Read Replica Routing
+
+Uses two in-memory SQLite databases as primary and replica, so every
+test can tell which one served a read.
+"""
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlmodel import SQLModel, create_engine
+from sqlmodel.pool import StaticPool
+
+from src.db import replica
+from src.db import session as session_module
+from src.db.session import RoutingSession
+from src.middleware import ReadReplicaMiddleware
+from src.models.tag import Tag
+from src.services.tag_service import TagService
+
+
+def make_engine(with_tables: bool = True):
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    if with_tables:
+        SQLModel.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture
+def primary():
+    engine = make_engine()
+    with RoutingSession(engine) as db_session:
+        db_session.add(Tag(id="p", user_id="u1", name="primary"))
+        db_session.commit()
+    return engine
+
+
+@pytest.fixture
+def read_engine(monkeypatch):
+    """Replica holding a different row than the primary."""
+    engine = make_engine()
+    with RoutingSession(engine) as db_session:
+        db_session.add(Tag(id="r", user_id="u1", name="replica"))
+        db_session.commit()
+    monkeypatch.setattr(session_module, "get_read_engine", lambda: engine)
+    monkeypatch.setattr(replica, "_health", replica._ReplicaHealth())
+    return engine
+
+
+def tag_names(db_session) -> list:
+    tags = asyncio.run(TagService(db_session).get_user_tags("u1"))
+    return [tag.name for tag in tags]
+
+
+class TestRouting:
+    """Test which database serves reads"""
+
+    def test_read_only_methods_use_replica(self, primary, read_engine):
+        """replica_read methods read from the replica, other queries from the primary."""
+        with RoutingSession(primary) as db_session:
+            assert tag_names(db_session) == ["replica"]
+            assert db_session.get(Tag, "p").name == "primary"
+
+    def test_session_stays_on_primary_after_write(self, primary, read_engine):
+        """Once the session wrote, its reads see the write."""
+        with RoutingSession(primary) as db_session:
+            db_session.add(Tag(id="new", user_id="u1", name="new"))
+            db_session.commit()
+
+            assert tag_names(db_session) == ["new", "primary"]
+
+    def test_sticky_client_reads_primary(self, primary, read_engine):
+        """Requests with the sticky cookie read from the primary."""
+        with replica.route_reads(sticky=True), RoutingSession(primary) as db_session:
+            assert tag_names(db_session) == ["primary"]
+
+    def test_lagging_replica_falls_back(self, primary, read_engine, monkeypatch):
+        """Reads go to the primary while the replica lags too much."""
+        monkeypatch.setattr(replica, "replica_lag", lambda engine: replica.READ_MAX_LAG_SECONDS + 1)
+
+        with RoutingSession(primary) as db_session:
+            assert tag_names(db_session) == ["primary"]
+
+    def test_failing_replica_is_retried_on_primary(self, primary, monkeypatch):
+        """A replica query error retries the call on the primary."""
+        broken = make_engine(with_tables=False)
+        monkeypatch.setattr(session_module, "get_read_engine", lambda: broken)
+        monkeypatch.setattr(replica, "_health", replica._ReplicaHealth())
+
+        with RoutingSession(primary) as db_session:
+            assert tag_names(db_session) == ["primary"]
+        assert replica._health.available is False
+
+    def test_no_replica_configured(self, primary, monkeypatch):
+        """Without DATABASE_READ_URL everything runs on the primary."""
+        monkeypatch.setattr(session_module, "get_read_engine", lambda: None)
+
+        with RoutingSession(primary) as db_session:
+            assert tag_names(db_session) == ["primary"]
+
+
+class TestStickyCookie:
+    """Test read-your-writes across requests"""
+
+    @pytest.fixture
+    def client(self, primary, read_engine):
+        app = FastAPI()
+        app.add_middleware(ReadReplicaMiddleware)
+
+        @app.get("/tags")
+        def list_tags():
+            with RoutingSession(primary) as db_session:
+                return tag_names(db_session)
+
+        @app.post("/tags")
+        def create_tag():
+            with RoutingSession(primary) as db_session:
+                db_session.add(Tag(id="new", user_id="u1", name="new"))
+                db_session.commit()
+            return {}
+
+        return TestClient(app, base_url="https://testserver")
+
+    def test_write_makes_next_reads_primary(self, client):
+        """The response of a write sets the cookie; reads with it see the write."""
+        assert client.get("/tags").json() == ["replica"]
+
+        response = client.post("/tags")
+        assert replica.STICKY_COOKIE in response.cookies
+
+        assert client.get("/tags").json() == ["new", "primary"]
+
+    def test_reads_do_not_set_cookie(self, client):
+        """Read-only requests stay replica-eligible."""
+        response = client.get("/tags")
+
+        assert "set-cookie" not in response.headers
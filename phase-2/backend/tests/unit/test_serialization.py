@@ -0,0 +1,65 @@
+"""
+Unit Tests for JSON Serialization
+
+Tests dumps() and that model_response() matches FastAPI's response_model output.
+"""
+
+import json
+from datetime import datetime, timezone
+from typing import List
+from uuid import UUID
+
+from fastapi.encoders import jsonable_encoder
+
+from src.models.task import TaskResponse
+from src.serialization import JSONResponse, dumps, model_response
+
+
+def make_task(index: int) -> TaskResponse:
+    return TaskResponse(
+        id=f"650e8400-e29b-41d4-a716-44665544{index:04d}",
+        title=f"Task {index} – café",
+        description=None,
+        is_complete=bool(index % 2),
+        priority=2,
+        due_date=datetime(2025, 12, 31, 23, 59, 59, tzinfo=timezone.utc),
+        user_id="550e8400-e29b-41d4-a716-446655440000",
+        created_at=datetime(2025, 12, 7, 16, 0, 0, 123456),
+        updated_at=datetime(2025, 12, 7, 16, 0, 0),
+        change_seq=index,
+    )
+
+
+class TestDumps:
+    """Test dumps()"""
+
+    def test_encodes_compact_utf8_with_dates(self):
+        """Datetimes become ISO 8601, other types str(), non-ASCII stays raw."""
+        payload = {
+            "title": "café",
+            "timestamp": datetime(2025, 12, 7, 16, 0, 0, tzinfo=timezone.utc),
+            "id": UUID("650e8400-e29b-41d4-a716-446655440001"),
+        }
+
+        encoded = dumps(payload)
+
+        assert isinstance(encoded, bytes)
+        assert encoded == (
+            '{"title":"café","timestamp":"2025-12-07T16:00:00+00:00",'
+            '"id":"650e8400-e29b-41d4-a716-446655440001"}'
+        ).encode("utf-8")
+        assert JSONResponse(payload).body == encoded
+
+
+class TestModelResponse:
+    """Test model_response()"""
+
+    def test_matches_response_model_output(self):
+        """Same JSON as FastAPI's validate + jsonable_encoder + JSONResponse path."""
+        tasks = [make_task(i) for i in range(3)]
+
+        response = model_response(tasks, List[TaskResponse], headers={"ETag": 'W/"1"'})
+
+        assert response.media_type == "application/json"
+        assert response.headers["etag"] == 'W/"1"'
+        assert json.loads(response.body) == jsonable_encoder(tasks)
@@ -852,3 +852,543 @@ class TestEdgeCases:
 
         # Assert
         assert updated_task.description is None
+
+
+class TestSearchTasks:
+    """Test task search (ILIKE fallback on SQLite)"""
+
+    @pytest.fixture
+    def search_user_id(self, session):
+        """User owning a few searchable tasks"""
+        from src.models.user import User
+
+        user = User(id="search-user", email="search@example.com", name="Search User")
+        session.add(user)
+        session.commit()
+
+        for title, description in [
+            ("Buy groceries", "Milk and quarterly report paper"),
+            ("Quarterly report", "Finish the numbers"),
+            ("Walk the dog", None),
+        ]:
+            session.add(Task(title=title, description=description, user_id=user.id))
+        session.commit()
+
+        return user.id
+
+    @pytest.mark.asyncio
+    async def test_search_tasks_orders_title_matches_first(self, session, search_user_id):
+        """Title matches rank above description-only matches."""
+        service = TaskService(session=session)
+
+        results = await service.search_tasks(search_user_id, "quarterly report")
+
+        assert [task.title for task, _, _ in results] == [
+            "Quarterly report",
+            "Buy groceries",
+        ]
+        assert results[0][1] > results[1][1]
+
+    @pytest.mark.asyncio
+    async def test_search_tasks_highlights_matches(self, session, search_user_id):
+        """Snippets wrap the matched text in <mark> tags."""
+        service = TaskService(session=session)
+
+        results = await service.search_tasks(search_user_id, "MILK")
+
+        assert len(results) == 1
+        assert results[0][2] == "<mark>Milk</mark> and quarterly report paper"
+
+    @pytest.mark.asyncio
+    async def test_get_user_tasks_sort_by_relevance(self, session, search_user_id):
+        """sort_by=relevance puts the best match first."""
+        service = TaskService(session=session)
+
+        tasks = await service.get_user_tasks(
+            search_user_id, search="report", sort_by="relevance"
+        )
+
+        assert [task.title for task in tasks] == ["Quarterly report", "Buy groceries"]
+
+    @pytest.mark.asyncio
+    async def test_count_matches_search_results(self, session, search_user_id, monkeypatch):
+        """Pagination totals use the same search strategy as the listing."""
+        from src.services import task_search
+
+        searched = []
+        apply_search = task_search.apply_search
+
+        def spy(query, db_session, text):
+            searched.append(text)
+            return apply_search(query, db_session, text)
+
+        monkeypatch.setattr(task_search, "apply_search", spy)
+        service = TaskService(session=session)
+
+        tasks = await service.get_user_tasks(search_user_id, search="report")
+        total = await service.count_user_tasks(search_user_id, search="report")
+
+        assert total == len(tasks) == 2
+        assert searched == ["report", "report"]
+
+
+class TestTagFilter:
+    """Test tag filtering (all / any match)"""
+
+    @pytest.fixture
+    def tagged_user(self, session):
+        """User with tags work/urgent/home and tasks carrying combinations of them"""
+        from src.models.tag import Tag
+        from src.models.task_tag import TaskTag
+        from src.models.user import User
+
+        user = User(id="tag-user", email="tags@example.com", name="Tag User")
+        session.add(user)
+        session.commit()
+
+        tags = {name: Tag(name=name, user_id=user.id) for name in ("work", "urgent", "home")}
+        session.add_all(tags.values())
+        session.commit()
+
+        for title, tag_names in [
+            ("Work and urgent", ["work", "urgent"]),
+            ("Work only", ["work"]),
+            ("Home only", ["home"]),
+            ("Untagged", []),
+        ]:
+            task = Task(title=title, user_id=user.id)
+            session.add(task)
+            session.commit()
+            for name in tag_names:
+                session.add(TaskTag(task_id=task.id, tag_id=tags[name].id))
+        session.commit()
+
+        return user.id, {name: tag.id for name, tag in tags.items()}
+
+    @pytest.mark.asyncio
+    async def test_match_all_requires_every_tag(self, session, tagged_user):
+        """Default match returns only tasks carrying all tags."""
+        user_id, tag_ids = tagged_user
+        service = TaskService(session=session)
+
+        tasks = await service.get_user_tasks(
+            user_id, tag_ids=[tag_ids["work"], tag_ids["urgent"]]
+        )
+        count = await service.count_user_tasks(
+            user_id, tag_ids=[tag_ids["work"], tag_ids["urgent"]]
+        )
+
+        assert [task.title for task in tasks] == ["Work and urgent"]
+        assert count == 1
+
+    @pytest.mark.asyncio
+    async def test_match_all_ignores_duplicate_tag_ids(self, session, tagged_user):
+        """Repeating a tag ID does not change the required tag count."""
+        user_id, tag_ids = tagged_user
+        service = TaskService(session=session)
+
+        tasks = await service.get_user_tasks(
+            user_id, tag_ids=[tag_ids["work"], tag_ids["work"]]
+        )
+
+        assert sorted(task.title for task in tasks) == ["Work and urgent", "Work only"]
+
+    @pytest.mark.asyncio
+    async def test_match_any_requires_one_tag(self, session, tagged_user):
+        """match=any returns tasks carrying at least one tag, once each."""
+        user_id, tag_ids = tagged_user
+        service = TaskService(session=session)
+
+        tasks = await service.get_user_tasks(
+            user_id,
+            tag_ids=[tag_ids["work"], tag_ids["urgent"], tag_ids["home"]],
+            tag_match="any",
+        )
+
+        assert sorted(task.title for task in tasks) == [
+            "Home only",
+            "Work and urgent",
+            "Work only",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_invalid_match_raises(self, session, tagged_user):
+        """Unknown match modes are rejected."""
+        user_id, tag_ids = tagged_user
+        service = TaskService(session=session)
+
+        with pytest.raises(ValueError):
+            await service.get_user_tasks(user_id, tag_ids=[tag_ids["work"]], tag_match="none")
+
+
+class TestTagCounts:
+    """Test maintained tag task_count"""
+
+    @pytest.fixture
+    def tag_owner(self, session):
+        """User with tags work and home"""
+        from src.models.tag import Tag
+        from src.models.user import User
+
+        user = User(id="count-user", email="counts@example.com", name="Count User")
+        work = Tag(name="work", user_id=user.id)
+        home = Tag(name="home", user_id=user.id)
+        session.add_all([user, work, home])
+        session.commit()
+
+        return user.id, work, home
+
+    @pytest.mark.asyncio
+    async def test_counts_follow_association_changes(self, session, tag_owner):
+        """Creating, retagging and deleting tasks keeps task_count in sync."""
+        user_id, work, home = tag_owner
+        service = TaskService(session=session)
+
+        first = await service.create_task(
+            TaskCreate(title="First", tag_ids=[work.id]), user_id
+        )
+        second = await service.create_task(TaskCreate(title="Second"), user_id)
+        await service.add_tag_to_task(second.id, work.id, user_id)
+        await service.add_tag_to_task(second.id, home.id, user_id)
+        session.refresh(work)
+        session.refresh(home)
+        assert (work.task_count, home.task_count) == (2, 1)
+
+        await service.remove_tag_from_task(second.id, home.id, user_id)
+        await service.set_task_tags(first.id, [home.id], user_id)
+        session.refresh(work)
+        session.refresh(home)
+        assert (work.task_count, home.task_count) == (1, 1)
+
+        await service.delete_task(first.id, user_id)
+        session.refresh(home)
+        assert home.task_count == 0
+
+    @pytest.mark.asyncio
+    async def test_get_user_tags_sorted_by_count(self, session, tag_owner):
+        """sort_by=task_count lists the most used tags first."""
+        from src.services.tag_service import TagService
+
+        user_id, work, home = tag_owner
+        await TaskService(session=session).create_task(
+            TaskCreate(title="Chores", tag_ids=[home.id]), user_id
+        )
+
+        tags = await TagService(session=session).get_user_tags(user_id, sort_by="task_count")
+
+        assert [(tag.name, tag.task_count) for tag in tags] == [("home", 1), ("work", 0)]
+
+    @pytest.mark.asyncio
+    async def test_set_task_tags_applies_diff(self, session, tag_owner):
+        """set_task_tags keeps shared tags, adds new ones and drops the rest."""
+        from sqlmodel import select
+
+        from src.models.task_tag import TaskTag
+
+        user_id, work, home = tag_owner
+        service = TaskService(session=session)
+        task = await service.create_task(
+            TaskCreate(title="Errands", tag_ids=[work.id]), user_id
+        )
+
+        await service.set_task_tags(task.id, [work.id, home.id, home.id], user_id)
+        tag_ids = session.exec(
+            select(TaskTag.tag_id).where(TaskTag.task_id == task.id)
+        ).all()
+        session.refresh(work)
+        session.refresh(home)
+        assert sorted(tag_ids) == sorted([work.id, home.id])
+        assert (work.task_count, home.task_count) == (1, 1)
+
+        await service.set_task_tags(task.id, [], user_id)
+        session.refresh(work)
+        session.refresh(home)
+        assert session.exec(
+            select(TaskTag).where(TaskTag.task_id == task.id)
+        ).all() == []
+        assert (work.task_count, home.task_count) == (0, 0)
+
+
+class TestBatchTasks:
+    """Test batch create/update/complete/delete"""
+
+    @pytest.fixture
+    def batch_user(self, session):
+        """User with a tag and two existing tasks, plus another user's task"""
+        from src.models.tag import Tag
+        from src.models.user import User
+
+        user = User(id="batch-user", email="batch@example.com", name="Batch User")
+        other = User(id="batch-other", email="other@example.com", name="Other User")
+        tag = Tag(name="work", user_id=user.id)
+        first = Task(title="First", user_id=user.id)
+        second = Task(title="Second", user_id=user.id)
+        foreign = Task(title="Foreign", user_id=other.id)
+        session.add_all([user, other, tag, first, second, foreign])
+        session.commit()
+
+        return user.id, tag, first.id, second.id, foreign.id
+
+    @pytest.mark.asyncio
+    async def test_batch_applies_operations_and_reports_failures(self, session, batch_user):
+        """Valid operations are applied; invalid ones get per-item errors."""
+        from src.models.task import TaskBatchOperation
+
+        user_id, tag, first_id, second_id, foreign_id = batch_user
+        service = TaskService(session=session)
+
+        results, applied = await service.batch_tasks(
+            [
+                TaskBatchOperation(op="create", create=TaskCreate(title="New", tag_ids=[tag.id])),
+                TaskBatchOperation(op="update", task_id=first_id, update=TaskUpdate(title="Renamed")),
+                TaskBatchOperation(op="complete", task_id=first_id),
+                TaskBatchOperation(op="delete", task_id=second_id),
+                TaskBatchOperation(op="complete", task_id=foreign_id),
+                TaskBatchOperation(op="delete", task_id="missing"),
+            ],
+            user_id,
+        )
+
+        assert applied is True
+        assert [r.status_code for r in results] == [201, 200, 200, 204, 403, 404]
+        assert [tag.name for tag in results[0].task.tags] == ["work"]
+        assert results[2].task.title == "Renamed"
+        assert results[2].task.is_complete is True
+        assert results[3].task.title == "Second"
+
+        assert session.get(Task, second_id) is None
+        assert session.get(Task, foreign_id).is_complete is False
+        session.refresh(tag)
+        assert tag.task_count == 1
+
+    @pytest.mark.asyncio
+    async def test_atomic_batch_applies_nothing_on_failure(self, session, batch_user):
+        """atomic=True rejects the whole batch when one operation fails."""
+        from src.models.task import TaskBatchOperation
+
+        user_id, _, first_id, _, _ = batch_user
+        service = TaskService(session=session)
+
+        results, applied = await service.batch_tasks(
+            [
+                TaskBatchOperation(op="delete", task_id=first_id),
+                TaskBatchOperation(op="delete", task_id="missing"),
+            ],
+            user_id,
+            atomic=True,
+        )
+
+        assert applied is False
+        assert [r.status_code for r in results] == [424, 404]
+        assert session.get(Task, first_id) is not None
+
+    @pytest.mark.asyncio
+    async def test_changes_to_a_task_deleted_later_are_errors(self, session, batch_user):
+        """Updates of a task that a later operation deletes are not successes."""
+        from src.models.task import TaskBatchOperation
+
+        user_id, _, first_id, _, _ = batch_user
+        service = TaskService(session=session)
+
+        results, applied = await service.batch_tasks(
+            [
+                TaskBatchOperation(op="update", task_id=first_id, update=TaskUpdate(title="Renamed")),
+                TaskBatchOperation(op="complete", task_id=first_id),
+                TaskBatchOperation(op="delete", task_id=first_id),
+            ],
+            user_id,
+        )
+
+        assert applied is True
+        assert [r.status_code for r in results] == [409, 409, 204]
+        assert all(r.error for r in results[:2])
+        assert results[2].task.title == "Renamed"
+        assert session.get(Task, first_id) is None
+
+    @pytest.mark.asyncio
+    async def test_completed_marks_only_false_to_true(self, session, batch_user):
+        """Only operations that complete an incomplete task are completions."""
+        from src.models.task import TaskBatchOperation
+
+        user_id, _, first_id, second_id, _ = batch_user
+        service = TaskService(session=session)
+        await service.toggle_complete(second_id, True, user_id)
+
+        results, _ = await service.batch_tasks(
+            [
+                TaskBatchOperation(op="update", task_id=first_id, update=TaskUpdate(is_complete=True)),
+                TaskBatchOperation(op="complete", task_id=first_id),
+                TaskBatchOperation(op="update", task_id=second_id, update=TaskUpdate(title="Renamed")),
+                TaskBatchOperation(op="complete", task_id=second_id),
+            ],
+            user_id,
+        )
+
+        assert [r.completed for r in results] == [True, False, False, False]
+
+    @pytest.mark.asyncio
+    async def test_batch_endpoint_publishes_completed_on_transition(self, session, batch_user):
+        """task.completed is published only for False -> True changes."""
+        from src.api.tasks import batch_tasks
+        from src.models.task import TaskBatchOperation, TaskBatchRequest
+        from src.models.user import User
+
+        class RecordingPublisher:
+            def __init__(self):
+                self.events = []
+
+            async def publish_task_events(self, events, user_id):
+                self.events.extend(event_type for event_type, _ in events)
+
+        user_id, _, first_id, second_id, _ = batch_user
+        service = TaskService(session=session)
+        await service.toggle_complete(second_id, True, user_id)
+        publisher = RecordingPublisher()
+
+        await batch_tasks(
+            TaskBatchRequest(
+                operations=[
+                    TaskBatchOperation(op="complete", task_id=first_id),
+                    TaskBatchOperation(
+                        op="update", task_id=second_id, update=TaskUpdate(title="Renamed")
+                    ),
+                ]
+            ),
+            current_user=session.get(User, user_id),
+            task_service=service,
+            event_publisher=publisher,
+        )
+
+        assert publisher.events == ["task.completed", "task.updated"]
+
+
+class TestTaskTransfer:
+    """Test streaming export and chunked import"""
+
+    @pytest.fixture
+    def transfer_user(self, session):
+        from src.models.user import User
+
+        user = User(id="transfer-user", email="transfer@example.com", name="Transfer User")
+        session.add(user)
+        session.commit()
+        return user.id
+
+    @pytest.mark.asyncio
+    async def test_import_then_export_round_trip(self, session, transfer_user):
+        """Imported NDJSON (with tags) exports back in CSV with the same data."""
+        import io
+
+        from src.services import task_transfer
+
+        service = TaskService(session=session)
+        upload = io.StringIO(
+            '{"title": "Buy milk", "tags": ["Errands", "home"], "priority": 3}\n'
+            "\n"
+            '{"title": "Pay rent", "is_complete": true, "due_date": "2026-01-01T00:00:00Z"}\n'
+            "not json\n"
+            '{"title": "   "}\n'
+            '{"title": "Walk dog", "tags": ["home"]}\n'
+        )
+
+        result = await service.import_tasks(
+            transfer_user, task_transfer.parse_ndjson(upload), batch_size=2
+        )
+
+        assert (result.imported, result.failed) == (3, 2)
+        assert [error.line for error in result.errors] == [4, 5]
+
+        records = sorted(
+            service.export_tasks(transfer_user, batch_size=2), key=lambda r: r["title"]
+        )
+        assert [(r["title"], r["tags"]) for r in records] == [
+            ("Buy milk", ["errands", "home"]),
+            ("Pay rent", []),
+            ("Walk dog", ["home"]),
+        ]
+        assert records[1]["is_complete"] is True
+        assert records[1]["due_date"].startswith("2026-01-01T00:00:00")
+
+        csv_text = "".join(task_transfer.iter_csv(iter(records)))
+        parsed = [record for _, record in task_transfer.parse_csv(io.StringIO(csv_text))]
+        assert [p["title"] for p in parsed] == ["Buy milk", "Pay rent", "Walk dog"]
+        assert parsed[0]["tags"] == ["errands", "home"]
+
+    @pytest.mark.asyncio
+    async def test_import_reuses_existing_tags(self, session, transfer_user):
+        """Imported tag names match existing tags and keep task_count in sync."""
+        import io
+
+        from sqlmodel import select
+
+        from src.models.tag import Tag
+        from src.services import task_transfer
+
+        home = Tag(name="home", user_id=transfer_user)
+        session.add(home)
+        session.commit()
+
+        service = TaskService(session=session)
+        await service.import_tasks(
+            transfer_user,
+            task_transfer.parse_csv(io.StringIO("title,tags\nDishes,home\nLaundry,Home;chores\n")),
+        )
+
+        tags = session.exec(select(Tag).where(Tag.user_id == transfer_user)).all()
+        counts = {tag.name: tag.task_count for tag in tags}
+        assert counts == {"home": 2, "chores": 1}
+
+
+class TestTaskChanges:
+    """Test the per-user change sequence and incremental sync feed"""
+
+    @pytest.fixture
+    def sync_user(self, session):
+        from src.models.user import User
+
+        user = User(id="sync-user", email="sync@example.com", name="Sync User")
+        session.add(user)
+        session.commit()
+        return user.id
+
+    @pytest.mark.asyncio
+    async def test_changes_since_cursor(self, session, sync_user):
+        """Only tasks written after the cursor are returned, deletes as IDs."""
+        service = TaskService(session=session)
+        first = await service.create_task(TaskCreate(title="First"), sync_user)
+        second = await service.create_task(TaskCreate(title="Second"), sync_user)
+
+        tasks, deleted, since, has_more = await service.get_changes(sync_user)
+        assert [task.title for task in tasks] == ["First", "Second"]
+        assert (deleted, since, has_more) == ([], 2, False)
+
+        await service.update_task(first.id, TaskUpdate(title="First (edited)"), sync_user)
+        await service.delete_task(second.id, sync_user)
+
+        tasks, deleted, since, has_more = await service.get_changes(sync_user, since=2)
+        assert [(task.title, task.change_seq) for task in tasks] == [("First (edited)", 3)]
+        assert (deleted, since, has_more) == ([second.id], 4, False)
+
+        assert await service.get_changes(sync_user, since=4) == ([], [], 4, False)
+        with pytest.raises(ValueError):
+            await service.get_changes(sync_user, since=5)
+
+    @pytest.mark.asyncio
+    async def test_pages_do_not_split_a_write(self, session, sync_user):
+        """A batch shares one sequence value, so a page includes all of it."""
+        from src.models.task import TaskBatchOperation
+
+        service = TaskService(session=session)
+        await service.batch_tasks(
+            [TaskBatchOperation(op="create", create=TaskCreate(title=f"Batch {i}")) for i in range(3)],
+            sync_user,
+        )
+        await service.create_task(TaskCreate(title="Later"), sync_user)
+
+        tasks, _, since, has_more = await service.get_changes(sync_user, limit=2)
+        assert len(tasks) == 3
+        assert (since, has_more) == (1, True)
+
+        tasks, _, since, has_more = await service.get_changes(sync_user, since=since, limit=2)
+        assert [task.title for task in tasks] == ["Later"]
+        assert (since, has_more) == (2, False)
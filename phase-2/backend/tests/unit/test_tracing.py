@@ -0,0 +1,104 @@
+"""
+Unit Tests for Distributed Tracing
+
+Tests trace context propagation through Kafka headers and the Agents SDK
+span bridge, using an in-memory exporter.
+"""
+
+from types import SimpleNamespace
+
+from agents import FunctionSpanData
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from sqlalchemy import create_engine, text
+from todo_observability import tracing
+
+from src.services.agent_service import OpenTelemetryTraceProcessor
+
+
+def make_tracer():
+    """Tracer recording finished spans in memory (the global provider stays unset)."""
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    return provider.get_tracer("test"), exporter
+
+
+class TestKafkaPropagation:
+    """Test trace context in Kafka record headers"""
+
+    def test_consumer_continues_producer_trace(self):
+        """The consumer span joins the trace whose context was put in the headers."""
+        tracer, _ = make_tracer()
+        with tracer.start_as_current_span("publish") as producer:
+            headers = tracing.kafka_headers()
+
+        assert [key for key, _ in headers] == ["traceparent"]
+        with tracing.consumer_span("task-events process", headers) as span:
+            assert span.get_span_context().trace_id == producer.get_span_context().trace_id
+
+    def test_consumer_without_context_uses_current_span(self):
+        """Messages without trace context stay in the delivering request's trace."""
+        tracer, _ = make_tracer()
+        with tracer.start_as_current_span("POST /task-events") as request:
+            with tracing.consumer_span("task-events process", []) as span:
+                assert span.get_span_context().trace_id == request.get_span_context().trace_id
+
+
+class TestEngineTracing:
+    """Test query spans on engines traced where they are created"""
+
+    def test_traced_engine_records_queries(self, monkeypatch):
+        """trace_engine() adds a span per query once tracing is enabled."""
+        tracer, exporter = make_tracer()
+        monkeypatch.setattr(tracing, "TRACES_EXPORTER", "console")
+        monkeypatch.setattr(tracing, "tracer", tracer)
+        engine = create_engine("sqlite://")
+
+        tracing.trace_engine(engine)
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+        assert [span.name for span in exporter.get_finished_spans()] == ["SELECT"]
+
+    def test_disabled_tracing_leaves_engine_alone(self):
+        """Without an exporter, trace_engine() installs nothing."""
+        tracer, exporter = make_tracer()
+        engine = create_engine("sqlite://")
+
+        tracing.trace_engine(engine)
+        with tracer.start_as_current_span("request"):
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+
+        assert [span.name for span in exporter.get_finished_spans()] == ["request"]
+
+
+class TestAgentTraceBridge:
+    """Test re-emitting Agents SDK spans"""
+
+    def test_tool_call_nests_under_run(self):
+        """Tool calls become children of the agent run; their SQL spans nest under them."""
+        tracer, exporter = make_tracer()
+        processor = OpenTelemetryTraceProcessor(tracer)
+        run = SimpleNamespace(trace_id="trace_1", name="Agent workflow")
+        tool = SimpleNamespace(
+            span_id="span_1",
+            span_data=FunctionSpanData(name="add_task", input="{}", output=None),
+            error=None,
+        )
+
+        processor.on_trace_start(run)
+        processor.on_span_start(tool)
+        with tracer.start_as_current_span("SELECT"):
+            pass
+        processor.on_span_end(tool)
+        processor.on_trace_end(run)
+
+        spans = {span.name: span for span in exporter.get_finished_spans()}
+        assert spans["execute_tool add_task"].parent.span_id == spans["agent_run Agent workflow"].context.span_id
+        assert spans["SELECT"].parent.span_id == spans["execute_tool add_task"].context.span_id
+        assert spans["execute_tool add_task"].attributes["gen_ai.tool.name"] == "add_task"
+        assert trace.get_current_span() is trace.INVALID_SPAN
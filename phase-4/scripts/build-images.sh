@@ -36,7 +36,7 @@ echo "🔨 Building Backend (FastAPI) image..."
 docker build \
   -f "$PROJECT_ROOT/phase-4/docker/backend.Dockerfile" \
   -t todo-backend:latest \
-  "$PROJECT_ROOT/phase-2/backend"
+  "$PROJECT_ROOT"
 
 if [ $? -eq 0 ]; then
   echo "✅ Backend image built successfully"
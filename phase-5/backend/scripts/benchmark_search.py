@@ -0,0 +1,183 @@
+"""
+Task Search Benchmark
+
+Compares keyword search strategies on a synthetic tasks table:
+- ilike_seqscan: title/description ILIKE '%q%' without trigram indexes
+  (current behaviour before migration 005)
+- ilike_trgm:    the same ILIKE served by GIN trigram indexes
+- fuzzy_trgm:    word similarity '<%' (SearchService fuzzy mode)
+- fulltext:      search_vector @@ websearch_to_tsquery (fulltext mode)
+
+Data lives in a throwaway schema (search_bench) so the real tasks table is
+never touched. Requires PostgreSQL with pg_trgm available.
+
+Usage:
+    DATABASE_URL=postgresql://... python scripts/benchmark_search.py --rows 1000000
+    python scripts/benchmark_search.py --rows 1000000 --keep   # reuse data next run
+"""
+
+import argparse
+import os
+import statistics
+import time
+
+from sqlalchemy import create_engine, text
+
+SCHEMA = "search_bench"
+
+# Queries per strategy: (label, ILIKE fragment, fuzzy query, full-text query)
+QUERIES = [
+    ("exact word", "groceries", "groceries", "groceries"),
+    ("fragment", "grocer", "grocer", "grocer"),
+    ("typo", "grocry", "grocry", "grocry"),
+    ("two words", "quarterly report", "quartrly report", "quarterly report"),
+]
+
+WORDS = [
+    "buy", "groceries", "quarterly", "report", "review", "budget", "call",
+    "dentist", "schedule", "meeting", "prepare", "slides", "renew", "passport",
+    "finish", "invoice", "update", "roadmap", "book", "flights", "clean",
+    "garage", "pay", "rent", "plan", "birthday", "party", "fix", "bike",
+    "write", "documentation", "deploy", "release", "backup", "photos",
+]
+
+
+def setup(conn, rows: int, users: int) -> None:
+    """Create the benchmark schema and seed it with synthetic tasks."""
+    conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+    conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+    conn.execute(text(f"""
+        CREATE TABLE {SCHEMA}.tasks (
+            id BIGSERIAL PRIMARY KEY,
+            user_id VARCHAR(255) NOT NULL,
+            title VARCHAR(200) NOT NULL,
+            description TEXT,
+            search_vector tsvector GENERATED ALWAYS AS (
+                setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+                setweight(to_tsvector('english', coalesce(description, '')), 'B')
+            ) STORED
+        )
+    """))
+
+    words = "ARRAY[" + ", ".join(f"'{w}'" for w in WORDS) + "]"
+    conn.execute(text(f"""
+        INSERT INTO {SCHEMA}.tasks (user_id, title, description)
+        SELECT
+            'user-' || (g % :users),
+            initcap(w[1 + (g * 7) % n]) || ' ' || w[1 + (g * 13) % n] || ' ' || w[1 + (g * 31) % n],
+            CASE WHEN g % 3 = 0 THEN NULL ELSE
+                w[1 + (g * 17) % n] || ' ' || w[1 + (g * 19) % n] || ' ' ||
+                w[1 + (g * 23) % n] || ' ' || w[1 + (g * 29) % n] || ' and ' ||
+                w[1 + (g * 37) % n] || ' before ' || w[1 + (g * 41) % n]
+            END
+        FROM generate_series(1, :rows) AS g,
+             LATERAL (SELECT {words} AS w, array_length({words}, 1) AS n) AS vocab
+    """), {"rows": rows, "users": users})
+
+    conn.execute(text(f"CREATE INDEX ON {SCHEMA}.tasks (user_id)"))
+    conn.execute(text(f"CREATE INDEX ON {SCHEMA}.tasks USING GIN (search_vector)"))
+    conn.execute(text(f"ANALYZE {SCHEMA}.tasks"))
+
+
+def create_trigram_indexes(conn) -> None:
+    conn.execute(text(
+        f"CREATE INDEX IF NOT EXISTS bench_title_trgm ON {SCHEMA}.tasks USING GIN (title gin_trgm_ops)"
+    ))
+    conn.execute(text(
+        f"CREATE INDEX IF NOT EXISTS bench_description_trgm ON {SCHEMA}.tasks "
+        "USING GIN (description gin_trgm_ops)"
+    ))
+    conn.execute(text(f"ANALYZE {SCHEMA}.tasks"))
+
+
+def drop_trigram_indexes(conn) -> None:
+    conn.execute(text(f"DROP INDEX IF EXISTS {SCHEMA}.bench_title_trgm"))
+    conn.execute(text(f"DROP INDEX IF EXISTS {SCHEMA}.bench_description_trgm"))
+
+
+def statement(strategy: str, scope: str) -> str:
+    """SQL for a strategy; scope is 'user' (one user's tasks) or 'all'."""
+    where_user = "user_id = :user_id AND " if scope == "user" else ""
+    base = f"SELECT id FROM {SCHEMA}.tasks WHERE {where_user}"
+
+    if strategy.startswith("ilike"):
+        return base + "(title ILIKE :pattern OR description ILIKE :pattern) LIMIT 50"
+    if strategy == "fuzzy_trgm":
+        return (
+            base + "(:q <% title OR :q <% description) "
+            "ORDER BY greatest(word_similarity(:q, title), "
+            "word_similarity(:q, coalesce(description, ''))) DESC LIMIT 50"
+        )
+    return (
+        base + "search_vector @@ websearch_to_tsquery('english', :q) "
+        "ORDER BY ts_rank(search_vector, websearch_to_tsquery('english', :q)) DESC LIMIT 50"
+    )
+
+
+def measure(conn, sql: str, params: dict, repeat: int):
+    """Median latency (ms) and row count over repeated executions."""
+    conn.execute(text(sql), params).all()  # warm-up
+    timings = []
+    rows = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rows = len(conn.execute(text(sql), params).all())
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), rows
+
+
+def run(conn, strategies, scope: str, repeat: int, threshold: float) -> None:
+    conn.execute(text(f"SET pg_trgm.word_similarity_threshold = {threshold}"))
+    for label, fragment, fuzzy, fulltext in QUERIES:
+        for strategy in strategies:
+            params = {
+                "pattern": f"%{fragment}%",
+                "q": fuzzy if strategy == "fuzzy_trgm" else fulltext,
+                "user_id": "user-42",
+            }
+            median_ms, rows = measure(conn, statement(strategy, scope), params, repeat)
+            print(f"{scope:<5} {label:<12} {strategy:<14} {median_ms:>10.2f} ms {rows:>6} rows")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark task search strategies")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=1_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--threshold", type=float, default=0.3)
+    parser.add_argument("--keep", action="store_true", help="Reuse existing benchmark data")
+    args = parser.parse_args()
+
+    engine = create_engine(os.environ["DATABASE_URL"])
+
+    with engine.connect() as conn:
+        conn = conn.execution_options(isolation_level="AUTOCOMMIT")
+
+        exists = conn.execute(
+            text("SELECT to_regclass(:name) IS NOT NULL"), {"name": f"{SCHEMA}.tasks"}
+        ).scalar()
+        if not (args.keep and exists):
+            print(f"Seeding {args.rows:,} tasks for {args.users:,} users...")
+            start = time.perf_counter()
+            setup(conn, args.rows, args.users)
+            print(f"Seeded in {time.perf_counter() - start:.1f}s")
+
+        print("\nWithout trigram indexes:")
+        drop_trigram_indexes(conn)
+        for scope in ("user", "all"):
+            run(conn, ["ilike_seqscan", "fulltext"], scope, args.repeat, args.threshold)
+
+        print("\nWith trigram indexes:")
+        start = time.perf_counter()
+        create_trigram_indexes(conn)
+        print(f"(indexes built in {time.perf_counter() - start:.1f}s)")
+        for scope in ("user", "all"):
+            run(conn, ["ilike_trgm", "fuzzy_trgm"], scope, args.repeat, args.threshold)
+
+        if not args.keep:
+            conn.execute(text(f"DROP SCHEMA {SCHEMA} CASCADE"))
+
+
+if __name__ == "__main__":
+    main()
@@ -16,6 +16,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from src.auth.dependencies import get_current_user
 from src.models.advanced_task import (
     RecurringTaskCreate,
+    SearchSuggestion,
     RecurringTaskResponse,
     TaskCategoryCreate,
     TaskCategoryResponse,
@@ -53,10 +54,12 @@ async def search_tasks(
     is_complete: Optional[bool] = Query(None, description="Filter by completion status"),
     due_before: Optional[datetime] = Query(None, description="Filter tasks due before this date"),
     due_after: Optional[datetime] = Query(None, description="Filter tasks due after this date"),
-    sort_by: str = Query("created_at", description="Sort field (created_at, title, due_date, priority)"),
+    sort_by: str = Query("created_at", description="Sort field (created_at, title, due_date, priority, relevance)"),
     sort_order: str = Query("desc", description="Sort order (asc, desc)"),
     limit: int = Query(50, ge=1, le=100, description="Max results"),
     offset: int = Query(0, ge=0, description="Pagination offset"),
+    mode: str = Query("fulltext", pattern="^(fulltext|fuzzy)$", description="Keyword search mode"),
+    threshold: Optional[float] = Query(None, ge=0, le=1, description="Fuzzy match threshold (0-1)"),
     current_user: User = Depends(get_current_user),
     search_service: SearchService = Depends(),
 ):
@@ -64,16 +67,19 @@ async def search_tasks(
     Search and filter tasks with multiple criteria.
 
     **Query Parameters:**
-    - q: Keyword to search in title/description (case-insensitive)
+    - q: Keyword to search in title/description (full-text; supports quoted
+      phrases, OR and -exclusion)
     - priority: Filter by priority (low/medium/high/urgent)
     - category: Filter by category ID
     - is_complete: Filter by completion status (true/false/null for all)
     - due_before: Filter tasks due before this datetime (ISO 8601)
     - due_after: Filter tasks due after this datetime (ISO 8601)
-    - sort_by: Sort field (created_at, title, due_date, priority)
+    - sort_by: Sort field (created_at, title, due_date, priority, relevance)
     - sort_order: Sort direction (asc, desc)
     - limit: Maximum results (1-100, default 50)
     - offset: Pagination offset (default 0)
+    - mode: fulltext (stemmed words, default) or fuzzy (fragments and typos)
+    - threshold: Minimum similarity for fuzzy mode (default 0.3)
 
     **Example:**
     ```
@@ -95,11 +101,41 @@ async def search_tasks(
         sort_order=sort_order,
         limit=limit,
         offset=offset,
+        mode=mode,
+        fuzzy_threshold=threshold,
     )
 
     return [TaskResponse.model_validate(task) for task in tasks]
 
 
+@router.get(
+    "/search/suggest",
+    response_model=SearchSuggestion,
+    status_code=200,
+    summary="Suggest a corrected search query",
+    description="'Did you mean' suggestion built from the user's own task words",
+)
+async def suggest_search_query(
+    q: str = Query(..., min_length=1, max_length=200, description="Search query as typed"),
+    current_user: User = Depends(get_current_user),
+    search_service: SearchService = Depends(),
+):
+    """
+    Suggest a corrected query for likely typos.
+
+    **Example:**
+    ```
+    GET /api/tasks/search/suggest?q=grocry
+    -> {"query": "grocry", "suggestion": "groceries"}
+    ```
+
+    **Returns:**
+    - suggestion: Corrected query, or null if every word is known
+    """
+    suggestion = await search_service.suggest_query(user_id=current_user.id, query=q)
+    return SearchSuggestion(query=q, suggestion=suggestion)
+
+
 # ================== RECURRING TASK ENDPOINTS ==================
 
 
@@ -16,6 +16,7 @@ from typing import Any, Dict, List
 from fastapi import APIRouter, Request, Response
 
 from src.events.event_schemas import TaskEvent
+from src.services.task_stream import get_task_stream_hub
 
 logger = logging.getLogger(__name__)
 
@@ -103,6 +104,9 @@ async def handle_task_event(request: Request) -> Dict[str, str]:
             f"(user={task_event.user_id})"
         )
 
+        # Push the delta to connected clients before the slower handlers
+        get_task_stream_hub().publish(task_event)
+
         # Route to appropriate handler based on event type
         if task_event.event_type == "task.created":
             await handle_task_created(task_event)
@@ -139,8 +143,8 @@ async def handle_task_created(event: TaskEvent):
     """
     logger.info(f"Task created: {event.task_id}")
 
-    from src.services.dapr_client import get_dapr_client
     from src.events.dapr_publisher import get_event_publisher
+    from src.services.dapr_client import get_dapr_client
 
     dapr_client = await get_dapr_client()
 
@@ -173,8 +177,8 @@ async def handle_task_updated(event: TaskEvent):
     """
     logger.info(f"Task updated: {event.task_id}")
 
-    from src.services.dapr_client import get_dapr_client
     from src.events.dapr_publisher import get_event_publisher
+    from src.services.dapr_client import get_dapr_client
 
     dapr_client = await get_dapr_client()
 
@@ -207,8 +211,8 @@ async def handle_task_completed(event: TaskEvent):
     """
     logger.info(f"Task completed: {event.task_id}")
 
-    from src.services.dapr_client import get_dapr_client
     from src.events.dapr_publisher import get_event_publisher
+    from src.services.dapr_client import get_dapr_client
 
     dapr_client = await get_dapr_client()
 
@@ -243,8 +247,8 @@ async def handle_task_deleted(event: TaskEvent):
     """
     logger.info(f"Task deleted: {event.task_id}")
 
-    from src.services.dapr_client import get_dapr_client
     from src.events.dapr_publisher import get_event_publisher
+    from src.services.dapr_client import get_dapr_client
 
     dapr_client = await get_dapr_client()
 
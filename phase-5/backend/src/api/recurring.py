@@ -0,0 +1,98 @@
+"""
+Recurring Task Job API Endpoints
+
+Internal endpoints called by the recurring-task-service cron job through
+Dapr service invocation:
+- Page through due recurring series
+- Spawn next instances for a batch of series in one transaction
+
+Requests must carry the Dapr app API token (APP_API_TOKEN) in the
+'dapr-api-token' header, which the backend's Dapr sidecar adds to invoked
+calls. Without APP_API_TOKEN configured the endpoints are disabled.
+"""
+
+import hmac
+import os
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+
+from src.models.advanced_task import (
+    RecurringDueResponse,
+    RecurringSpawnBatchRequest,
+    RecurringSpawnBatchResponse,
+)
+from src.services.recurring_task_service import RecurringTaskService
+
+
+async def verify_app_token(
+    dapr_api_token: Optional[str] = Header(None, alias="dapr-api-token"),
+) -> None:
+    """Reject requests without the Dapr app API token (fails closed when unset)."""
+    expected = os.getenv("APP_API_TOKEN")
+    if not expected:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="App API token not configured",
+        )
+    if not dapr_api_token or not hmac.compare_digest(
+        dapr_api_token.encode(), expected.encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid app API token",
+        )
+
+
+router = APIRouter(
+    prefix="/api/recurring",
+    tags=["recurring-jobs"],
+    dependencies=[Depends(verify_app_token)],
+)
+
+
+@router.get(
+    "/due",
+    response_model=RecurringDueResponse,
+    status_code=200,
+    summary="List due recurring series",
+)
+async def list_due_recurring(
+    after: Optional[str] = Query(None, description="Cursor (task ID) from the previous page"),
+    limit: int = Query(500, ge=1, le=1000, description="Max series per page"),
+    recurring_service: RecurringTaskService = Depends(),
+):
+    """
+    Get a page of active recurring series whose next occurrence is due.
+
+    **Returns:**
+    - items: Due series (task_id, user_id, next_due_at), ordered by task_id
+    - next_cursor: Pass as `after` to get the next page, null on the last page
+    """
+    return recurring_service.get_due_recurring(after_task_id=after, limit=limit)
+
+
+@router.post(
+    "/spawn-batch",
+    response_model=RecurringSpawnBatchResponse,
+    status_code=200,
+    summary="Spawn next instances for many recurring tasks",
+)
+async def spawn_recurring_batch(
+    batch: RecurringSpawnBatchRequest,
+    recurring_service: RecurringTaskService = Depends(),
+):
+    """
+    Spawn the next instance of every due series in the batch.
+
+    Idempotent: series that are not due (including ones already spawned by
+    an earlier or concurrent call) are returned in `skipped`.
+
+    **Request Body:**
+    - task_ids: Recurring task IDs (1-1000)
+
+    **Returns:**
+    - spawned: New task per spawned series and its next due date
+    - skipped: Task IDs that were not spawned
+    """
+    return recurring_service.spawn_due_batch(batch.task_ids)
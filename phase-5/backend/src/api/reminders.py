@@ -0,0 +1,45 @@
+"""
+Reminder Job API Endpoints
+
+Internal endpoint called by the notification-service cron job through
+Dapr service invocation:
+- Claim and publish all due reminders in batches
+
+Claims are exactly-once, so overlapping cron runs (or several replicas)
+never send a reminder twice.
+Requests must carry the Dapr app API token, as for the recurring jobs.
+"""
+
+from fastapi import APIRouter, Depends, Query
+
+from src.api.recurring import verify_app_token
+from src.models.advanced_task import DueRemindersProcessResponse
+from src.services.reminder_service import ReminderService
+
+router = APIRouter(
+    prefix="/api/reminders",
+    tags=["reminder-jobs"],
+    dependencies=[Depends(verify_app_token)],
+)
+
+
+@router.post(
+    "/process-due",
+    response_model=DueRemindersProcessResponse,
+    status_code=200,
+    summary="Publish due reminders",
+)
+async def process_due_reminders(
+    batch_size: int = Query(500, ge=1, le=1000, description="Reminders per batch"),
+    reminder_service: ReminderService = Depends(),
+):
+    """
+    Claim every due reminder and publish its notification event.
+
+    Reminders whose publish fails are released and picked up by the next run.
+
+    **Returns:**
+    - sent: Number of reminders published
+    """
+    sent = await reminder_service.process_due_reminders(batch_size=batch_size)
+    return DueRemindersProcessResponse(sent=sent)
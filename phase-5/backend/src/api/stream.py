@@ -0,0 +1,63 @@
+"""
+Task Stream API Endpoint
+
+Server-sent events (SSE) push of task changes, replacing client polling:
+- GET /api/stream: task.created / task.updated / task.completed /
+  task.deleted deltas for the authenticated user
+"""
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from sqlmodel import Session
+
+from src.auth.dependencies import get_current_user
+from src.db.session import get_session
+from src.models.user import User
+from src.services.task_stream import get_task_stream_hub
+
+router = APIRouter(prefix="/api", tags=["stream"])
+
+
+@router.get(
+    "/stream",
+    response_class=StreamingResponse,
+    status_code=200,
+    summary="Stream task changes",
+    description="Server-sent events with task deltas for the authenticated user",
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+async def stream_task_events(
+    current_user: User = Depends(get_current_user),
+    session: Session = Depends(get_session),
+):
+    """
+    Open a server-sent event stream of the user's task changes.
+
+    Each message has `event` set to the event type and `data` holding
+    `{"task_id", "task", "timestamp"}`. A `stream.resync` event means the
+    client fell behind: it should refetch its tasks and reconnect.
+    Keep-alive comments are sent while idle. Events are not replayed
+    after a reconnect, so clients refetch on (re)connect.
+
+    **Example:**
+    ```
+    GET /api/stream
+
+    event: task.completed
+    data: {"task_id":"...","task":{"id":"...","is_complete":true},"timestamp":"..."}
+    ```
+    """
+    user_id = current_user.id
+
+    # Authentication is done; return the connection to the pool instead of
+    # holding it for the lifetime of the stream
+    session.close()
+
+    return StreamingResponse(
+        get_task_stream_hub().stream(user_id),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # Disable proxy buffering (nginx)
+        },
+    )
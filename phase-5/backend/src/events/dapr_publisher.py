@@ -13,16 +13,24 @@ Topics:
 
 import logging
 import os
-from typing import Any, Dict, Optional
+import time
+from typing import Any, Dict, List, Optional
+
+from todo_observability import metrics
 
 from src.events.event_schemas import TaskEvent
 from src.services.dapr_client import DaprClient, get_dapr_client
+from src.services.task_stream import get_task_stream_hub
 
 logger = logging.getLogger(__name__)
 
 # Dapr pub/sub component name (defined in dapr/components/pubsub-kafka.yaml)
 PUBSUB_COMPONENT_NAME = "kafka-pubsub"
 
+# Set DAPR_ENABLED=false to run without a sidecar (task events then only
+# reach this process's stream subscribers)
+DAPR_ENABLED = os.getenv("DAPR_ENABLED", "true").lower() != "false"
+
 
 class DaprEventPublisher:
     """
@@ -64,6 +72,7 @@ class DaprEventPublisher:
         Returns:
             True if publish succeeded, False otherwise
         """
+        started = time.perf_counter()
         try:
             client = await self._get_client()
             success = await client.publish_event(
@@ -78,12 +87,56 @@ class DaprEventPublisher:
             else:
                 logger.warning(f"Failed to publish event to {topic}")
 
+            metrics.record_event_publish(topic, started, success)
             return success
 
         except Exception as e:
+            metrics.record_event_publish(topic, started, False)
             logger.error(f"Error publishing event to {topic}: {e}", exc_info=True)
             return False
 
+    async def publish_events_bulk(
+        self,
+        topic: str,
+        events: List[Dict[str, Any]],
+        metadata: Optional[Dict[str, str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Publish a batch of events to a Kafka topic in one Dapr call.
+
+        Args:
+            topic: Kafka topic name
+            events: Event payloads (JSON-serializable)
+            metadata: Optional metadata applied to the whole batch
+
+        Returns:
+            Events that were not published (empty if every event was)
+        """
+        started = time.perf_counter()
+        try:
+            client = await self._get_client()
+            failed = await client.publish_events_bulk(
+                pubsub_name=PUBSUB_COMPONENT_NAME,
+                topic=topic,
+                events=events,
+                metadata=metadata,
+            )
+
+            if not failed:
+                logger.debug(f"Bulk published {len(events)} events to {topic} via Dapr")
+            else:
+                logger.warning(
+                    f"Failed to bulk publish {len(failed)} of {len(events)} events to {topic}"
+                )
+
+            metrics.record_event_publish(topic, started, not failed)
+            return failed
+
+        except Exception as e:
+            metrics.record_event_publish(topic, started, False)
+            logger.error(f"Error bulk publishing events to {topic}: {e}", exc_info=True)
+            return list(events)
+
     async def publish_task_event(
         self,
         event_type: str,
@@ -93,6 +146,10 @@ class DaprEventPublisher:
         """
         Publish a task lifecycle event.
 
+        When Dapr is disabled or the publish fails, the event is handed to
+        the local task stream hub instead, so clients connected to this
+        process still receive it.
+
         Args:
             event_type: Event type (task.created, task.updated, task.completed, task.deleted)
             task_data: Full task object as dictionary
@@ -108,10 +165,17 @@ class DaprEventPublisher:
             user_id=user_id,
         )
 
-        return await self.publish_event(
+        if not DAPR_ENABLED:
+            get_task_stream_hub().publish(event)
+            return True
+
+        published = await self.publish_event(
             topic="task-events",
             data=event.to_dict(),
         )
+        if not published:
+            get_task_stream_hub().publish(event)
+        return published
 
     async def publish_reminder_event(
         self,
@@ -131,6 +195,24 @@ class DaprEventPublisher:
             data=reminder_data,
         )
 
+    async def publish_reminder_events(
+        self,
+        reminders: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Publish a batch of reminder notification events.
+
+        Args:
+            reminders: Reminder event payloads
+
+        Returns:
+            Reminders that were not published (empty on success)
+        """
+        return await self.publish_events_bulk(
+            topic="reminders",
+            events=reminders,
+        )
+
     async def publish_audit_log(
         self,
         event_type: str,
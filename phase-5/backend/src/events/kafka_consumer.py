@@ -14,8 +14,10 @@ import os
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional
 
-from aiokafka import AIOKafkaConsumer
+from aiokafka import AIOKafkaConsumer, TopicPartition
 from aiokafka.errors import KafkaError
+from todo_observability import metrics
+from todo_observability.tracing import consumer_span
 
 from src.events.event_schemas import TaskEvent
 
@@ -97,9 +99,20 @@ class KafkaEventConsumer(ABC):
                 if not self.running:
                     break
 
+                self._record_lag(message)
+
                 try:
-                    # Process message
-                    await self.handle_message(message.value)
+                    # Process message (continuing the producer's trace)
+                    with consumer_span(
+                        f"{message.topic} process",
+                        message.headers,
+                        {
+                            "messaging.system": "kafka",
+                            "messaging.destination.name": message.topic,
+                            "messaging.consumer.group.name": self.group_id,
+                        },
+                    ):
+                        await self.handle_message(message.value)
 
                     # Commit offset after successful processing
                     await self.consumer.commit()
@@ -118,6 +131,14 @@ class KafkaEventConsumer(ABC):
         finally:
             await self.stop()
 
+    def _record_lag(self, message) -> None:
+        """Update the consumer lag gauge from the partition's last fetched high watermark."""
+        highwater = self.consumer.highwater(TopicPartition(message.topic, message.partition))
+        if highwater is not None:
+            metrics.KAFKA_CONSUMER_LAG.labels(
+                self.group_id, message.topic, str(message.partition)
+            ).set(max(highwater - message.offset - 1, 0))
+
     @abstractmethod
     async def handle_message(self, message: Dict[str, Any]):
         """
@@ -15,6 +15,7 @@ from typing import Any, Dict, Optional
 
 from aiokafka import AIOKafkaProducer
 from aiokafka.errors import KafkaError
+from todo_observability.tracing import kafka_headers
 
 from src.events.event_schemas import TaskEvent
 
@@ -109,11 +110,12 @@ class KafkaEventProducer:
             # Encode key if provided
             key_bytes = key.encode("utf-8") if key else None
 
-            # Send message
+            # Send message (trace context in the record headers)
             await self.producer.send_and_wait(
                 topic=topic,
                 value=data,
                 key=key_bytes,
+                headers=kafka_headers(),
             )
 
             logger.debug(f"Published event to {topic}: {event_type}")
@@ -12,7 +12,7 @@ Extended task models for Phase V advanced features:
 import uuid
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import field_validator
 from sqlmodel import Field, SQLModel
@@ -151,10 +151,14 @@ class RecurringTask(SQLModel, table=True):
         default=None,
         description="Next occurrence timestamp (UTC)",
     )
+    series_start_at: Optional[datetime] = Field(
+        default=None,
+        description="Fixed series anchor: first occurrence or RRULE DTSTART (UTC)",
+    )
     cron_expression: Optional[str] = Field(
         default=None,
-        max_length=100,
-        description="Cron expression for custom frequency (e.g., '0 9 * * 1' = Mondays at 9am)",
+        max_length=500,
+        description="Cron expression or RRULE for custom frequency (e.g., '0 9 * * 1' or 'FREQ=WEEKLY;BYDAY=MO')",
     )
     is_active: bool = Field(
         default=True,
@@ -178,6 +182,7 @@ class RecurringTask(SQLModel, table=True):
                 "frequency": "weekly",
                 "interval": 1,
                 "next_due_at": "2026-02-07T09:00:00Z",
+                "series_start_at": "2026-01-31T09:00:00Z",
                 "cron_expression": None,
                 "is_active": True,
                 "created_at": "2025-12-07T16:00:00Z",
@@ -297,7 +302,7 @@ class RecurringTaskCreate(SQLModel):
 
     frequency: FrequencyType
     interval: int = Field(default=1, ge=1)
-    cron_expression: Optional[str] = Field(None, max_length=100)
+    cron_expression: Optional[str] = Field(None, max_length=500)
 
     class Config:
         json_schema_extra = {
@@ -317,6 +322,7 @@ class RecurringTaskResponse(SQLModel):
     frequency: FrequencyType
     interval: int
     next_due_at: Optional[datetime]
+    series_start_at: Optional[datetime] = None
     cron_expression: Optional[str]
     is_active: bool
     created_at: datetime
@@ -326,6 +332,49 @@ class RecurringTaskResponse(SQLModel):
         from_attributes = True
 
 
+class RecurringDueItem(SQLModel):
+    """Due recurring series returned to the recurring-task cron job"""
+
+    task_id: str
+    user_id: str
+    next_due_at: datetime
+
+
+class RecurringDueResponse(SQLModel):
+    """Page of due recurring series (keyset pagination on task_id)"""
+
+    items: List[RecurringDueItem]
+    next_cursor: Optional[str] = None
+
+
+class RecurringSpawnBatchRequest(SQLModel):
+    """Schema for spawning next instances of many recurring tasks"""
+
+    task_ids: List[str] = Field(min_length=1, max_length=1000)
+
+
+class RecurringSpawnResult(SQLModel):
+    """Spawned instance of a recurring task"""
+
+    task_id: str
+    new_task_id: str
+    next_due_at: Optional[datetime]
+
+
+class RecurringSpawnBatchResponse(SQLModel):
+    """Result of a batch spawn; skipped series were not due or already spawned"""
+
+    spawned: List[RecurringSpawnResult]
+    skipped: List[str]
+
+
+class SearchSuggestion(SQLModel):
+    """'Did you mean' suggestion for a search query"""
+
+    query: str
+    suggestion: Optional[str] = None
+
+
 class TaskReminderCreate(SQLModel):
     """Schema for creating a task reminder"""
 
@@ -354,3 +403,9 @@ class TaskReminderResponse(SQLModel):
 
     class Config:
         from_attributes = True
+
+
+class DueRemindersProcessResponse(SQLModel):
+    """Result of a due-reminder processing run"""
+
+    sent: int
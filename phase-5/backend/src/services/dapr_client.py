@@ -11,13 +11,26 @@ Wrapper for Dapr sidecar HTTP API:
 import json
 import logging
 import os
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import httpx
 
 logger = logging.getLogger(__name__)
 
 
+def _failed_bulk_entries(
+    response: httpx.Response, events: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """Events listed in a bulk publish error response (all of them if unknown)."""
+    try:
+        failed_ids = {
+            int(entry["entryId"]) for entry in response.json()["failedEntries"]
+        }
+    except (ValueError, KeyError, TypeError):
+        return list(events)
+    return [event for index, event in enumerate(events) if index in failed_ids]
+
+
 class DaprClient:
     """
     Client for interacting with Dapr sidecar via HTTP API.
@@ -97,6 +110,70 @@ class DaprClient:
             logger.error(f"Unexpected error publishing event: {e}", exc_info=True)
             return False
 
+    async def publish_events_bulk(
+        self,
+        pubsub_name: str,
+        topic: str,
+        events: List[Dict[str, Any]],
+        metadata: Optional[Dict[str, str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Publish many events to a Kafka topic in a single Dapr request.
+
+        Uses the Dapr bulk publish API so a batch of N events costs one
+        sidecar round-trip instead of N. A partially failed request lists
+        the entries that were not published in 'failedEntries'; the others
+        were delivered.
+
+        Args:
+            pubsub_name: Pub/sub component name (e.g., 'kafka-pubsub')
+            topic: Topic name (e.g., 'reminders')
+            events: List of event payloads (JSON-serializable)
+            metadata: Optional metadata applied to the whole batch
+
+        Returns:
+            Events that were not published (empty if every entry was)
+        """
+        if not events:
+            return []
+
+        url = f"{self.base_url}/v1.0-alpha1/publish/bulk/{pubsub_name}/{topic}"
+
+        entries = [
+            {
+                "entryId": str(index),
+                "event": event,
+                "contentType": "application/json",
+            }
+            for index, event in enumerate(events)
+        ]
+
+        try:
+            response = await self.client.post(
+                url,
+                json=entries,
+                headers={"Content-Type": "application/json"},
+                params=metadata or {},
+            )
+
+            if response.status_code == 204:
+                logger.debug(f"Bulk published {len(events)} events to {topic} via Dapr")
+                return []
+
+            failed = _failed_bulk_entries(response, events)
+            logger.error(
+                f"Failed to bulk publish {len(failed)} of {len(events)} events: "
+                f"{response.status_code} {response.text}"
+            )
+            return failed
+
+        except httpx.HTTPError as e:
+            logger.error(f"HTTP error bulk publishing events: {e}")
+            return list(events)
+        except Exception as e:
+            logger.error(f"Unexpected error bulk publishing events: {e}", exc_info=True)
+            return list(events)
+
     async def subscribe_to_topic(
         self,
         pubsub_name: str,
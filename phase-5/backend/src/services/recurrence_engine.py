@@ -0,0 +1,386 @@
+"""
+Recurrence Engine
+
+Occurrence calculation for recurring tasks:
+- Daily, weekly and monthly rules (calendar months, end-of-month clamped)
+- Custom rules as cron expressions or iCalendar RRULEs
+- Vectorized next-occurrence and window expansion for many series at once
+- Compiled rules cached by (frequency, interval, expression)
+
+A series is a rule plus an anchor: the occurrence the rule counts from
+(the recurring task's series_start_at, fixed for the life of the series
+so RRULE COUNT and DTSTART hold across spawns). Occurrences are
+anchor + k * step for k >= 0 for the simple frequencies; custom rules
+yield every match at or after the anchor. All datetimes are naive UTC,
+matching the rest of the backend.
+
+Daily/weekly/monthly series are evaluated with NumPy datetime64
+arithmetic in a single pass; cron and RRULE series fall back to per-series
+iteration with their cached compiled rule.
+"""
+
+import os
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
+from croniter import croniter
+from dateutil.rrule import rrule, rrulestr
+
+from src.models.advanced_task import FrequencyType, RecurringTask
+
+# Maximum number of compiled rules kept in memory
+RULE_CACHE_SIZE = int(os.getenv("RECURRENCE_RULE_CACHE_SIZE", "1024"))
+
+# Default cap on occurrences returned per series by expand_occurrences
+MAX_OCCURRENCES_PER_SERIES = 366
+
+_RESOLUTION = "datetime64[us]"
+_ONE_TICK = np.timedelta64(1, "us")
+
+
+@dataclass(frozen=True)
+class CompiledRule:
+    """
+    Parsed recurrence rule, independent of any anchor.
+
+    kind is one of:
+    - "fixed": constant step (daily/weekly), step holds the step
+    - "monthly": calendar months, months holds the month step
+    - "cron": cron expression in expression
+    - "rrule": parsed RRULE in parsed_rrule (dtstart set per series);
+      dtstart holds the expression's own DTSTART, if it has one
+    """
+
+    kind: str
+    step: Optional[np.timedelta64] = None
+    months: int = 0
+    expression: Optional[str] = None
+    parsed_rrule: Optional[rrule] = None
+    dtstart: Optional[datetime] = None
+
+
+@dataclass
+class RecurrenceSeries:
+    """A recurrence rule anchored at a starting occurrence."""
+
+    frequency: Union[FrequencyType, str]
+    interval: int
+    anchor: datetime
+    cron_expression: Optional[str] = None
+
+    @classmethod
+    def from_recurring(cls, recurring: RecurringTask) -> "RecurrenceSeries":
+        """Build a series from a recurring task configuration."""
+        return cls(
+            frequency=recurring.frequency,
+            interval=recurring.interval,
+            anchor=(
+                recurring.series_start_at
+                or recurring.next_due_at
+                or recurring.created_at
+            ),
+            cron_expression=recurring.cron_expression,
+        )
+
+    @property
+    def rule(self) -> CompiledRule:
+        return compile_rule(
+            _frequency_value(self.frequency), self.interval, self.cron_expression
+        )
+
+
+def is_rrule(expression: str) -> bool:
+    """Whether a custom expression is an RRULE rather than a cron expression."""
+    normalized = expression.strip().upper()
+    return normalized.startswith(("RRULE:", "FREQ=", "DTSTART"))
+
+
+@lru_cache(maxsize=RULE_CACHE_SIZE)
+def compile_rule(
+    frequency: str,
+    interval: int = 1,
+    expression: Optional[str] = None,
+) -> CompiledRule:
+    """
+    Parse and validate a recurrence rule.
+
+    Args:
+        frequency: Frequency type value (daily/weekly/monthly/custom)
+        interval: Interval multiplier for the simple frequencies
+        expression: Cron expression or RRULE for custom frequency
+
+    Returns:
+        Compiled rule (cached)
+
+    Raises:
+        ValueError: If the rule is invalid or an expression is missing
+    """
+    if interval < 1:
+        raise ValueError("Interval must be at least 1")
+
+    if frequency == FrequencyType.DAILY.value:
+        return CompiledRule(kind="fixed", step=np.timedelta64(interval, "D"))
+
+    if frequency == FrequencyType.WEEKLY.value:
+        return CompiledRule(kind="fixed", step=np.timedelta64(7 * interval, "D"))
+
+    if frequency == FrequencyType.MONTHLY.value:
+        return CompiledRule(kind="monthly", months=interval)
+
+    if frequency == FrequencyType.CUSTOM.value:
+        if not expression:
+            raise ValueError("Cron expression required for custom frequency")
+
+        if is_rrule(expression):
+            # A DTSTART line overrides the placeholder dtstart; times are
+            # read as naive UTC like the rest of the backend
+            try:
+                parsed = rrulestr(
+                    expression, dtstart=datetime(1970, 1, 1), ignoretz=True
+                )
+            except Exception as e:
+                raise ValueError(f"Invalid RRULE: {str(e)}")
+            if not isinstance(parsed, rrule):
+                raise ValueError("Only a single RRULE is supported")
+            dtstart = parsed._dtstart if "DTSTART" in expression.upper() else None
+            return CompiledRule(
+                kind="rrule",
+                expression=expression,
+                parsed_rrule=parsed,
+                dtstart=dtstart,
+            )
+
+        if not croniter.is_valid(expression):
+            raise ValueError(f"Invalid cron expression: {expression}")
+        return CompiledRule(kind="cron", expression=expression)
+
+    raise ValueError(f"Unsupported frequency type: {frequency}")
+
+
+def next_occurrence(
+    base_time: datetime,
+    frequency: Union[FrequencyType, str],
+    interval: int = 1,
+    cron_expression: Optional[str] = None,
+    anchor: Optional[datetime] = None,
+) -> Optional[datetime]:
+    """
+    Calculate the first occurrence strictly after base_time.
+
+    The series is anchored at anchor, defaulting to the RRULE's DTSTART
+    and then to base_time, so for the simple frequencies this is usually
+    base_time plus one step (calendar months for monthly). None when a
+    finite RRULE (COUNT/UNTIL) has no further occurrences; callers
+    deactivate the series.
+
+    Raises:
+        ValueError: If the rule is invalid
+    """
+    if anchor is None:
+        anchor = series_dtstart(frequency, interval, cron_expression) or base_time
+    series = RecurrenceSeries(
+        frequency=frequency,
+        interval=interval,
+        anchor=anchor,
+        cron_expression=cron_expression,
+    )
+    return next_occurrences([series], base_time)[0]
+
+
+def series_dtstart(
+    frequency: Union[FrequencyType, str],
+    interval: int = 1,
+    cron_expression: Optional[str] = None,
+) -> Optional[datetime]:
+    """
+    DTSTART given in a custom RRULE, or None when the rule has none.
+
+    Raises:
+        ValueError: If the rule is invalid
+    """
+    return compile_rule(_frequency_value(frequency), interval, cron_expression).dtstart
+
+
+def next_occurrences(
+    series: Sequence[RecurrenceSeries],
+    after: datetime,
+) -> List[Optional[datetime]]:
+    """
+    Calculate the next occurrence strictly after a point in time for many series.
+
+    Args:
+        series: Series to evaluate
+        after: Reference time (naive UTC)
+
+    Returns:
+        Next occurrence per series, in input order (None when a custom rule
+        has no further occurrences)
+
+    Raises:
+        ValueError: If any rule is invalid
+    """
+    results: List[Optional[datetime]] = [None] * len(series)
+    rules = [s.rule for s in series]
+    after64 = np.datetime64(after, "us")
+
+    fixed = [i for i, rule in enumerate(rules) if rule.kind == "fixed"]
+    if fixed:
+        anchors = _anchors(series, fixed)
+        steps = np.array([rules[i].step for i in fixed], dtype="timedelta64[us]")
+        k = np.maximum((after64 - anchors) // steps + 1, 0)
+        _assign(results, fixed, anchors + k * steps)
+
+    monthly = [i for i, rule in enumerate(rules) if rule.kind == "monthly"]
+    if monthly:
+        anchors = _anchors(series, monthly)
+        months = np.array([rules[i].months for i in monthly], dtype=np.int64)
+        k = _first_month_step_after(anchors, months, after64)
+        _assign(results, monthly, _monthly_values(anchors, months, k))
+
+    for i, rule in enumerate(rules):
+        if rule.kind in ("fixed", "monthly"):
+            continue
+        start = max(after, series[i].anchor - timedelta(microseconds=1))
+        results[i] = _custom_after(rule, series[i].anchor, start)
+
+    return results
+
+
+def expand_occurrences(
+    series: Sequence[RecurrenceSeries],
+    window_start: datetime,
+    window_end: datetime,
+    limit: int = MAX_OCCURRENCES_PER_SERIES,
+) -> List[List[datetime]]:
+    """
+    Expand many series over a time window [window_start, window_end).
+
+    Args:
+        series: Series to expand
+        window_start: Window start (inclusive, naive UTC)
+        window_end: Window end (exclusive, naive UTC)
+        limit: Maximum occurrences returned per series
+
+    Returns:
+        Sorted occurrences per series, in input order
+
+    Raises:
+        ValueError: If any rule is invalid
+    """
+    results: List[List[datetime]] = [[] for _ in series]
+    if window_end <= window_start or limit <= 0:
+        return results
+
+    rules = [s.rule for s in series]
+    before_start = np.datetime64(window_start, "us") - _ONE_TICK
+    before_end = np.datetime64(window_end, "us") - _ONE_TICK
+
+    fixed = [i for i, rule in enumerate(rules) if rule.kind == "fixed"]
+    if fixed:
+        anchors = _anchors(series, fixed)
+        steps = np.array([rules[i].step for i in fixed], dtype="timedelta64[us]")
+        first = np.maximum((before_start - anchors) // steps + 1, 0)
+        end = np.maximum((before_end - anchors) // steps + 1, 0)
+        offsets, k = _ranges(first, np.minimum(end - first, limit))
+        values = anchors[offsets] + k * steps[offsets]
+        _assign_ranges(results, fixed, offsets, values)
+
+    monthly = [i for i, rule in enumerate(rules) if rule.kind == "monthly"]
+    if monthly:
+        anchors = _anchors(series, monthly)
+        months = np.array([rules[i].months for i in monthly], dtype=np.int64)
+        first = _first_month_step_after(anchors, months, before_start)
+        end = _first_month_step_after(anchors, months, before_end)
+        offsets, k = _ranges(first, np.minimum(end - first, limit))
+        values = _monthly_values(anchors[offsets], months[offsets], k)
+        _assign_ranges(results, monthly, offsets, values)
+
+    for i, rule in enumerate(rules):
+        if rule.kind in ("fixed", "monthly"):
+            continue
+        anchor = series[i].anchor
+        current = max(window_start, anchor) - timedelta(microseconds=1)
+        while len(results[i]) < limit:
+            current = _custom_after(rule, anchor, current)
+            if current is None or current >= window_end:
+                break
+            results[i].append(current)
+
+    return results
+
+
+# ================== INTERNALS ==================
+
+
+def _frequency_value(frequency: Union[FrequencyType, str]) -> str:
+    return frequency.value if isinstance(frequency, FrequencyType) else frequency
+
+
+def _anchors(series: Sequence[RecurrenceSeries], indices: List[int]) -> np.ndarray:
+    return np.array([series[i].anchor for i in indices], dtype=_RESOLUTION)
+
+
+def _assign(results: list, indices: List[int], values: np.ndarray) -> None:
+    for index, value in zip(indices, values.astype(_RESOLUTION).tolist()):
+        results[index] = value
+
+
+def _ranges(first: np.ndarray, counts: np.ndarray):
+    """Flatten per-series step ranges [first, first + count) into one array."""
+    counts = np.maximum(counts, 0)
+    offsets = np.repeat(np.arange(len(first)), counts)
+    starts = np.cumsum(counts) - counts
+    k = first[offsets] + (np.arange(int(counts.sum())) - starts[offsets])
+    return offsets, k
+
+
+def _assign_ranges(
+    results: List[List[datetime]],
+    indices: List[int],
+    offsets: np.ndarray,
+    values: np.ndarray,
+) -> None:
+    for offset, value in zip(offsets.tolist(), values.astype(_RESOLUTION).tolist()):
+        results[indices[offset]].append(value)
+
+
+def _monthly_values(anchors: np.ndarray, months: np.ndarray, k: np.ndarray) -> np.ndarray:
+    """Occurrence k of monthly series: anchor + k * months, day clamped to month end."""
+    anchor_days = anchors.astype("datetime64[D]")
+    anchor_months = anchors.astype("datetime64[M]")
+    time_of_day = anchors - anchor_days
+    day_index = (anchor_days - anchor_months.astype("datetime64[D]")).astype(np.int64)
+
+    target_months = anchor_months + (k * months).astype("timedelta64[M]")
+    month_lengths = (
+        (target_months + np.timedelta64(1, "M")).astype("datetime64[D]")
+        - target_months.astype("datetime64[D]")
+    ).astype(np.int64)
+    days = np.minimum(day_index, month_lengths - 1)
+
+    return (
+        target_months.astype("datetime64[D]") + days
+    ).astype(_RESOLUTION) + time_of_day
+
+
+def _first_month_step_after(
+    anchors: np.ndarray, months: np.ndarray, after: np.datetime64
+) -> np.ndarray:
+    """Smallest k >= 0 whose monthly occurrence is strictly after a time."""
+    month_gap = (
+        after.astype("datetime64[M]") - anchors.astype("datetime64[M]")
+    ).astype(np.int64)
+    k = np.maximum(month_gap // months, 0)
+    return np.where(_monthly_values(anchors, months, k) > after, k, k + 1)
+
+
+def _custom_after(
+    rule: CompiledRule, anchor: datetime, after: datetime
+) -> Optional[datetime]:
+    """First occurrence of a cron/RRULE series strictly after a time."""
+    if rule.kind == "cron":
+        return croniter(rule.expression, after).get_next(datetime)
+    return rule.parsed_rrule.replace(dtstart=anchor).after(after, inc=False)
@@ -5,24 +5,37 @@ Business logic for recurring task management:
 - Create recurring task configurations
 - Process completed recurring tasks (spawn next instance)
 - Calculate next occurrence based on frequency rules
-- Support daily, weekly, monthly, and custom cron patterns
+- Support daily, weekly, monthly, and custom cron/RRULE patterns
+- Expand recurring tasks over a time window (calendar previews)
+- Spawn due recurring tasks in batches (cron job)
 """
 
-from datetime import datetime, timedelta
-from typing import Optional
+from datetime import datetime
+from typing import Dict, List, Optional
 
-from croniter import croniter
 from fastapi import Depends, HTTPException
 from sqlmodel import Session, select
 
 from src.db.session import get_session
 from src.models.advanced_task import (
     FrequencyType,
+    RecurringDueItem,
+    RecurringDueResponse,
+    RecurringSpawnBatchResponse,
+    RecurringSpawnResult,
     RecurringTask,
     RecurringTaskCreate,
     RecurringTaskResponse,
 )
 from src.models.task import Task, TaskCreate
+from src.services.recurrence_engine import (
+    MAX_OCCURRENCES_PER_SERIES,
+    RecurrenceSeries,
+    expand_occurrences,
+    next_occurrence,
+    next_occurrences,
+    series_dtstart,
+)
 
 
 class RecurringTaskService:
@@ -50,7 +63,8 @@ class RecurringTaskService:
 
         Raises:
             HTTPException: 404 if task not found, 403 if not authorized,
-                          400 if task already has recurrence
+                          400 if task already has recurrence or the rule
+                          has no future occurrences
         """
         # Verify task exists and user owns it
         task = self.session.get(Task, task_id)
@@ -71,13 +85,25 @@ class RecurringTaskService:
                 detail="Task already has recurring configuration. Update or delete it first.",
             )
 
-        # Calculate next occurrence
+        # Calculate first occurrence; the series stays anchored at the
+        # RRULE's DTSTART when given, otherwise at this first occurrence
+        series_start = series_dtstart(
+            recurring_data.frequency,
+            recurring_data.interval,
+            recurring_data.cron_expression,
+        )
         next_due = self._calculate_next_occurrence(
             base_time=datetime.utcnow(),
             frequency=recurring_data.frequency,
             interval=recurring_data.interval,
             cron_expression=recurring_data.cron_expression,
+            anchor=series_start,
         )
+        if next_due is None:
+            raise HTTPException(
+                status_code=400,
+                detail="Recurrence rule has no future occurrences",
+            )
 
         # Create recurring task configuration
         recurring_task = RecurringTask(
@@ -86,6 +112,7 @@ class RecurringTaskService:
             interval=recurring_data.interval,
             cron_expression=recurring_data.cron_expression,
             next_due_at=next_due,
+            series_start_at=series_start or next_due,
             is_active=True,
             created_at=datetime.utcnow(),
             updated_at=datetime.utcnow(),
@@ -112,6 +139,7 @@ class RecurringTaskService:
 
         Returns:
             Newly created task instance, or None if task is not recurring
+            or its series has no further occurrences
 
         Raises:
             HTTPException: 404 if task not found, 403 if not authorized
@@ -133,13 +161,24 @@ class RecurringTaskService:
         if not recurring or not recurring.is_active:
             return None  # Not a recurring task or recurrence disabled
 
-        # Calculate next occurrence
+        # Calculate the first occurrence after the current one (and not in
+        # the past), counted from the fixed series anchor
+        now = datetime.utcnow()
         next_due = self._calculate_next_occurrence(
-            base_time=datetime.utcnow(),
+            base_time=max(recurring.next_due_at or now, now),
             frequency=recurring.frequency,
             interval=recurring.interval,
             cron_expression=recurring.cron_expression,
+            anchor=RecurrenceSeries.from_recurring(recurring).anchor,
         )
+        if next_due is None:
+            # A finite RRULE (COUNT/UNTIL) that has run out deactivates the series
+            recurring.next_due_at = None
+            recurring.is_active = False
+            recurring.updated_at = datetime.utcnow()
+            self.session.add(recurring)
+            self.session.commit()
+            return None
 
         # Create new task instance (copy title, description from original)
         new_task = Task(
@@ -192,52 +231,206 @@ class RecurringTaskService:
 
         return recurring.next_due_at
 
+    def get_occurrences(
+        self,
+        user_id: str,
+        window_start: datetime,
+        window_end: datetime,
+        limit: int = MAX_OCCURRENCES_PER_SERIES,
+    ) -> Dict[str, List[datetime]]:
+        """
+        Expand every active recurring task of a user over a time window.
+
+        Used for calendar previews. All series are loaded with one query and
+        expanded in a single pass by the recurrence engine.
+
+        Args:
+            user_id: User ID
+            window_start: Window start (inclusive, UTC)
+            window_end: Window end (exclusive, UTC)
+            limit: Maximum occurrences per task
+
+        Returns:
+            Occurrences keyed by task ID
+        """
+        recurring_tasks = self.session.exec(
+            select(RecurringTask)
+            .join(Task, Task.id == RecurringTask.task_id)
+            .where(
+                Task.user_id == user_id,
+                RecurringTask.is_active == True,  # noqa: E712
+            )
+        ).all()
+
+        occurrences = expand_occurrences(
+            [RecurrenceSeries.from_recurring(r) for r in recurring_tasks],
+            window_start=window_start,
+            window_end=window_end,
+            limit=limit,
+        )
+
+        return {
+            recurring.task_id: task_occurrences
+            for recurring, task_occurrences in zip(recurring_tasks, occurrences)
+        }
+
+    def get_due_recurring(
+        self,
+        now: Optional[datetime] = None,
+        after_task_id: Optional[str] = None,
+        limit: int = 500,
+    ) -> RecurringDueResponse:
+        """
+        Get a page of active recurring series that are due.
+
+        Pages are keyed on task_id rather than offset, so series that stop
+        being due while the job runs (because they were spawned) do not
+        shift later pages.
+
+        Args:
+            now: Due cutoff (defaults to current time)
+            after_task_id: Cursor - return series with task_id greater than this
+            limit: Maximum series per page
+
+        Returns:
+            Page of due series and the cursor for the next page
+        """
+        now = now or datetime.utcnow()
+
+        query = (
+            select(RecurringTask.task_id, Task.user_id, RecurringTask.next_due_at)
+            .join(Task, Task.id == RecurringTask.task_id)
+            .where(
+                RecurringTask.is_active == True,  # noqa: E712
+                RecurringTask.next_due_at <= now,
+            )
+            .order_by(RecurringTask.task_id)
+            .limit(limit)
+        )
+        if after_task_id is not None:
+            query = query.where(RecurringTask.task_id > after_task_id)
+
+        rows = self.session.exec(query).all()
+        items = [
+            RecurringDueItem(task_id=task_id, user_id=user_id, next_due_at=next_due_at)
+            for task_id, user_id, next_due_at in rows
+        ]
+
+        return RecurringDueResponse(
+            items=items,
+            next_cursor=items[-1].task_id if len(items) == limit else None,
+        )
+
+    def spawn_due_batch(
+        self,
+        task_ids: List[str],
+        now: Optional[datetime] = None,
+    ) -> RecurringSpawnBatchResponse:
+        """
+        Spawn the next instance of many due recurring tasks in one transaction.
+
+        Due series are locked with FOR UPDATE SKIP LOCKED, so concurrent
+        batches (or a retried batch) never spawn the same occurrence twice:
+        a series whose next_due_at has already been advanced is no longer
+        due and is reported as skipped. Next occurrences are computed for
+        the whole batch in a single recurrence-engine pass, skipping any
+        occurrences missed while the job was not running.
+
+        Args:
+            task_ids: Recurring task IDs to spawn
+            now: Due cutoff (defaults to current time)
+
+        Returns:
+            Spawned instances and skipped task IDs
+        """
+        now = now or datetime.utcnow()
+
+        rows = self.session.exec(
+            select(RecurringTask, Task)
+            .join(Task, Task.id == RecurringTask.task_id)
+            .where(
+                RecurringTask.task_id.in_(task_ids),
+                RecurringTask.is_active == True,  # noqa: E712
+                RecurringTask.next_due_at <= now,
+            )
+            .with_for_update(of=RecurringTask, skip_locked=True)
+        ).all()
+
+        next_due_dates = next_occurrences(
+            [RecurrenceSeries.from_recurring(recurring) for recurring, _ in rows],
+            after=now,
+        )
+
+        spawned = []
+        for (recurring, task), next_due in zip(rows, next_due_dates):
+            new_task = Task(
+                title=task.title,
+                description=task.description,
+                is_complete=False,
+                due_date=recurring.next_due_at,
+                priority=task.priority,
+                category_id=task.category_id,
+                user_id=task.user_id,
+                created_at=now,
+                updated_at=now,
+            )
+            self.session.add(new_task)
+
+            # A finite RRULE (COUNT/UNTIL) that has run out deactivates the series
+            recurring.next_due_at = next_due
+            recurring.is_active = next_due is not None
+            recurring.updated_at = now
+            self.session.add(recurring)
+
+            spawned.append(
+                RecurringSpawnResult(
+                    task_id=recurring.task_id,
+                    new_task_id=new_task.id,
+                    next_due_at=next_due,
+                )
+            )
+
+        self.session.commit()
+
+        spawned_ids = {result.task_id for result in spawned}
+        return RecurringSpawnBatchResponse(
+            spawned=spawned,
+            skipped=[task_id for task_id in task_ids if task_id not in spawned_ids],
+        )
+
     def _calculate_next_occurrence(
         self,
         base_time: datetime,
         frequency: FrequencyType,
         interval: int,
         cron_expression: Optional[str] = None,
-    ) -> datetime:
+        anchor: Optional[datetime] = None,
+    ) -> Optional[datetime]:
         """
         Calculate next occurrence based on recurrence rules.
 
         Args:
-            base_time: Starting point (usually current time)
+            base_time: Occurrences at or before this time are skipped
             frequency: Recurrence frequency type
             interval: Interval multiplier
-            cron_expression: Optional cron expression for custom frequency
+            cron_expression: Cron expression or RRULE for custom frequency
+            anchor: Series anchor the rule counts from (defaults to the
+                    RRULE's DTSTART, then base_time)
 
         Returns:
-            Next occurrence timestamp
+            Next occurrence timestamp, or None when a finite RRULE
+            (COUNT/UNTIL) has no further occurrences
 
         Raises:
-            ValueError: If cron expression is invalid or required for custom frequency
+            ValueError: If the expression is invalid or required for custom frequency
         """
-        if frequency == FrequencyType.CUSTOM:
-            if not cron_expression:
-                raise ValueError("Cron expression required for custom frequency")
-
-            try:
-                # Use croniter to calculate next occurrence
-                cron = croniter(cron_expression, base_time)
-                return cron.get_next(datetime)
-            except Exception as e:
-                raise ValueError(f"Invalid cron expression: {str(e)}")
-
-        elif frequency == FrequencyType.DAILY:
-            return base_time + timedelta(days=interval)
-
-        elif frequency == FrequencyType.WEEKLY:
-            return base_time + timedelta(weeks=interval)
-
-        elif frequency == FrequencyType.MONTHLY:
-            # Approximate monthly recurrence (30 days * interval)
-            # For exact month handling, consider using dateutil.relativedelta
-            return base_time + timedelta(days=30 * interval)
-
-        else:
-            raise ValueError(f"Unsupported frequency type: {frequency}")
+        return next_occurrence(
+            base_time=base_time,
+            frequency=frequency,
+            interval=interval,
+            cron_expression=cron_expression,
+            anchor=anchor,
+        )
 
     async def spawn_next_task(
         self,
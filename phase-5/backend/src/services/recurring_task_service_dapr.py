@@ -9,10 +9,9 @@ Business logic for recurring task management with Dapr integration:
 - Cache recurring tasks in Dapr state store
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Optional
 
-from croniter import croniter
 from fastapi import Depends, HTTPException
 from sqlmodel import Session, select
 
@@ -25,6 +24,11 @@ from src.models.advanced_task import (
 )
 from src.models.task import Task, TaskCreate
 from src.services.dapr_client import DaprClient, get_dapr_client
+from src.services.recurrence_engine import (
+    RecurrenceSeries,
+    next_occurrence,
+    series_dtstart,
+)
 from src.services.state_service import StateService, get_state_service
 
 
@@ -80,7 +84,8 @@ class RecurringTaskServiceDapr:
 
         Raises:
             HTTPException: 404 if task not found, 403 if not authorized,
-                          400 if task already has recurrence
+                          400 if task already has recurrence or the rule
+                          has no future occurrences
         """
         # Verify task exists and user owns it
         task = self.session.get(Task, task_id)
@@ -101,13 +106,25 @@ class RecurringTaskServiceDapr:
                 detail="Task already has recurring configuration. Update or delete it first.",
             )
 
-        # Calculate next occurrence
+        # Calculate first occurrence; the series stays anchored at the
+        # RRULE's DTSTART when given, otherwise at this first occurrence
+        series_start = series_dtstart(
+            recurring_data.frequency,
+            recurring_data.interval,
+            recurring_data.cron_expression,
+        )
         next_due = self._calculate_next_occurrence(
             base_time=datetime.utcnow(),
             frequency=recurring_data.frequency,
             interval=recurring_data.interval,
             cron_expression=recurring_data.cron_expression,
+            anchor=series_start,
         )
+        if next_due is None:
+            raise HTTPException(
+                status_code=400,
+                detail="Recurrence rule has no future occurrences",
+            )
 
         # Create recurring task configuration
         recurring_task = RecurringTask(
@@ -116,6 +133,7 @@ class RecurringTaskServiceDapr:
             interval=recurring_data.interval,
             cron_expression=recurring_data.cron_expression,
             next_due_at=next_due,
+            series_start_at=series_start or next_due,
             is_active=True,
             created_at=datetime.utcnow(),
             updated_at=datetime.utcnow(),
@@ -146,6 +164,7 @@ class RecurringTaskServiceDapr:
 
         Returns:
             Newly created task instance, or None if task is not recurring
+            or its series has no further occurrences
 
         Raises:
             HTTPException: 404 if task not found, 403 if not authorized
@@ -167,13 +186,25 @@ class RecurringTaskServiceDapr:
         if not recurring or not recurring.is_active:
             return None  # Not a recurring task or recurrence disabled
 
-        # Calculate next occurrence
+        # Calculate the first occurrence after the current one (and not in
+        # the past), counted from the fixed series anchor
+        now = datetime.utcnow()
         next_due = self._calculate_next_occurrence(
-            base_time=datetime.utcnow(),
+            base_time=max(recurring.next_due_at or now, now),
             frequency=recurring.frequency,
             interval=recurring.interval,
             cron_expression=recurring.cron_expression,
+            anchor=RecurrenceSeries.from_recurring(recurring).anchor,
         )
+        if next_due is None:
+            # A finite RRULE (COUNT/UNTIL) that has run out deactivates the series
+            recurring.next_due_at = None
+            recurring.is_active = False
+            recurring.updated_at = datetime.utcnow()
+            self.session.add(recurring)
+            self.session.commit()
+            await self._invalidate_recurring_cache(task_id)
+            return None
 
         # Create new task instance (copy title, description from original)
         new_task = Task(
@@ -349,46 +380,33 @@ class RecurringTaskServiceDapr:
         frequency: FrequencyType,
         interval: int,
         cron_expression: Optional[str] = None,
-    ) -> datetime:
+        anchor: Optional[datetime] = None,
+    ) -> Optional[datetime]:
         """
         Calculate next occurrence based on recurrence rules.
 
         Args:
-            base_time: Starting point (usually current time)
+            base_time: Occurrences at or before this time are skipped
             frequency: Recurrence frequency type
             interval: Interval multiplier
-            cron_expression: Optional cron expression for custom frequency
+            cron_expression: Cron expression or RRULE for custom frequency
+            anchor: Series anchor the rule counts from (defaults to the
+                    RRULE's DTSTART, then base_time)
 
         Returns:
-            Next occurrence timestamp
+            Next occurrence timestamp, or None when a finite RRULE
+            (COUNT/UNTIL) has no further occurrences
 
         Raises:
-            ValueError: If cron expression is invalid or required for custom frequency
+            ValueError: If the expression is invalid or required for custom frequency
         """
-        if frequency == FrequencyType.CUSTOM:
-            if not cron_expression:
-                raise ValueError("Cron expression required for custom frequency")
-
-            try:
-                # Use croniter to calculate next occurrence
-                cron = croniter(cron_expression, base_time)
-                return cron.get_next(datetime)
-            except Exception as e:
-                raise ValueError(f"Invalid cron expression: {str(e)}")
-
-        elif frequency == FrequencyType.DAILY:
-            return base_time + timedelta(days=interval)
-
-        elif frequency == FrequencyType.WEEKLY:
-            return base_time + timedelta(weeks=interval)
-
-        elif frequency == FrequencyType.MONTHLY:
-            # Approximate monthly recurrence (30 days * interval)
-            # For exact month handling, consider using dateutil.relativedelta
-            return base_time + timedelta(days=30 * interval)
-
-        else:
-            raise ValueError(f"Unsupported frequency type: {frequency}")
+        return next_occurrence(
+            base_time=base_time,
+            frequency=frequency,
+            interval=interval,
+            cron_expression=cron_expression,
+            anchor=anchor,
+        )
 
     async def spawn_next_task(
         self,
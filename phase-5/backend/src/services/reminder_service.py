@@ -4,13 +4,15 @@ Reminder Service
 Business logic for task reminder management:
 - Schedule reminders for tasks
 - Check for due reminders and trigger notifications
+- Claim and publish due reminders in batches
 - Send notifications via Kafka events
 """
 
 from datetime import datetime
-from typing import List
+from typing import Any, Dict, List, Optional
 
 from fastapi import Depends, HTTPException
+from sqlalchemy import update
 from sqlmodel import Session, select
 
 from src.db.session import get_session
@@ -85,8 +87,7 @@ class ReminderService:
         """
         Check for reminders that are due and not yet sent.
 
-        This method should be called periodically (e.g., every minute via cron job)
-        to process pending reminders.
+        Prefer process_due_reminders, which claims and publishes in batches.
 
         Returns:
             List of reminders that need to be sent
@@ -132,15 +133,14 @@ class ReminderService:
         from src.events.dapr_publisher import get_event_publisher
 
         publisher = await get_event_publisher()
-        event_data = {
-            "reminder_id": reminder.id,
-            "task_id": task.id,
-            "task_title": task.title,
-            "user_id": task.user_id,
-            "remind_at": reminder.remind_at.isoformat(),
-            "notification_type": reminder.notification_type.value,
-            "timestamp": datetime.utcnow().isoformat(),
-        }
+        event_data = self._build_event_data(
+            reminder_id=reminder.id,
+            task_id=task.id,
+            task_title=task.title,
+            user_id=task.user_id,
+            remind_at=reminder.remind_at,
+            notification_type=reminder.notification_type,
+        )
         await publisher.publish_reminder_event(event_data)
 
         # Mark reminder as sent
@@ -149,6 +149,174 @@ class ReminderService:
         self.session.add(reminder)
         self.session.commit()
 
+    def claim_due_reminders(self, limit: int = 500) -> List[Dict[str, Any]]:
+        """
+        Atomically claim the oldest due reminders and build their events.
+
+        Batched replacement for check_due_reminders + send_notification:
+        one statement selects, marks and joins a batch instead of one
+        session.get(Task) and one commit per reminder. Served by the
+        idx_task_reminders_due partial index (migration 003).
+
+        Args:
+            limit: Maximum reminders claimed
+
+        Returns:
+            Reminder event payloads ready for bulk publishing
+        """
+        return self._claim(
+            TaskReminder.remind_at <= datetime.utcnow(),
+            limit=limit,
+        )
+
+    async def process_due_reminders(self, batch_size: int = 500) -> int:
+        """
+        Claim and publish all due reminders in batches.
+
+        Called by the notification service's cron job through
+        POST /api/reminders/process-due; safe to run on several replicas
+        at once. Reminders of a batch that fail to publish
+        are released and processing stops until the next call.
+
+        Args:
+            batch_size: Maximum reminders claimed and published per batch
+
+        Returns:
+            Number of reminders published
+        """
+        from src.events.dapr_publisher import get_event_publisher
+
+        publisher = await get_event_publisher()
+        sent = 0
+
+        while True:
+            events = self.claim_due_reminders(limit=batch_size)
+            if not events:
+                break
+
+            failed = await publisher.publish_reminder_events(events)
+            sent += len(events) - len(failed)
+            if failed:
+                self.release_reminders([event["reminder_id"] for event in failed])
+                break
+
+            if len(events) < batch_size:
+                break
+
+        return sent
+
+    def _claim(self, *conditions: Any, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Claim unsent reminders matching conditions in a single statement.
+
+        Runs as one CTE on PostgreSQL:
+
+            WITH due AS (SELECT id ... FOR UPDATE SKIP LOCKED),
+                 claimed AS (UPDATE task_reminders ... RETURNING ...)
+            SELECT ... FROM claimed LEFT JOIN tasks
+
+        SKIP LOCKED lets concurrent replicas take disjoint batches instead of
+        blocking on each other, and the is_sent guard in the UPDATE makes the
+        claim exactly-once. Reminders whose task no longer exists are still
+        marked as sent but produce no event.
+        """
+        now = datetime.utcnow()
+
+        due_query = (
+            select(TaskReminder.id)
+            .where(TaskReminder.is_sent == False, *conditions)  # noqa: E712
+            .order_by(TaskReminder.remind_at)
+            .with_for_update(skip_locked=True)
+        )
+        if limit is not None:
+            due_query = due_query.limit(limit)
+        due = due_query.cte("due")
+
+        claimed = (
+            update(TaskReminder)
+            .where(
+                TaskReminder.id.in_(select(due.c.id)),
+                TaskReminder.is_sent == False,  # noqa: E712
+            )
+            .values(is_sent=True, sent_at=now)
+            .returning(
+                TaskReminder.id,
+                TaskReminder.task_id,
+                TaskReminder.remind_at,
+                TaskReminder.notification_type,
+            )
+            .cte("claimed")
+        )
+
+        rows = self.session.execute(
+            select(
+                claimed.c.id,
+                claimed.c.task_id,
+                claimed.c.remind_at,
+                claimed.c.notification_type,
+                Task.title,
+                Task.user_id,
+            )
+            .select_from(claimed)
+            .outerjoin(Task, Task.id == claimed.c.task_id)
+            .order_by(claimed.c.remind_at)
+        ).all()
+
+        self.session.commit()
+
+        return [
+            self._build_event_data(
+                reminder_id=row.id,
+                task_id=row.task_id,
+                task_title=row.title,
+                user_id=row.user_id,
+                remind_at=row.remind_at,
+                notification_type=row.notification_type,
+            )
+            for row in rows
+            if row.user_id is not None
+        ]
+
+    def release_reminders(self, reminder_ids: List[str]) -> None:
+        """
+        Return claimed reminders to the pending state.
+
+        Called when publishing a claimed batch fails so the reminders are
+        picked up again instead of being silently dropped.
+
+        Args:
+            reminder_ids: Reminder IDs to release
+        """
+        if not reminder_ids:
+            return
+
+        self.session.execute(
+            update(TaskReminder)
+            .where(TaskReminder.id.in_(reminder_ids))
+            .values(is_sent=False, sent_at=None)
+        )
+        self.session.commit()
+
+    @staticmethod
+    def _build_event_data(
+        reminder_id: str,
+        task_id: str,
+        task_title: str,
+        user_id: str,
+        remind_at: datetime,
+        notification_type: Any,
+    ) -> Dict[str, Any]:
+        """Build the 'reminders' topic payload for a reminder."""
+        return {
+            "reminder_id": reminder_id,
+            "task_id": task_id,
+            "task_title": task_title,
+            "user_id": user_id,
+            "remind_at": remind_at.isoformat(),
+            "notification_type": getattr(notification_type, "value", notification_type),
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+
     async def get_task_reminders(
         self,
         task_id: str,
@@ -4,20 +4,43 @@ Search and Filter Service
 Advanced search, filtering, and sorting for tasks:
 - Full-text search by keyword (title, description)
 - Filter by priority, category, due date range, completion status
-- Sort by due_date, priority, created_at, title
+- Sort by due_date, priority, created_at, title, relevance
 - Combine filters for complex queries
+
+Keyword search modes:
+- fulltext (default): generated tasks.search_vector column (migration 004,
+  GIN index) with websearch_to_tsquery and ts_rank
+- fuzzy: pg_trgm word similarity (migration 005, GIN trigram indexes),
+  tolerant of fragments and typos ("grocry" finds "groceries")
+
+On databases other than PostgreSQL, fulltext falls back to ILIKE and fuzzy
+to trigram similarity computed in Python.
 """
 
+import os
+import re
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Set
 
 from fastapi import Depends
+from sqlalchemy import Float, case, func, literal, literal_column, text
 from sqlmodel import Session, col, or_, select
 
 from src.db.session import get_session
 from src.models.advanced_task import TaskCategory, TaskPriority
 from src.models.task import Task
 
+# Text search configuration used by the generated search_vector column
+SEARCH_CONFIG = "english"
+
+# Keyword search modes
+SEARCH_MODES = ("fulltext", "fuzzy")
+
+# Default minimum word similarity (0-1) for fuzzy matches and suggestions
+FUZZY_THRESHOLD = float(os.getenv("SEARCH_FUZZY_THRESHOLD", "0.3"))
+
+_WORD_PATTERN = re.compile(r"[^\W_]+")
+
 
 class SearchService:
     """Service for advanced task search and filtering"""
@@ -38,39 +61,44 @@ class SearchService:
         sort_order: str = "desc",
         limit: int = 50,
         offset: int = 0,
+        mode: str = "fulltext",
+        fuzzy_threshold: Optional[float] = None,
     ) -> List[Task]:
         """
         Search and filter tasks with multiple criteria.
 
         Args:
             user_id: User ID to search within
-            query: Keyword to search in title/description (case-insensitive)
+            query: Keyword to search in title/description (websearch syntax
+                on PostgreSQL: quoted phrases, OR, -exclusion)
             priority: Filter by priority level
             category_id: Filter by category
             is_complete: Filter by completion status
             due_before: Filter tasks due before this date
             due_after: Filter tasks due after this date
-            sort_by: Sort field (due_date, priority, created_at, title)
+            sort_by: Sort field (due_date, priority, created_at, title,
+                relevance - best keyword match first)
             sort_order: Sort direction (asc, desc)
             limit: Maximum results to return
             offset: Number of results to skip (pagination)
+            mode: Keyword search mode (fulltext, fuzzy)
+            fuzzy_threshold: Minimum word similarity for fuzzy mode
+                (default: SEARCH_FUZZY_THRESHOLD)
 
         Returns:
             List of matching tasks
+
+        Raises:
+            ValueError: If mode or sort field is invalid
         """
+        if mode not in SEARCH_MODES:
+            raise ValueError(
+                f"Invalid search mode: {mode}. Valid options: {', '.join(SEARCH_MODES)}"
+            )
+
         # Start with user's tasks
         query_stmt = select(Task).where(Task.user_id == user_id)
 
-        # Apply keyword search (title or description)
-        if query:
-            search_pattern = f"%{query.lower()}%"
-            query_stmt = query_stmt.where(
-                or_(
-                    col(Task.title).ilike(search_pattern),
-                    col(Task.description).ilike(search_pattern),
-                )
-            )
-
         # Filter by priority
         if priority:
             # NOTE: This assumes Task model has priority field (extended in Phase V)
@@ -94,12 +122,29 @@ class SearchService:
         if due_after:
             query_stmt = query_stmt.where(Task.due_date >= due_after)
 
-        # Apply sorting
-        sort_column = self._get_sort_column(sort_by)
-        if sort_order == "asc":
-            query_stmt = query_stmt.order_by(sort_column)
+        # Apply keyword search (title or description)
+        relevance = None
+        if query and mode == "fuzzy":
+            threshold = FUZZY_THRESHOLD if fuzzy_threshold is None else fuzzy_threshold
+            if not self._is_postgres():
+                return self._fuzzy_search_in_python(
+                    query_stmt, query, threshold, sort_by, sort_order, limit, offset
+                )
+            query_stmt, relevance = self._apply_fuzzy_search(query_stmt, query, threshold)
+        elif query:
+            query_stmt, relevance = self._apply_keyword_search(query_stmt, query)
+
+        # Apply sorting (relevance is always best match first)
+        if sort_by == "relevance":
+            if relevance is not None:
+                query_stmt = query_stmt.order_by(relevance.desc())
+            query_stmt = query_stmt.order_by(Task.created_at.desc())
         else:
-            query_stmt = query_stmt.order_by(sort_column.desc())
+            sort_column = self._get_sort_column(sort_by)
+            if sort_order == "asc":
+                query_stmt = query_stmt.order_by(sort_column)
+            else:
+                query_stmt = query_stmt.order_by(sort_column.desc())
 
         # Apply pagination
         query_stmt = query_stmt.limit(limit).offset(offset)
@@ -163,6 +208,171 @@ class SearchService:
             offset=offset,
         )
 
+    def _apply_keyword_search(self, query_stmt, query: str):
+        """
+        Filter by keyword and build a relevance expression.
+
+        Args:
+            query_stmt: Select statement over Task
+            query: Search keyword(s)
+
+        Returns:
+            (filtered statement, relevance expression - higher is better)
+        """
+        if self._is_postgres():
+            search_vector = literal_column("tasks.search_vector")
+            ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, query)
+            query_stmt = query_stmt.where(search_vector.op("@@")(ts_query))
+            return query_stmt, func.ts_rank(search_vector, ts_query)
+
+        search_pattern = f"%{query.lower()}%"
+        title_match = col(Task.title).ilike(search_pattern)
+        query_stmt = query_stmt.where(
+            or_(title_match, col(Task.description).ilike(search_pattern))
+        )
+        relevance = case((title_match, literal(1.0, Float)), else_=literal(0.5, Float))
+        return query_stmt, relevance
+
+    def _apply_fuzzy_search(self, query_stmt, query: str, threshold: float):
+        """
+        Filter by trigram word similarity (PostgreSQL, pg_trgm).
+
+        Uses the '<%' operator so the GIN trigram indexes on title and
+        description can serve the filter; the threshold is set for the
+        current transaction only.
+
+        Args:
+            query_stmt: Select statement over Task
+            query: Search fragment(s), possibly misspelled
+            threshold: Minimum word similarity (0-1)
+
+        Returns:
+            (filtered statement, relevance expression - higher is better)
+        """
+        self.session.execute(
+            text("SELECT set_config('pg_trgm.word_similarity_threshold', :threshold, true)"),
+            {"threshold": str(threshold)},
+        )
+
+        term = literal(query)
+        query_stmt = query_stmt.where(
+            or_(term.op("<%")(Task.title), term.op("<%")(Task.description))
+        )
+        relevance = func.greatest(
+            func.word_similarity(term, Task.title),
+            func.word_similarity(term, func.coalesce(Task.description, "")),
+        )
+        return query_stmt, relevance
+
+    def _fuzzy_search_in_python(
+        self,
+        query_stmt,
+        query: str,
+        threshold: float,
+        sort_by: str,
+        sort_order: str,
+        limit: int,
+        offset: int,
+    ) -> List[Task]:
+        """
+        Fuzzy search fallback for databases without pg_trgm (tests, SQLite).
+
+        Loads every task matching the other filters and scores them in
+        Python, so it is only suitable for small datasets.
+        """
+        if sort_by != "relevance":
+            sort_column = self._get_sort_column(sort_by)
+            query_stmt = query_stmt.order_by(
+                sort_column if sort_order == "asc" else sort_column.desc()
+            )
+
+        scored = []
+        for task in self.session.exec(query_stmt).all():
+            score = max(
+                word_similarity(query, task.title),
+                word_similarity(query, task.description or ""),
+            )
+            if score >= threshold:
+                scored.append((score, task))
+
+        if sort_by == "relevance":
+            scored.sort(key=lambda item: item[0], reverse=True)
+
+        return [task for _, task in scored[offset:offset + limit]]
+
+    async def suggest_query(
+        self,
+        user_id: str,
+        query: str,
+        threshold: Optional[float] = None,
+    ) -> Optional[str]:
+        """
+        Suggest a corrected query ("did you mean") from the user's own words.
+
+        Each query word that does not occur in the user's task titles or
+        descriptions is replaced by the most similar word that does.
+
+        Args:
+            user_id: User ID whose tasks form the vocabulary
+            query: Search query as typed
+            threshold: Minimum trigram similarity for a replacement
+
+        Returns:
+            Corrected query, or None if no word needed correcting
+        """
+        threshold = FUZZY_THRESHOLD if threshold is None else threshold
+        words = _WORD_PATTERN.findall(query.lower())
+        if not words:
+            return None
+
+        vocabulary = self._get_vocabulary(user_id)
+        corrected = []
+        changed = False
+
+        for word in words:
+            if word in vocabulary:
+                corrected.append(word)
+                continue
+
+            best_score, best_word = max(
+                ((trigram_similarity(word, candidate), candidate) for candidate in vocabulary),
+                default=(0.0, word),
+            )
+            if best_score >= threshold:
+                corrected.append(best_word)
+                changed = True
+            else:
+                corrected.append(word)
+
+        return " ".join(corrected) if changed else None
+
+    def _get_vocabulary(self, user_id: str) -> Set[str]:
+        """Distinct lowercase words of a user's task titles and descriptions."""
+        if self._is_postgres():
+            rows = self.session.execute(
+                text("""
+                    SELECT DISTINCT lower(word)
+                    FROM tasks,
+                         regexp_split_to_table(
+                             title || ' ' || coalesce(description, ''),
+                             '[^[:alnum:]]+'
+                         ) AS word
+                    WHERE user_id = :user_id AND length(word) > 1
+                """),
+                {"user_id": user_id},
+            ).all()
+            return {row[0] for row in rows}
+
+        vocabulary = set()
+        tasks = self.session.exec(select(Task).where(Task.user_id == user_id)).all()
+        for task in tasks:
+            source = f"{task.title} {task.description or ''}".lower()
+            vocabulary.update(w for w in _WORD_PATTERN.findall(source) if len(w) > 1)
+        return vocabulary
+
+    def _is_postgres(self) -> bool:
+        return self.session.get_bind().dialect.name == "postgresql"
+
     def _get_sort_column(self, sort_by: str):
         """
         Map sort field name to SQLModel column.
@@ -187,7 +397,7 @@ class SearchService:
         if sort_by not in sort_columns:
             raise ValueError(
                 f"Invalid sort field: {sort_by}. "
-                f"Valid options: {', '.join(sort_columns.keys())}"
+                f"Valid options: {', '.join(sort_columns.keys())}, relevance"
             )
 
         return sort_columns[sort_by]
@@ -266,3 +476,42 @@ class SearchService:
             sort_by="due_date",
             sort_order="asc",  # Nearest deadline first
         )
+
+
+# ================== TRIGRAM SIMILARITY (pg_trgm semantics) ==================
+
+
+def _trigrams(text: str) -> Set[str]:
+    """Trigrams of every word, padded like pg_trgm ('  w', ' wo', 'wor', ...)."""
+    trigrams = set()
+    for word in _WORD_PATTERN.findall(text.lower()):
+        padded = f"  {word} "
+        trigrams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return trigrams
+
+
+def trigram_similarity(a: str, b: str) -> float:
+    """Share of trigrams two strings have in common (pg_trgm similarity)."""
+    trigrams_a, trigrams_b = _trigrams(a), _trigrams(b)
+    if not trigrams_a or not trigrams_b:
+        return 0.0
+    return len(trigrams_a & trigrams_b) / len(trigrams_a | trigrams_b)
+
+
+def word_similarity(query: str, text: str) -> float:
+    """
+    Best similarity between the query and any run of words in text.
+
+    Approximates pg_trgm word_similarity by comparing the query against
+    windows of as many consecutive words as the query has.
+    """
+    query_words = _WORD_PATTERN.findall(query.lower())
+    text_words = _WORD_PATTERN.findall(text.lower())
+    if not query_words or not text_words:
+        return 0.0
+
+    size = min(len(query_words), len(text_words))
+    return max(
+        trigram_similarity(query, " ".join(text_words[i:i + size]))
+        for i in range(len(text_words) - size + 1)
+    )
@@ -11,12 +11,12 @@ State Store Usage:
 - Rate limiting counters
 """
 
-import json
 import logging
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, TypeVar
 
 from pydantic import BaseModel
+
 from src.services.dapr_client import DaprClient, get_dapr_client
 
 logger = logging.getLogger(__name__)
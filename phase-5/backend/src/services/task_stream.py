@@ -0,0 +1,196 @@
+"""
+Task Stream Hub
+
+In-process fan-out of task events to server-sent event (SSE) streams:
+- Every GET /api/stream connection registers a bounded queue for its user
+- publish() formats an event once and hands it to every queue of the
+  event's user without blocking
+- A subscriber that falls behind is told to resync and disconnected
+  instead of buffering without limit
+
+The hub is fed by the Dapr task-events subscription, and directly by
+DaprEventPublisher when Dapr is disabled or unreachable.
+
+Only events delivered to this process reach its subscribers. Dapr
+delivers each message to one replica of an app ID, so with several
+replicas the stream subscription needs a per-replica consumer group.
+
+Usage:
+    hub = get_task_stream_hub()
+    async for message in hub.stream(user_id):
+        ...  # SSE-formatted text
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+import os
+from typing import AsyncIterator, Dict, Optional, Set
+
+from src.events.event_schemas import TaskEvent
+
+logger = logging.getLogger(__name__)
+
+# Events pushed to clients
+STREAM_EVENT_TYPES = ("task.created", "task.updated", "task.completed", "task.deleted")
+
+# Pending messages per connection before it is told to resync
+STREAM_QUEUE_SIZE = int(os.getenv("STREAM_QUEUE_SIZE", "100"))
+
+# Idle interval between keep-alive comments (keeps proxies from timing out)
+HEARTBEAT_SECONDS = float(os.getenv("STREAM_HEARTBEAT_SECONDS", "15"))
+
+# Client reconnect delay sent in the SSE retry field
+RECONNECT_MILLISECONDS = 5000
+
+# Sent to a subscriber whose queue overflowed; the client should refetch
+RESYNC_EVENT = "stream.resync"
+
+
+class TaskStreamHub:
+    """
+    Per-user fan-out hub.
+
+    Queues hold SSE-formatted strings; None is the end-of-stream sentinel.
+    """
+
+    def __init__(
+        self,
+        queue_size: int = STREAM_QUEUE_SIZE,
+        heartbeat_seconds: float = HEARTBEAT_SECONDS,
+    ):
+        """
+        Initialize task stream hub.
+
+        Args:
+            queue_size: Pending messages per connection before it is dropped
+            heartbeat_seconds: Idle interval between keep-alive comments
+        """
+        self.queue_size = queue_size
+        self.heartbeat_seconds = heartbeat_seconds
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+        self._event_ids = itertools.count(1)
+
+    @property
+    def connection_count(self) -> int:
+        """Number of open stream connections in this process."""
+        return sum(len(queues) for queues in self._subscribers.values())
+
+    # ================== SUBSCRIPTIONS ==================
+
+    def subscribe(self, user_id: str) -> asyncio.Queue:
+        """
+        Register a connection for a user's events.
+
+        Returns:
+            Queue receiving SSE-formatted messages (None ends the stream)
+        """
+        # At least two slots: an overflowing queue is drained and gets the
+        # resync message and the end-of-stream sentinel
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max(self.queue_size, 2))
+        self._subscribers.setdefault(user_id, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, user_id: str, queue: asyncio.Queue) -> None:
+        """Remove a connection (no-op if already removed)."""
+        queues = self._subscribers.get(user_id)
+        if queues is None:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._subscribers[user_id]
+
+    async def stream(self, user_id: str) -> AsyncIterator[str]:
+        """
+        SSE messages for one connection, until the client disconnects or
+        falls behind.
+
+        Emits a keep-alive comment after heartbeat_seconds without events.
+        """
+        queue = self.subscribe(user_id)
+        try:
+            yield f"retry: {RECONNECT_MILLISECONDS}\n\n"
+            while True:
+                try:
+                    message = await asyncio.wait_for(queue.get(), self.heartbeat_seconds)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if message is None:
+                    return
+                yield message
+        finally:
+            self.unsubscribe(user_id, queue)
+
+    # ================== PUBLISHING ==================
+
+    def publish(self, event: TaskEvent) -> int:
+        """
+        Deliver a task event to the open streams of its user.
+
+        Never blocks: the event is serialized once and put on each queue.
+
+        Args:
+            event: Task lifecycle event
+
+        Returns:
+            Number of connections the event was delivered to
+        """
+        if event.event_type not in STREAM_EVENT_TYPES:
+            return 0
+
+        queues = self._subscribers.get(event.user_id)
+        if not queues:
+            return 0
+
+        message = format_event(
+            next(self._event_ids),
+            event.event_type,
+            {
+                "task_id": event.task_id,
+                "task": event.task_data,
+                "timestamp": event.timestamp.isoformat(),
+            },
+        )
+
+        delivered = 0
+        for queue in list(queues):
+            try:
+                queue.put_nowait(message)
+                delivered += 1
+            except asyncio.QueueFull:
+                self._drop(event.user_id, queue)
+        return delivered
+
+    def _drop(self, user_id: str, queue: asyncio.Queue) -> None:
+        """Replace a lagging connection's backlog with a resync notice and close it."""
+        logger.warning(f"Task stream for user {user_id} fell behind; asking client to resync")
+        self.unsubscribe(user_id, queue)
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(format_event(next(self._event_ids), RESYNC_EVENT, {}))
+        queue.put_nowait(None)
+
+
+def format_event(event_id: int, event_type: str, data: Dict) -> str:
+    """Format one SSE message."""
+    payload = json.dumps(data, separators=(",", ":"), default=str)
+    return f"id: {event_id}\nevent: {event_type}\ndata: {payload}\n\n"
+
+
+# Global hub instance (singleton pattern)
+_hub_instance: Optional[TaskStreamHub] = None
+
+
+def get_task_stream_hub() -> TaskStreamHub:
+    """
+    Get global task stream hub instance.
+
+    Returns:
+        Shared TaskStreamHub instance
+    """
+    global _hub_instance
+    if _hub_instance is None:
+        _hub_instance = TaskStreamHub()
+    return _hub_instance
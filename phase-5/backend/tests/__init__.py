@@ -0,0 +1,3 @@
+"""
+Phase V Backend Test Suite
+"""
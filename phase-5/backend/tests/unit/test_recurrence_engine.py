@@ -0,0 +1,145 @@
+"""
+Unit Tests for the Recurrence Engine
+
+Tests occurrence calculation for the simple frequencies (vectorized),
+cron expressions and RRULEs, including finite rules that run out.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from src.models.advanced_task import FrequencyType
+from src.services.recurrence_engine import (
+    RecurrenceSeries,
+    compile_rule,
+    expand_occurrences,
+    is_rrule,
+    next_occurrence,
+    next_occurrences,
+    series_dtstart,
+)
+
+
+class TestMonthly:
+    """Test calendar-month recurrence"""
+
+    def test_month_end_is_clamped(self):
+        """Jan 31 recurs on the last day of shorter months."""
+        assert next_occurrence(datetime(2026, 1, 31, 9), "monthly") == datetime(2026, 2, 28, 9)
+        assert next_occurrence(datetime(2028, 1, 31, 9), "monthly") == datetime(2028, 2, 29, 9)
+
+    def test_clamping_does_not_drift(self):
+        """A series anchored on the 31st returns to the 31st after February."""
+        series = RecurrenceSeries(
+            frequency=FrequencyType.MONTHLY, interval=1, anchor=datetime(2026, 1, 31)
+        )
+
+        occurrences = expand_occurrences([series], datetime(2026, 1, 1), datetime(2026, 5, 1))
+
+        assert occurrences == [
+            [
+                datetime(2026, 1, 31),
+                datetime(2026, 2, 28),
+                datetime(2026, 3, 31),
+                datetime(2026, 4, 30),
+            ]
+        ]
+
+
+class TestCustomRules:
+    """Test cron expressions and RRULEs"""
+
+    def test_cron_expression(self):
+        """Cron rules yield the next match after the base time."""
+        # 2026-01-01 is a Thursday; "0 9 * * 1" is Mondays at 09:00
+        assert next_occurrence(
+            datetime(2026, 1, 1, 10), "custom", cron_expression="0 9 * * 1"
+        ) == datetime(2026, 1, 5, 9)
+
+    def test_invalid_rules_are_rejected(self):
+        """Malformed expressions and missing expressions raise ValueError."""
+        with pytest.raises(ValueError):
+            compile_rule("custom", 1, "not a cron")
+        with pytest.raises(ValueError):
+            compile_rule("custom", 1, None)
+        with pytest.raises(ValueError):
+            compile_rule("daily", 0)
+
+    def test_rrule_detection(self):
+        assert is_rrule("RRULE:FREQ=WEEKLY;BYDAY=MO,WE")
+        assert is_rrule("freq=daily;count=3")
+        assert not is_rrule("0 9 * * 1")
+
+    def test_rrule_with_count_runs_out(self):
+        """A COUNT rule has no occurrence after its last one."""
+        series = RecurrenceSeries(
+            frequency="custom",
+            interval=1,
+            anchor=datetime(2026, 1, 1, 9),
+            cron_expression="FREQ=DAILY;COUNT=3",
+        )
+
+        assert next_occurrences([series], datetime(2026, 1, 2, 12)) == [datetime(2026, 1, 3, 9)]
+        assert next_occurrences([series], datetime(2026, 1, 3, 9)) == [None]
+
+    def test_rrule_dtstart_anchors_series(self):
+        """A DTSTART line anchors the series instead of the base time."""
+        expression = "DTSTART:20260105T090000Z\nRRULE:FREQ=DAILY;COUNT=3"
+
+        assert series_dtstart("custom", 1, expression) == datetime(2026, 1, 5, 9)
+        assert next_occurrence(datetime(2026, 1, 1), "custom", cron_expression=expression) == (
+            datetime(2026, 1, 5, 9)
+        )
+        assert next_occurrence(datetime(2026, 1, 7, 9), "custom", cron_expression=expression) is None
+        assert series_dtstart("custom", 1, "FREQ=DAILY;COUNT=3") is None
+
+    def test_rrule_with_past_until_runs_out(self):
+        """next_occurrence returns None once UNTIL has passed."""
+        assert (
+            next_occurrence(
+                datetime(2026, 2, 1),
+                "custom",
+                cron_expression="FREQ=DAILY;UNTIL=20260115T000000",
+            )
+            is None
+        )
+
+
+class TestBatches:
+    """Test many series evaluated together"""
+
+    def test_next_occurrences_mixed_series(self):
+        """Results come back in input order across rule kinds."""
+        anchor = datetime(2026, 1, 1, 8)
+        series = [
+            RecurrenceSeries(frequency="weekly", interval=2, anchor=anchor),
+            RecurrenceSeries(frequency="daily", interval=1, anchor=anchor),
+            RecurrenceSeries(
+                frequency="custom", interval=1, anchor=anchor, cron_expression="30 7 * * *"
+            ),
+        ]
+
+        assert next_occurrences(series, datetime(2026, 1, 10)) == [
+            datetime(2026, 1, 15, 8),
+            datetime(2026, 1, 10, 8),
+            datetime(2026, 1, 10, 7, 30),
+        ]
+
+    def test_expand_window(self):
+        """Window expansion is [start, end) and respects the per-series limit."""
+        anchor = datetime(2026, 1, 1)
+        daily = RecurrenceSeries(frequency="daily", interval=1, anchor=anchor)
+        weekly = RecurrenceSeries(frequency="weekly", interval=1, anchor=anchor)
+
+        occurrences = expand_occurrences(
+            [daily, weekly], datetime(2026, 1, 3), datetime(2026, 1, 15), limit=5
+        )
+
+        assert occurrences[0] == [datetime(2026, 1, day) for day in range(3, 8)]
+        assert occurrences[1] == [datetime(2026, 1, 8)]
+
+    def test_window_before_anchor_is_empty(self):
+        series = RecurrenceSeries(frequency="daily", interval=1, anchor=datetime(2026, 6, 1))
+
+        assert expand_occurrences([series], datetime(2026, 1, 1), datetime(2026, 2, 1)) == [[]]
@@ -0,0 +1,113 @@
+"""
+Unit Tests for the Recurring Task Service
+
+Tests that a series stays anchored at its first occurrence (or DTSTART)
+across spawns, so finite RRULEs run out and deactivate the series.
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.pool import StaticPool
+
+from src.models.advanced_task import FrequencyType, RecurringTask, RecurringTaskCreate
+from src.models.task import Task
+from src.models.user import User
+from src.services.recurring_task_service import RecurringTaskService
+
+
+@pytest.fixture(name="session")
+def session_fixture():
+    """In-memory SQLite session with all tables created."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        yield session
+
+    SQLModel.metadata.drop_all(engine)
+
+
+@pytest.fixture(name="task")
+def task_fixture(session: Session) -> Task:
+    session.add(User(id="user-1", email="user1@example.com", name="User One"))
+    task = Task(title="Standup", user_id="user-1")
+    session.add(task)
+    session.commit()
+    session.refresh(task)
+    return task
+
+
+class TestSeriesAnchor:
+    """Test that spawning never re-anchors the series"""
+
+    @pytest.mark.asyncio
+    async def test_dtstart_anchors_series_and_count_runs_out(
+        self, session: Session, task: Task
+    ):
+        """A DTSTART/COUNT series spawns COUNT instances, then deactivates."""
+        service = RecurringTaskService(session)
+        created = await service.create_recurring(
+            task.id,
+            RecurringTaskCreate(
+                frequency=FrequencyType.CUSTOM,
+                cron_expression="DTSTART:20300105T090000Z\nRRULE:FREQ=DAILY;COUNT=3",
+            ),
+            "user-1",
+        )
+
+        assert created.next_due_at == datetime(2030, 1, 5, 9)
+        assert created.series_start_at == datetime(2030, 1, 5, 9)
+
+        spawned_due_dates = []
+        for day in (5, 6, 7):
+            batch = service.spawn_due_batch([task.id], now=datetime(2030, 1, day, 9))
+            assert [result.task_id for result in batch.spawned] == [task.id]
+            spawned_due_dates.append(session.get(Task, batch.spawned[0].new_task_id).due_date)
+
+        recurring = session.get(RecurringTask, created.id)
+        assert spawned_due_dates == [
+            datetime(2030, 1, 5, 9),
+            datetime(2030, 1, 6, 9),
+            datetime(2030, 1, 7, 9),
+        ]
+        assert recurring.next_due_at is None
+        assert recurring.is_active is False
+
+        # Past COUNT nothing is due any more
+        batch = service.spawn_due_batch([task.id], now=datetime(2030, 2, 1))
+        assert batch.spawned == []
+        assert batch.skipped == [task.id]
+
+    @pytest.mark.asyncio
+    async def test_completing_past_count_deactivates_series(
+        self, session: Session, task: Task
+    ):
+        """Completions count from the first occurrence, not from completion time."""
+        service = RecurringTaskService(session)
+        created = await service.create_recurring(
+            task.id,
+            RecurringTaskCreate(
+                frequency=FrequencyType.CUSTOM,
+                cron_expression="RRULE:FREQ=DAILY;COUNT=2",
+            ),
+            "user-1",
+        )
+        first_due = created.next_due_at
+
+        assert created.series_start_at == first_due
+
+        assert await service.process_completed_recurring(task.id, "user-1") is not None
+        recurring = session.get(RecurringTask, created.id)
+        assert recurring.series_start_at == first_due
+        assert recurring.next_due_at > first_due
+
+        assert await service.process_completed_recurring(task.id, "user-1") is None
+        session.refresh(recurring)
+        assert recurring.next_due_at is None
+        assert recurring.is_active is False
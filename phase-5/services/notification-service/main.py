@@ -4,18 +4,31 @@ Notification Service
 Microservice for processing reminder notifications.
 Subscribes to 'reminders' Kafka topic via Dapr pub/sub and
 delivers notifications via email, push, or in-app methods.
+
+In-app notifications are buffered into micro-batches and written to the
+Dapr state store with one request per batch, together with a per-user
+index key ('notifications:user:{user_id}') holding the user's recent
+notifications, so a user's notifications can be fetched in a single read.
+GET /api/notifications/{user_id} is limited to that user (backend JWT) and
+to services invoking through Dapr (app API token).
 """
 
+import asyncio
+import hmac
 import json
 import logging
 import os
 import uuid
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
-from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi import Depends, FastAPI, Header, HTTPException, Request, Response
+from jose import JWTError, jwt
 from pydantic import BaseModel
+from todo_observability.metrics import MetricsMiddleware, metrics_response
+from todo_observability.tracing import configure_tracing
 
 # Configure logging
 logging.basicConfig(
@@ -24,12 +37,146 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Dapr configuration
+DAPR_HTTP_PORT = int(os.getenv("DAPR_HTTP_PORT", "3500"))
+DAPR_STATE_STORE = "postgres-statestore"
+DAPR_STATE_URL = f"http://localhost:{DAPR_HTTP_PORT}/v1.0/state/{DAPR_STATE_STORE}"
+
+# In-app notification batching
+NOTIFICATION_BATCH_SIZE = int(os.getenv("NOTIFICATION_BATCH_SIZE", "100"))
+NOTIFICATION_FLUSH_INTERVAL_SECONDS = float(
+    os.getenv("NOTIFICATION_FLUSH_INTERVAL_SECONDS", "0.05")
+)
+NOTIFICATION_TTL_SECONDS = "604800"  # 7 days
+USER_INDEX_MAX_ENTRIES = 100
+STATE_WRITE_RETRIES = 3
+
+# Notification query access: the user's own backend JWT, or the Dapr app API
+# token sent by the sidecar for service invocation. Without either
+# configured every query is rejected.
+APP_API_TOKEN = os.getenv("APP_API_TOKEN")
+JWT_SECRET = os.getenv("JWT_SECRET")
+JWT_ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
+
+# Shared HTTP client for the Dapr sidecar (created in lifespan)
+http_client: Optional[httpx.AsyncClient] = None
+
+
+def user_index_key(user_id: str) -> str:
+    """State key of a user's notification index."""
+    return f"notifications:user:{user_id}"
+
+
+class NotificationBatcher:
+    """
+    Buffers in-app notifications and writes them to the state store in batches.
+
+    Callers await add(), which resolves once the batch containing their
+    notification has been written, so Dapr only gets an ack for a reminder
+    after its notification is stored.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = NOTIFICATION_BATCH_SIZE,
+        flush_interval: float = NOTIFICATION_FLUSH_INTERVAL_SECONDS,
+    ):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._runner: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """Start the background flush loop."""
+        if self._runner is None:
+            self._runner = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Flush pending notifications and stop the flush loop."""
+        if self._runner is None:
+            return
+        await self._queue.join()
+        self._runner.cancel()
+        try:
+            await self._runner
+        except asyncio.CancelledError:
+            pass
+        self._runner = None
+
+    async def add(self, notification: Dict[str, Any]) -> bool:
+        """
+        Queue a notification and wait until it is written.
+
+        Returns:
+            True if the notification was saved to the state store
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((notification, future))
+        return await future
+
+    async def _run(self):
+        while True:
+            batch = [await self._queue.get()]
+            deadline = asyncio.get_running_loop().time() + self.flush_interval
+
+            while len(batch) < self.batch_size:
+                timeout = deadline - asyncio.get_running_loop().time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                saved = await save_notifications([n for n, _ in batch])
+            except Exception as e:
+                logger.error(f"Error saving notification batch: {e}", exc_info=True)
+                saved = False
+
+            for _, future in batch:
+                if not future.done():
+                    future.set_result(saved)
+                self._queue.task_done()
+
+
+notification_batcher = NotificationBatcher()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup and shutdown tasks."""
+    global http_client
+
+    logger.info("Notification service starting up...")
+    logger.info(f"Environment: {os.getenv('ENVIRONMENT', 'development')}")
+    http_client = httpx.AsyncClient(
+        timeout=10.0,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+    )
+    await notification_batcher.start()
+
+    yield
+
+    logger.info("Notification service shutting down...")
+    await notification_batcher.stop()
+    await http_client.aclose()
+    http_client = None
+
+
 app = FastAPI(
     title="Notification Service",
     description="Processes task reminder notifications",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
+# Request latency metrics (exposed on GET /metrics)
+app.add_middleware(MetricsMiddleware)
+
+# Distributed tracing, enabled by OTEL_TRACES_EXPORTER (see todo_observability.tracing)
+configure_tracing("notification-service", app=app)
+
 
 # ================== MODELS ==================
 
@@ -203,31 +350,12 @@ async def send_in_app_notification(reminder: ReminderEvent):
     }
 
     # Persist to Dapr state store for retrieval by the frontend
-    dapr_port = int(os.getenv("DAPR_HTTP_PORT", "3500"))
-    dapr_url = f"http://localhost:{dapr_port}/v1.0/state/postgres-statestore"
-
-    try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(
-                dapr_url,
-                json=[
-                    {
-                        "key": f"notification:{notification['id']}",
-                        "value": notification,
-                        "metadata": {"ttlInSeconds": "604800"},  # 7 days
-                    }
-                ],
-            )
-            if response.status_code == 204:
-                logger.info(
-                    f"In-app notification {notification['id']} saved to state store"
-                )
-            else:
-                logger.warning(
-                    f"Failed to save notification to state store: {response.status_code}"
-                )
-    except Exception as e:
-        logger.warning(f"Dapr state store unavailable, notification logged only: {e}")
+    if await notification_batcher.add(notification):
+        logger.info(f"In-app notification {notification['id']} saved to state store")
+    else:
+        logger.warning(
+            f"Dapr state store unavailable, notification {notification['id']} logged only"
+        )
 
     logger.info(
         f"In-app notification created for reminder {reminder.reminder_id}: "
@@ -235,9 +363,168 @@ async def send_in_app_notification(reminder: ReminderEvent):
     )
 
 
+async def save_notifications(notifications: List[Dict[str, Any]]) -> bool:
+    """
+    Save a batch of in-app notifications and update per-user indexes.
+
+    Reads every affected user index with one bulk get, then writes the
+    notifications and the updated indexes with one state POST. Index writes
+    use first-write concurrency on the etag; on a conflict (another replica
+    updated the same index) the whole batch is retried - notification keys
+    are idempotent, so rewriting them is harmless.
+
+    Args:
+        notifications: Notifications to save
+
+    Returns:
+        True if the batch was saved
+    """
+    by_user: Dict[str, List[Dict[str, Any]]] = {}
+    for notification in notifications:
+        by_user.setdefault(notification["user_id"], []).append(notification)
+
+    for attempt in range(1, STATE_WRITE_RETRIES + 1):
+        indexes = await get_user_indexes(list(by_user))
+
+        items = [
+            {
+                "key": f"notification:{n['id']}",
+                "value": n,
+                "metadata": {"ttlInSeconds": NOTIFICATION_TTL_SECONDS},
+            }
+            for n in notifications
+        ]
+
+        for user_id, user_notifications in by_user.items():
+            entries, etag = indexes.get(user_id, ([], None))
+            entries = (list(reversed(user_notifications)) + entries)[:USER_INDEX_MAX_ENTRIES]
+            item = {
+                "key": user_index_key(user_id),
+                "value": entries,
+                "metadata": {"ttlInSeconds": NOTIFICATION_TTL_SECONDS},
+                "options": {"concurrency": "first-write"},
+            }
+            if etag:
+                item["etag"] = etag
+            items.append(item)
+
+        try:
+            response = await http_client.post(DAPR_STATE_URL, json=items)
+        except httpx.HTTPError as e:
+            logger.warning(f"Dapr state store unavailable: {e}")
+            return False
+
+        if response.status_code == 204:
+            logger.debug(
+                f"Saved {len(notifications)} notifications for {len(by_user)} users"
+            )
+            return True
+
+        logger.warning(
+            f"Notification batch write failed (attempt {attempt}): "
+            f"{response.status_code} {response.text}"
+        )
+
+    return False
+
+
+async def get_user_indexes(
+    user_ids: List[str],
+) -> Dict[str, Tuple[List[Dict[str, Any]], Optional[str]]]:
+    """
+    Read notification indexes of many users with one bulk get.
+
+    Args:
+        user_ids: User IDs
+
+    Returns:
+        (entries, etag) per user that has an index
+    """
+    response = await http_client.post(
+        f"{DAPR_STATE_URL}/bulk",
+        json={"keys": [user_index_key(user_id) for user_id in user_ids]},
+    )
+    response.raise_for_status()
+
+    prefix = user_index_key("")
+    indexes = {}
+    for item in response.json():
+        data = item.get("data")
+        if data:
+            indexes[item["key"][len(prefix):]] = (data, item.get("etag"))
+    return indexes
+
+
+# ================== NOTIFICATION QUERY ENDPOINTS ==================
+
+
+async def verify_user_access(
+    user_id: str,
+    dapr_api_token: Optional[str] = Header(None, alias="dapr-api-token"),
+    authorization: Optional[str] = Header(None),
+) -> None:
+    """
+    Allow the user themselves (Bearer JWT) or a service calling through Dapr.
+
+    Raises:
+        HTTPException: 401 without valid credentials, 403 for another user's
+                       notifications
+    """
+    if APP_API_TOKEN and dapr_api_token and hmac.compare_digest(
+        dapr_api_token.encode(), APP_API_TOKEN.encode()
+    ):
+        return
+
+    scheme, _, token = (authorization or "").partition(" ")
+    if JWT_SECRET and scheme.lower() == "bearer" and token:
+        try:
+            payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+        except JWTError:
+            raise HTTPException(status_code=401, detail="Invalid token")
+        if (payload.get("sub") or payload.get("user_id")) != user_id:
+            raise HTTPException(
+                status_code=403, detail="Not authorized to read these notifications"
+            )
+        return
+
+    raise HTTPException(
+        status_code=401,
+        detail="Not authenticated",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+@app.get(
+    "/api/notifications/{user_id}",
+    dependencies=[Depends(verify_user_access)],
+)
+async def get_user_notifications(user_id: str):
+    """
+    Get a user's recent in-app notifications from their index (one read).
+
+    Args:
+        user_id: User ID (must match the caller's token, see verify_user_access)
+    """
+    try:
+        response = await http_client.get(f"{DAPR_STATE_URL}/{user_index_key(user_id)}")
+    except httpx.HTTPError as e:
+        raise HTTPException(status_code=503, detail=f"State store unavailable: {e}")
+
+    entries = response.json() if response.status_code == 200 and response.text else []
+    entries = [entry for entry in entries if entry.get("user_id") == user_id]
+
+    return {"user_id": user_id, "notifications": entries}
+
+
 # ================== HEALTH ENDPOINTS ==================
 
 
+@app.get("/metrics", include_in_schema=False)
+async def prometheus_metrics():
+    """Prometheus metrics endpoint."""
+    return metrics_response()
+
+
 @app.get("/health")
 async def health():
     """Health check endpoint for Kubernetes liveness probe."""
@@ -276,22 +563,6 @@ async def job_trigger(request: Request):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-# ================== STARTUP/SHUTDOWN ==================
-
-
-@app.on_event("startup")
-async def startup_event():
-    """Application startup tasks."""
-    logger.info("Notification service starting up...")
-    logger.info(f"Environment: {os.getenv('ENVIRONMENT', 'development')}")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Application shutdown tasks."""
-    logger.info("Notification service shutting down...")
-
-
 if __name__ == "__main__":
     import uvicorn
 
@@ -16,6 +16,8 @@ from typing import Any, Dict, Optional
 import httpx
 from fastapi import FastAPI, HTTPException, Request, Response
 from pydantic import BaseModel
+from todo_observability.metrics import MetricsMiddleware, metrics_response
+from todo_observability.tracing import configure_tracing
 
 # Configure logging
 logging.basicConfig(
@@ -30,6 +32,12 @@ app = FastAPI(
     version="2.0.0",
 )
 
+# Request latency metrics (exposed on GET /metrics)
+app.add_middleware(MetricsMiddleware)
+
+# Distributed tracing, enabled by OTEL_TRACES_EXPORTER (see todo_observability.tracing)
+configure_tracing("notification-service", app=app)
+
 # Dapr configuration
 DAPR_HTTP_PORT = int(os.getenv("DAPR_HTTP_PORT", 3500))
 DAPR_STATE_STORE = "postgres-statestore"
@@ -371,25 +379,25 @@ async def check_reminders_job(request: Request):
     Dapr cron job callback endpoint.
 
     Triggered by Dapr cron binding (reminder-checker-cron) every minute.
-    Checks for due reminders that need to be sent.
+    Has the backend claim and publish due reminders (process_due_reminders);
+    the notifications come back through the reminders topic.
     """
     try:
         body = await request.json()
         logger.info(f"Check reminders job triggered: {body}")
 
-        # Query due reminders via Dapr service invocation to the backend
-        dapr_port = int(os.getenv("DAPR_HTTP_PORT", "3500"))
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            try:
-                resp = await client.get(
-                    f"http://localhost:{dapr_port}/v1.0/invoke/todo-backend/method/api/reminders/check-due"
-                )
-                if resp.status_code == 200:
-                    logger.info(f"Reminder check returned: {resp.json()}")
-                else:
-                    logger.warning(f"Reminder check returned status {resp.status_code}")
-            except Exception as invoke_err:
-                logger.warning(f"Could not invoke backend for reminder check: {invoke_err}")
+        # Process due reminders via Dapr service invocation to the backend
+        try:
+            resp = await dapr_client.post(
+                f"http://localhost:{DAPR_HTTP_PORT}/v1.0/invoke/todo-backend/method/api/reminders/process-due",
+                timeout=30.0,
+            )
+            if resp.status_code == 200:
+                logger.info(f"Reminder check sent {resp.json().get('sent', 0)} reminders")
+            else:
+                logger.warning(f"Reminder check returned status {resp.status_code}")
+        except Exception as invoke_err:
+            logger.warning(f"Could not invoke backend for reminder check: {invoke_err}")
 
         logger.info("Reminder check job completed")
         return {"status": "success"}
@@ -402,6 +410,12 @@ async def check_reminders_job(request: Request):
 # ================== HEALTH ENDPOINTS ==================
 
 
+@app.get("/metrics", include_in_schema=False)
+async def prometheus_metrics():
+    """Prometheus metrics endpoint."""
+    return metrics_response()
+
+
 @app.get("/health")
 async def health():
     """Health check endpoint for Kubernetes liveness probe."""
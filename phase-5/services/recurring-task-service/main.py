@@ -16,6 +16,8 @@ import asyncpg
 from croniter import croniter
 from fastapi import FastAPI, HTTPException, Request
 from pydantic import BaseModel
+from todo_observability.metrics import MetricsMiddleware, metrics_response
+from todo_observability.tracing import configure_tracing
 
 # Configure logging
 logging.basicConfig(
@@ -30,6 +32,12 @@ app = FastAPI(
     version="1.0.0",
 )
 
+# Request latency metrics (exposed on GET /metrics)
+app.add_middleware(MetricsMiddleware)
+
+# Distributed tracing, enabled by OTEL_TRACES_EXPORTER (see todo_observability.tracing)
+configure_tracing("recurring-task-service", app=app)
+
 # Database connection pool
 db_pool: Optional[asyncpg.Pool] = None
 
@@ -348,6 +356,12 @@ async def handle_task_event(request: Request):
 # ================== HEALTH ENDPOINTS ==================
 
 
+@app.get("/metrics", include_in_schema=False)
+async def prometheus_metrics():
+    """Prometheus metrics endpoint."""
+    return metrics_response()
+
+
 @app.get("/health")
 async def health():
     """Health check endpoint for Kubernetes liveness probe."""
@@ -8,14 +8,18 @@ Microservice for processing recurring task events with Dapr integration:
 - Stores processing state in Dapr state store
 """
 
+import asyncio
 import logging
 import os
-from datetime import datetime
-from typing import Any, Dict, Optional
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
 
 import httpx
 from fastapi import FastAPI, HTTPException, Request
 from pydantic import BaseModel
+from todo_observability.metrics import MetricsMiddleware, metrics_response
+from todo_observability.tracing import configure_tracing
 
 # Configure logging
 logging.basicConfig(
@@ -30,12 +34,25 @@ app = FastAPI(
     version="2.0.0",
 )
 
+# Request latency metrics (exposed on GET /metrics)
+app.add_middleware(MetricsMiddleware)
+
+# Distributed tracing, enabled by OTEL_TRACES_EXPORTER (see todo_observability.tracing)
+configure_tracing("recurring-task-service", app=app)
+
 # Dapr configuration
 DAPR_HTTP_PORT = int(os.getenv("DAPR_HTTP_PORT", 3500))
 DAPR_STATE_STORE = "postgres-statestore"
 DAPR_PUBSUB = "kafka-pubsub"
 BACKEND_APP_ID = "todo-backend"
 
+# Recurring cron job tuning
+RECURRING_PAGE_SIZE = int(os.getenv("RECURRING_PAGE_SIZE", 500))
+RECURRING_SPAWN_BATCH_SIZE = int(os.getenv("RECURRING_SPAWN_BATCH_SIZE", 100))
+RECURRING_SPAWN_CONCURRENCY = int(os.getenv("RECURRING_SPAWN_CONCURRENCY", 4))
+RECURRING_CHECKPOINT_KEY = "recurring-job:checkpoint"
+RECURRING_CHECKPOINT_TTL_SECONDS = 3600
+
 # HTTP client for Dapr API
 dapr_client = httpx.AsyncClient(timeout=30.0)
 
@@ -73,6 +90,19 @@ class ProcessingState(BaseModel):
     error_message: Optional[str] = None
 
 
+class JobCheckpoint(BaseModel):
+    """Progress of the recurring cron job, used to resume an interrupted run"""
+
+    run_id: str
+    cursor: Optional[str] = None
+    status: str  # running, completed
+    processed_count: int = 0
+    spawned_count: int = 0
+    failed_count: int = 0
+    started_at: str
+    updated_at: str
+
+
 # ================== DAPR STATE MANAGEMENT ==================
 
 
@@ -131,6 +161,59 @@ async def save_processing_state(state: ProcessingState) -> bool:
         return False
 
 
+async def get_job_checkpoint() -> Optional[JobCheckpoint]:
+    """
+    Get the recurring job checkpoint from Dapr state store.
+
+    Returns:
+        Checkpoint or None
+    """
+    try:
+        response = await dapr_client.get(
+            f"http://localhost:{DAPR_HTTP_PORT}/v1.0/state/{DAPR_STATE_STORE}/{RECURRING_CHECKPOINT_KEY}"
+        )
+
+        if response.status_code == 200 and response.text:
+            return JobCheckpoint(**response.json())
+        else:
+            return None
+
+    except Exception as e:
+        logger.error(f"Error getting job checkpoint: {e}")
+        return None
+
+
+async def save_job_checkpoint(checkpoint: JobCheckpoint) -> bool:
+    """
+    Save the recurring job checkpoint to Dapr state store.
+
+    Args:
+        checkpoint: Job checkpoint
+
+    Returns:
+        True if save succeeded
+    """
+    checkpoint.updated_at = datetime.utcnow().isoformat()
+
+    try:
+        response = await dapr_client.post(
+            f"http://localhost:{DAPR_HTTP_PORT}/v1.0/state/{DAPR_STATE_STORE}",
+            json=[
+                {
+                    "key": RECURRING_CHECKPOINT_KEY,
+                    "value": checkpoint.model_dump(),
+                    "metadata": {"ttlInSeconds": str(RECURRING_CHECKPOINT_TTL_SECONDS)},
+                }
+            ],
+        )
+
+        return response.status_code == 204
+
+    except Exception as e:
+        logger.error(f"Error saving job checkpoint: {e}")
+        return False
+
+
 async def invoke_backend(
     method: str,
     data: Dict[str, Any],
@@ -360,47 +443,120 @@ async def task_created_webhook(request: Request):
 # ================== CRON BINDING ENDPOINTS ==================
 
 
+async def spawn_batch(task_ids: List[str], semaphore: asyncio.Semaphore) -> Dict[str, int]:
+    """
+    Spawn next instances for a batch of due series via the backend.
+
+    Args:
+        task_ids: Recurring task IDs
+        semaphore: Limits concurrent backend calls
+
+    Returns:
+        Spawned and failed counts for the batch
+    """
+    async with semaphore:
+        result = await invoke_backend(
+            method="api/recurring/spawn-batch",
+            data={"task_ids": task_ids},
+            http_verb="POST",
+        )
+
+    if result is None:
+        logger.warning(f"Spawn batch of {len(task_ids)} recurring tasks failed")
+        return {"spawned": 0, "failed": len(task_ids)}
+
+    return {"spawned": len(result.get("spawned", [])), "failed": 0}
+
+
 @app.post("/api/jobs/process-recurring")
 async def process_recurring_job(request: Request):
     """
     Dapr cron job callback endpoint.
 
     Triggered by Dapr cron binding (recurring-task-cron) every hour.
-    Checks for recurring tasks that need new instances spawned.
+    Pages through due recurring series and spawns their next instances in
+    batches, with at most RECURRING_SPAWN_CONCURRENCY batches in flight.
+
+    Progress is checkpointed in the state store after every page, so a run
+    that is interrupted (pod restart, timeout) resumes from its cursor on
+    the next trigger instead of starting over. Spawning is idempotent on the
+    backend, so re-processing a page after a crash is harmless.
     """
     try:
         body = await request.json()
         logger.info(f"Process recurring job triggered: {body}")
 
-        # Query backend for due recurring tasks
-        due_tasks = await invoke_backend(
-            method="api/recurring/due",
-            data={},
-            http_verb="GET",
-        )
+        now = datetime.utcnow()
+        checkpoint = await get_job_checkpoint()
 
-        if due_tasks:
-            logger.info(f"Found {len(due_tasks)} due recurring tasks")
+        resumable = (
+            checkpoint is not None
+            and checkpoint.status == "running"
+            and now - datetime.fromisoformat(checkpoint.updated_at)
+            < timedelta(seconds=RECURRING_CHECKPOINT_TTL_SECONDS)
+        )
+        if resumable:
+            logger.info(
+                f"Resuming recurring job {checkpoint.run_id} after cursor {checkpoint.cursor}"
+            )
+        else:
+            checkpoint = JobCheckpoint(
+                run_id=str(uuid.uuid4()),
+                status="running",
+                started_at=now.isoformat(),
+                updated_at=now.isoformat(),
+            )
+
+        semaphore = asyncio.Semaphore(RECURRING_SPAWN_CONCURRENCY)
+
+        while True:
+            params = {"limit": RECURRING_PAGE_SIZE}
+            if checkpoint.cursor:
+                params["after"] = checkpoint.cursor
+
+            page = await invoke_backend(
+                method="api/recurring/due",
+                data=params,
+                http_verb="GET",
+            )
+            if page is None:
+                # Leave the checkpoint in place so the next trigger resumes
+                raise RuntimeError("Failed to fetch due recurring tasks")
+
+            task_ids = [item["task_id"] for item in page.get("items", [])]
+            if task_ids:
+                results = await asyncio.gather(
+                    *(
+                        spawn_batch(task_ids[i:i + RECURRING_SPAWN_BATCH_SIZE], semaphore)
+                        for i in range(0, len(task_ids), RECURRING_SPAWN_BATCH_SIZE)
+                    )
+                )
 
-            # Process each due task
-            for task in due_tasks:
-                task_id = task.get("task_id")
-                user_id = task.get("user_id")
+                checkpoint.processed_count += len(task_ids)
+                checkpoint.spawned_count += sum(r["spawned"] for r in results)
+                checkpoint.failed_count += sum(r["failed"] for r in results)
 
-                logger.info(f"Processing due recurring task: {task_id}")
+            checkpoint.cursor = page.get("next_cursor")
+            if not checkpoint.cursor:
+                break
 
-                # Spawn next instance
-                new_task = await invoke_backend(
-                    method=f"api/recurring/{task_id}/spawn",
-                    data={"user_id": user_id},
-                    http_verb="POST",
-                )
+            await save_job_checkpoint(checkpoint)
 
-                if new_task:
-                    logger.info(f"Spawned task {new_task.get('id')} from recurring task {task_id}")
+        checkpoint.status = "completed"
+        await save_job_checkpoint(checkpoint)
 
-        logger.info("Recurring task processing job completed")
-        return {"status": "success", "processed_count": len(due_tasks) if due_tasks else 0}
+        logger.info(
+            f"Recurring task processing job completed: "
+            f"{checkpoint.spawned_count} spawned, {checkpoint.failed_count} failed "
+            f"out of {checkpoint.processed_count} due"
+        )
+        return {
+            "status": "success",
+            "run_id": checkpoint.run_id,
+            "processed_count": checkpoint.processed_count,
+            "spawned_count": checkpoint.spawned_count,
+            "failed_count": checkpoint.failed_count,
+        }
 
     except Exception as e:
         logger.error(f"Job execution error: {e}", exc_info=True)
@@ -410,6 +566,12 @@ async def process_recurring_job(request: Request):
 # ================== HEALTH ENDPOINTS ==================
 
 
+@app.get("/metrics", include_in_schema=False)
+async def prometheus_metrics():
+    """Prometheus metrics endpoint."""
+    return metrics_response()
+
+
 @app.get("/health")
 async def health():
     """Health check endpoint for Kubernetes liveness probe."""
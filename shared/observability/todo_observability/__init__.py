@@ -0,0 +1,6 @@
+"""
+Observability helpers shared by the Todo backends and microservices.
+
+- metrics: Prometheus metrics, request latency middleware and /metrics
+- tracing: OpenTelemetry setup and trace context propagation
+"""
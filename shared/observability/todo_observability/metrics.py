@@ -0,0 +1,181 @@
+"""
+Prometheus Metrics
+
+Instrumentation shared by the backend and the phase-5 microservices, so
+metric names and labels match across dashboards.
+
+- MetricsMiddleware: request latency per route template
+- metrics_response(): Prometheus text exposition for GET /metrics
+- Metric objects recorded by the code that owns them:
+  DB pool (src/db/session.py), queries per request (src/db/query_stats.py),
+  event publishing (DaprEventPublisher), LLM calls (AgentService),
+  consumer lag (KafkaEventConsumer)
+
+Set PROMETHEUS_MULTIPROC_DIR when running several worker processes
+(e.g. gunicorn) so /metrics aggregates all of them.
+
+Usage:
+    from todo_observability.metrics import MetricsMiddleware, metrics_response
+
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        return metrics_response()
+"""
+
+import os
+import time
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Label for requests that matched no route (keeps 404 scans from creating
+# one series per URL)
+UNMATCHED_ROUTE = "<unmatched>"
+
+# ================== HTTP ==================
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+)
+
+# ================== DATABASE POOL ==================
+
+DB_POOL_CHECKOUT_DURATION = Histogram(
+    "db_pool_checkout_duration_seconds",
+    "Time to check out a pooled connection (queue wait, connect, pre-ping)",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+DB_POOL_CONNECTIONS_IN_USE = Gauge(
+    "db_pool_connections_in_use",
+    "Pooled connections currently checked out",
+    multiprocess_mode="livesum",
+)
+
+# ================== DATABASE QUERIES ==================
+
+DB_QUERIES_PER_REQUEST = Histogram(
+    "db_queries_per_request",
+    "SQL queries per request by route template",
+    ["route"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89),
+)
+DB_TIME_PER_REQUEST = Histogram(
+    "db_query_time_per_request_seconds",
+    "Time spent executing SQL per request by route template",
+    ["route"],
+)
+DB_SLOW_QUERIES = Counter(
+    "db_slow_queries_total",
+    "Queries slower than the slow query threshold",
+)
+DB_QUERY_BUDGET_EXCEEDED = Counter(
+    "db_query_budget_exceeded_total",
+    "Requests that ran more queries than their route's budget",
+    ["route"],
+)
+
+# ================== EVENTS ==================
+
+EVENT_PUBLISH_DURATION = Histogram(
+    "event_publish_duration_seconds",
+    "Latency of publishing events via Dapr pub/sub",
+    ["topic"],
+)
+EVENT_PUBLISH_FAILURES = Counter(
+    "event_publish_failures_total",
+    "Events that could not be published",
+    ["topic"],
+)
+KAFKA_CONSUMER_LAG = Gauge(
+    "kafka_consumer_lag",
+    "Messages behind the partition high watermark",
+    ["group", "topic", "partition"],
+    multiprocess_mode="livemax",
+)
+
+# ================== LLM ==================
+
+LLM_REQUEST_DURATION = Histogram(
+    "llm_request_duration_seconds",
+    "Agent run latency per model (including tool calls)",
+    ["model", "outcome"],
+    buckets=(0.25, 0.5, 1, 2, 5, 10, 20, 30, 60, 120),
+)
+
+
+def record_event_publish(topic: str, started: float, success: bool) -> None:
+    """
+    Record one publish attempt.
+
+    Args:
+        topic: Kafka topic name
+        started: time.perf_counter() value taken before publishing
+        success: Whether the event was published
+    """
+    EVENT_PUBLISH_DURATION.labels(topic).observe(time.perf_counter() - started)
+    if not success:
+        EVENT_PUBLISH_FAILURES.labels(topic).inc()
+
+
+def route_template(scope: Scope) -> str:
+    """Route template of a routed request, e.g. /api/tasks/{task_id}."""
+    return getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+
+
+def metrics_response() -> Response:
+    """Current metrics in the Prometheus text format."""
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
+
+
+class MetricsMiddleware:
+    """
+    Middleware recording request latency per route template.
+
+    Pure ASGI, so response bodies pass through unbuffered. The route
+    template (e.g. /api/tasks/{task_id}) is read from the scope after
+    routing, so path parameters do not create new series. Latency is
+    measured until the response body has been sent.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUEST_DURATION.labels(
+                scope["method"], route_template(scope), str(status_code)
+            ).observe(time.perf_counter() - started)
@@ -0,0 +1,225 @@
+"""
+Distributed Tracing (OpenTelemetry)
+
+Tracing shared by the backend and the phase-5 microservices.
+
+- configure_tracing(): exporter setup plus spans for FastAPI requests and
+  httpx calls (Dapr sidecar, LLM API)
+- trace_engine(): spans for the queries of a SQLAlchemy engine, called
+  where the engine is created
+- kafka_headers() / consumer_span(): W3C trace context through Kafka
+  record headers for the direct aiokafka producers and consumers
+
+Calls to the Dapr sidecar (pub/sub, service invocation) carry W3C
+traceparent headers from the httpx instrumentation. Dapr stores the
+publisher's traceparent in the CloudEvent and sends it again when it
+delivers the event to a subscriber, so one chat turn is one trace from
+the backend route through the subscribing services.
+
+Exporter (OTEL_TRACES_EXPORTER):
+- none (default): tracing disabled, no instrumentation installed
+- otlp: OTLP/HTTP to a collector (OTEL_EXPORTER_OTLP_ENDPOINT,
+  default http://localhost:4318)
+- file: one JSON span per line to OTEL_TRACES_FILE (works offline)
+- console: spans printed to stdout
+
+Sampling follows the standard OTEL_TRACES_SAMPLER variables.
+
+Usage:
+    from todo_observability.tracing import configure_tracing, consumer_span, trace_engine
+
+    configure_tracing("todo-backend", app=app)
+    trace_engine(engine)  # in the engine factory
+
+    with consumer_span("task-events process", message.headers):
+        await handle(message.value)
+"""
+
+import logging
+import os
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from opentelemetry import context as otel_context
+from opentelemetry import propagate, trace
+from opentelemetry.propagators.textmap import Getter
+
+logger = logging.getLogger(__name__)
+
+TRACES_EXPORTER = os.getenv("OTEL_TRACES_EXPORTER", "none").lower()
+TRACES_FILE = os.getenv("OTEL_TRACES_FILE", "traces.jsonl")
+
+# Paths without request spans (probes and scrapes; matched as regexes)
+EXCLUDED_URLS = "health,metrics"
+
+tracer = trace.get_tracer("todo")
+
+_configured = False
+
+
+def tracing_enabled() -> bool:
+    """Whether an exporter is configured (OTEL_TRACES_EXPORTER is not 'none')."""
+    return TRACES_EXPORTER not in ("", "none")
+
+
+def configure_tracing(
+    service_name: str,
+    app: Any = None,
+    engines: Sequence[Any] = (),
+) -> bool:
+    """
+    Install the tracer provider and instrumentation (no-op when disabled).
+
+    Instrumentation is process-wide, so call this once per process. Engines
+    created later are traced by trace_engine() where they are created.
+
+    Args:
+        service_name: service.name resource attribute (OTEL_SERVICE_NAME wins)
+        app: FastAPI application to trace requests of
+        engines: Already created SQLAlchemy engines to trace queries of
+
+    Returns:
+        True if tracing is enabled
+    """
+    global _configured
+    if not tracing_enabled():
+        return False
+    if _configured:
+        logger.warning("Tracing already configured, ignoring configure_tracing() call")
+        return True
+
+    from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": os.getenv("OTEL_SERVICE_NAME", service_name)})
+    )
+    provider.add_span_processor(BatchSpanProcessor(_create_exporter()))
+    trace.set_tracer_provider(provider)
+    HTTPXClientInstrumentor().instrument()
+
+    if app is not None:
+        from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+
+        # One span per request, without the per-message ASGI send/receive spans
+        FastAPIInstrumentor.instrument_app(
+            app, excluded_urls=EXCLUDED_URLS, exclude_spans=["receive", "send"]
+        )
+
+    for engine in engines:
+        trace_engine(engine)
+
+    _configured = True
+    logger.info(f"Tracing enabled ({TRACES_EXPORTER} exporter)")
+    return True
+
+
+def trace_engine(engine: Any) -> None:
+    """
+    Trace the queries of a SQLAlchemy engine (no-op when tracing is disabled).
+
+    Call it from the engine factory, so engines are only created when first
+    used. Spans go through the global tracer provider, which may be set up
+    by configure_tracing() before or after the engine is created.
+
+    Args:
+        engine: SQLAlchemy engine
+    """
+    if not tracing_enabled():
+        return
+
+    # SQLAlchemyInstrumentor only takes engines on its first instrument()
+    # call; EngineTracer is what it attaches to each of them
+    from opentelemetry.instrumentation.sqlalchemy.engine import EngineTracer
+
+    EngineTracer(tracer, engine, _connections_usage())
+
+
+@lru_cache(maxsize=None)
+def _connections_usage():
+    """Pool usage counter EngineTracer updates (db.client.connections.usage)."""
+    from opentelemetry import metrics as otel_metrics
+
+    return otel_metrics.get_meter("todo").create_up_down_counter(
+        name="db.client.connections.usage",
+        unit="connections",
+        description="Connections currently in the state given by the state attribute",
+    )
+
+
+def _create_exporter():
+    """Span exporter selected by OTEL_TRACES_EXPORTER."""
+    if TRACES_EXPORTER == "otlp":
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+            OTLPSpanExporter,
+        )
+
+        return OTLPSpanExporter()
+
+    from opentelemetry.sdk.trace.export import ConsoleSpanExporter
+
+    if TRACES_EXPORTER == "file":
+        return ConsoleSpanExporter(
+            out=open(TRACES_FILE, "a", encoding="utf-8"),
+            formatter=lambda span: span.to_json(indent=None) + "\n",
+        )
+    if TRACES_EXPORTER == "console":
+        return ConsoleSpanExporter()
+    raise ValueError(f"Unsupported OTEL_TRACES_EXPORTER: {TRACES_EXPORTER}")
+
+
+# ================== PROPAGATION ==================
+
+
+def kafka_headers() -> List[Tuple[str, bytes]]:
+    """Current trace context (traceparent, tracestate) as Kafka record headers."""
+    headers: Dict[str, str] = {}
+    propagate.inject(headers)
+    return [(key, value.encode("utf-8")) for key, value in headers.items()]
+
+
+class _KafkaHeadersGetter(Getter):
+    """Reads trace context from Kafka record headers ((key, bytes) pairs)."""
+
+    def get(self, carrier, key):
+        values = [value.decode("utf-8") for name, value in carrier if name == key]
+        return values or None
+
+    def keys(self, carrier):
+        return [name for name, _ in carrier]
+
+
+_kafka_getter = _KafkaHeadersGetter()
+
+
+@contextmanager
+def consumer_span(
+    name: str,
+    carrier: Any = None,
+    attributes: Optional[Dict[str, Any]] = None,
+) -> Iterator[trace.Span]:
+    """
+    Span for processing one consumed message, continuing the producer's trace.
+
+    Without trace context in the carrier, the span is a child of the
+    current span (e.g. the request delivering the message).
+
+    Args:
+        name: Span name, e.g. "task-events process"
+        carrier: Kafka record headers, or a dict with traceparent/tracestate
+            (HTTP headers or a CloudEvent)
+        attributes: Span attributes
+    """
+    current = otel_context.get_current()
+    if isinstance(carrier, (list, tuple)):
+        parent = propagate.extract(carrier, context=current, getter=_kafka_getter)
+    else:
+        parent = propagate.extract(carrier or {}, context=current)
+
+    with tracer.start_as_current_span(
+        name, context=parent, kind=trace.SpanKind.CONSUMER, attributes=attributes
+    ) as span:
+        yield span